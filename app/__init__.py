@@ -5,11 +5,28 @@ from flask import Flask
 from flask_jwt_extended import JWTManager
 from flask_migrate import Migrate
 from flask_admin import Admin
+from app.application.admin import (
+    InfractionAdminView,
+    OfficerAdminView,
+    PersonAdminView,
+    VehicleAdminView,
+)
 from app.domain.infractions.models import Infraction
 from app.domain.users.models import Officer, Person
+from app.domain.users.services.token_service import is_token_revoked
 from app.domain.vehicles.models import Vehicle
-from app.extensions import db
-from flask_admin.contrib.sqla import ModelView
+from app.config import Config, config_by_name
+from app.extensions import (
+    db,
+    job_runner,
+    log_policy,
+    metrics,
+    profiler,
+    rate_limiter,
+    tracer,
+    warmup,
+)
+from app.infrastructure.database import REPLICA_BIND, include_object
 from app.infrastructure.logger import app_logger
 
 
@@ -22,21 +39,39 @@ def get_config():
     }
 
 
-def create_app():
+def create_app(config_name=None):
     app = Flask(__name__)
-    app.config.update(get_config())
+    app.config.from_object(config_by_name.get(config_name, Config))
+    if config_name is None:
+        app.config.update(get_config())
 
     db.init_app(app)
+    rate_limiter.init_app(app)
+    metrics.init_app(app)
+    if app.config["METRICS_ENABLED"]:
+        metrics.instrument_engine(db.get_engine(app))
+        if REPLICA_BIND in (app.config.get("SQLALCHEMY_BINDS") or {}):
+            metrics.instrument_engine(db.get_engine(app, bind=REPLICA_BIND))
+    profiler.init_app(app)
+    tracer.init_app(app)
+    if app.config["TRACING_ENABLED"]:
+        tracer.instrument_engine(db.get_engine(app))
+        if REPLICA_BIND in (app.config.get("SQLALCHEMY_BINDS") or {}):
+            tracer.instrument_engine(db.get_engine(app, bind=REPLICA_BIND))
+    job_runner.init_app(app)
+    warmup.init_app(app)
 
-    migrate = Migrate(app, db)
+    migrate = Migrate(app, db, include_object=include_object)
     jwt = JWTManager(app)
+    jwt.token_in_blocklist_loader(lambda header, payload: is_token_revoked(payload))
 
     app.logger.handlers = app_logger.handlers
     app.logger.setLevel(app_logger.level)
+    log_policy.init_app(app)
 
     admin = Admin(app, name="Mi Panel de Administración", template_mode="bootstrap3")
-    admin.add_view(ModelView(Officer, db.session, category="Usuarios"))
-    admin.add_view(ModelView(Person, db.session, category="Usuarios"))
-    admin.add_view(ModelView(Infraction, db.session, category="Infracciones"))
-    admin.add_view(ModelView(Vehicle, db.session, category="Vehículos"))
+    admin.add_view(OfficerAdminView(Officer, db.session, category="Usuarios"))
+    admin.add_view(PersonAdminView(Person, db.session, category="Usuarios"))
+    admin.add_view(InfractionAdminView(Infraction, db.session, category="Infracciones"))
+    admin.add_view(VehicleAdminView(Vehicle, db.session, category="Vehículos"))
     return app
@@ -0,0 +1,36 @@
+# app/application/admin.py
+from app.infrastructure.admin import ScalableModelView
+
+
+class OfficerAdminView(ScalableModelView):
+    column_list = ("id", "name", "unique_identifier")
+    column_exclude_list = ("password_hash",)
+    form_excluded_columns = ("password_hash", "infractions")
+
+
+class PersonAdminView(ScalableModelView):
+    column_list = ("id", "name", "email")
+    form_excluded_columns = ("vehicles",)
+
+
+class VehicleAdminView(ScalableModelView):
+    column_list = ("id", "license_plate", "make", "model", "color", "owner.name")
+    column_select_related_list = ("owner",)
+    form_excluded_columns = ("infractions", "plate_normalized")
+    form_ajax_refs = {"owner": {"fields": ("email", "name"), "page_size": 10}}
+
+
+class InfractionAdminView(ScalableModelView):
+    column_list = (
+        "id",
+        "timestamp",
+        "license_plate",
+        "vehicle.make",
+        "vehicle.model",
+        "officer.name",
+    )
+    column_select_related_list = ("vehicle", "officer")
+    form_ajax_refs = {
+        "vehicle": {"fields": ("license_plate",), "page_size": 10},
+        "officer": {"fields": ("unique_identifier", "name"), "page_size": 10},
+    }
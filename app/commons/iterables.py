@@ -0,0 +1,18 @@
+from typing import Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+# Keeps IN (...) lists well below the bound-parameter limits of every backend.
+IN_CLAUSE_CHUNK_SIZE = 500
+
+
+def chunked(items: Iterable[T], size: int = IN_CLAUSE_CHUNK_SIZE) -> Iterator[List[T]]:
+    """Yield consecutive lists of at most ``size`` items."""
+    chunk: List[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
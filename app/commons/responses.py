@@ -2,11 +2,14 @@ from typing import Any, Dict, Optional, Tuple
 
 from flask import Response, jsonify
 
+from app.infrastructure.tracing import span
+
 
 def handle_api_response(
     data: Optional[Dict[str, Any]] = None,
     error: Optional[Dict[str, Any]] = None,
     status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
 ) -> Response:
     """Utility function to handle API responses.
 
@@ -14,10 +17,13 @@ def handle_api_response(
         data (Optional[Dict[str, Any]]): Data to be included in the response, defaults to None.
         error (Optional[Dict[str, Any]]): Error message to be included in the response, defaults to None.
         status_code (int): HTTP status code for the response, defaults to 200.
+        headers (Optional[Dict[str, str]]): Extra response headers, defaults to None.
 
     Returns:
         Response: A Flask response object with the specified data, error message, and status code.
     """
-    if error:
-        return jsonify({"error": error}), status_code
-    return jsonify(data), status_code
+    with span("serialize"):
+        body = jsonify({"error": error}) if error else jsonify(data)
+    if headers:
+        return body, status_code, headers
+    return body, status_code
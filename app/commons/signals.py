@@ -0,0 +1,38 @@
+from blinker import Namespace, Signal
+
+from app.infrastructure.logger import app_logger
+
+# Signals the services send after committing a change that other domains keep
+# derived data of. Receivers get the sending module as sender and ``plates``:
+# the license plates concerned, or None when the writer cannot tell (e.g.
+# bulk deletes), which means "any plate".
+_signals = Namespace()
+
+# Infractions of these plates were created, changed or deleted.
+infractions_changed = _signals.signal("infractions-changed")
+
+# These vehicles changed owner or plate, or were deleted with their
+# infractions.
+vehicles_changed = _signals.signal("vehicles-changed")
+
+# An infraction was recorded; ``infraction`` holds its columns as a dict.
+infraction_created = _signals.signal("infraction-created")
+
+# Unlike the signals above, sent inside the transaction, before it commits: a
+# vehicle now has ``license_plate``, which the database has already cascaded to
+# its infractions. Receivers write through ``connection`` so their changes
+# commit or roll back with the rename.
+vehicle_plate_changed = _signals.signal("vehicle-plate-changed")
+
+
+def notify(signal: Signal, sender, **kwargs) -> None:
+    """
+    Send ``signal`` to every receiver, logging the ones that fail instead of
+    raising: the change is already committed, so its writer must not report it
+    as failed (and invite a retry that would apply it twice).
+    """
+    for receiver in signal.receivers_for(sender):
+        try:
+            receiver(sender, **kwargs)
+        except Exception as e:
+            app_logger.error(f"Receiver {receiver} of {signal.name} failed: {e}")
@@ -1,5 +1,6 @@
 import logging
 import os
+from datetime import timedelta
 
 # Configuración básica de logging para el módulo de configuración
 logging.basicConfig(level=logging.DEBUG)
@@ -10,11 +11,101 @@ class Config:
     SECRET_KEY = os.environ.get("SECRET_KEY", "default_secret_key")
     SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL", "sqlite:///default.db")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Optional read replica used by the service functions marked @use_replica.
+    SQLALCHEMY_REPLICA_URI = os.environ.get("DATABASE_REPLICA_URL")
+    SQLALCHEMY_BINDS = (
+        {"replica": SQLALCHEMY_REPLICA_URI} if SQLALCHEMY_REPLICA_URI else {}
+    )
 
     LOGGING_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     LOGGING_LOCATION = "app.log"
     LOGGING_LEVEL = logging.INFO
 
+    # Access tokens are short-lived and renewed with single-use refresh tokens,
+    # so passwords are only hashed when a session starts.
+    JWT_ACCESS_TOKEN_EXPIRES = timedelta(
+        minutes=int(os.environ.get("JWT_ACCESS_TOKEN_MINUTES", 15))
+    )
+    JWT_REFRESH_TOKEN_EXPIRES = timedelta(
+        days=int(os.environ.get("JWT_REFRESH_TOKEN_DAYS", 30))
+    )
+
+    # Admission control per JWT identity. Budgets default to DEFAULT_BUDGETS in
+    # app/infrastructure/rate_limiter.py and can be overridden per key here.
+    RATE_LIMIT_ENABLED = True
+    RATE_LIMIT_BUDGETS = {}
+
+    # Prometheus metrics. Set METRICS_MULTIPROC_DIR when serving with several
+    # worker processes so /metrics reports the totals of every worker.
+    METRICS_ENABLED = True
+    METRICS_MULTIPROC_DIR = os.environ.get("METRICS_MULTIPROC_DIR")
+    METRICS_FLUSH_INTERVAL = 5.0
+    # Snapshots of workers that exited, or not rewritten for this many seconds,
+    # are deleted instead of merged.
+    METRICS_SNAPSHOT_MAX_AGE = 600.0
+
+    # Request profiling. Off unless a sample rate or a header token is set; a
+    # request sending ``X-Profile: <PROFILER_TOKEN>`` is always profiled.
+    PROFILER_SAMPLE_RATE = float(os.environ.get("PROFILER_SAMPLE_RATE", 0.0))
+    PROFILER_TOKEN = os.environ.get("PROFILER_TOKEN")
+    PROFILER_OUTPUT_DIR = os.environ.get("PROFILER_OUTPUT_DIR", "profiles")
+
+    # Share of the INFO records of each log_event kept (merged over
+    # DEFAULT_SAMPLE_RATES in app/infrastructure/log_policy.py), and INFO records
+    # a request may emit, overall or per endpoint (None for no limit).
+    LOG_SAMPLE_RATES = {}
+    LOG_ROUTE_BUDGET = int(os.environ.get("LOG_ROUTE_BUDGET", 20))
+    LOG_ROUTE_BUDGETS = {}
+
+    # Request tracing: a tree of timed spans (handler, traced services and
+    # adapters, SQL statements) for a share of requests, kept in a ring buffer
+    # served by /debug/traces and appended to TRACING_FILE as JSON lines.
+    TRACING_ENABLED = os.environ.get("TRACING_ENABLED", "0") == "1"
+    TRACING_SAMPLE_RATE = float(os.environ.get("TRACING_SAMPLE_RATE", 1.0))
+    TRACING_BUFFER_SIZE = int(os.environ.get("TRACING_BUFFER_SIZE", 100))
+    TRACING_FILE = os.environ.get("TRACING_FILE")
+
+    # Background jobs (e.g. report builds) run on this many local threads.
+    # Jobs still queued or running after REPORT_JOB_TIMEOUT seconds are
+    # reported as failed, e.g. when the process that owned them restarted.
+    JOB_WORKERS = int(os.environ.get("JOB_WORKERS", 2))
+    REPORT_JOB_TIMEOUT = int(os.environ.get("REPORT_JOB_TIMEOUT", 3600))
+
+    # generate_report reuses a report's infractions until a write to one of the
+    # owner's plates, for at most this many seconds (0 disables the cache):
+    # writes made by other processes are not seen before it expires.
+    REPORT_CACHE_TTL = int(os.environ.get("REPORT_CACHE_TTL", 300))
+
+    # Bulk deletes only set deleted_at when enabled (requests may override it);
+    # `flask purge` removes rows soft-deleted more than the retention ago.
+    SOFT_DELETE_ENABLED = os.environ.get("SOFT_DELETE_ENABLED", "0") == "1"
+    SOFT_DELETE_RETENTION_DAYS = int(os.environ.get("SOFT_DELETE_RETENTION_DAYS", 30))
+
+    # Warm-up run before /health/ready reports the worker ready: pool
+    # connections opened per engine and extra modules imported up front.
+    WARMUP_ENABLED = os.environ.get("WARMUP_ENABLED", "1") == "1"
+    WARMUP_POOL_CONNECTIONS = int(os.environ.get("WARMUP_POOL_CONNECTIONS", 2))
+    WARMUP_IMPORTS = []
+
+    # /infractions/stream: events buffered per client before a slow one is
+    # dropped, concurrent clients per worker, seconds between keep-alives, and
+    # how often and how far back (in ids) the relay polls for infractions
+    # recorded by other workers.
+    SSE_BUFFER_SIZE = int(os.environ.get("SSE_BUFFER_SIZE", 100))
+    SSE_MAX_SUBSCRIBERS = int(os.environ.get("SSE_MAX_SUBSCRIBERS", 500))
+    SSE_HEARTBEAT_SECONDS = float(os.environ.get("SSE_HEARTBEAT_SECONDS", 15))
+    SSE_RELAY_INTERVAL = float(os.environ.get("SSE_RELAY_INTERVAL", 1.0))
+    SSE_RELAY_LOOKBACK = int(os.environ.get("SSE_RELAY_LOOKBACK", 50))
+    SSE_REPLAY_LIMIT = int(os.environ.get("SSE_REPLAY_LIMIT", 500))
+
+    # `flask drain-outbox` reads this many events per query, leaves events
+    # younger than OUTBOX_SETTLE_SECONDS for the next run (their transaction
+    # may not have committed everywhere yet) and, with --follow, polls every
+    # OUTBOX_POLL_INTERVAL seconds.
+    OUTBOX_BATCH_SIZE = int(os.environ.get("OUTBOX_BATCH_SIZE", 1000))
+    OUTBOX_SETTLE_SECONDS = float(os.environ.get("OUTBOX_SETTLE_SECONDS", 5))
+    OUTBOX_POLL_INTERVAL = float(os.environ.get("OUTBOX_POLL_INTERVAL", 5))
+
 
 class DevelopmentConfig(Config):
     DEBUG = True
@@ -31,6 +122,9 @@ class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
     LOGGING_LEVEL = logging.DEBUG  # Detallado para tests
+    RATE_LIMIT_ENABLED = False
+    JOB_RUN_INLINE = True
+    WARMUP_ENABLED = False
 
 
 config_by_name = dict(dev=DevelopmentConfig, prod=ProductionConfig, test=TestingConfig)
@@ -0,0 +1,40 @@
+# app/domain/infractions/adapters/batching.py
+from typing import Dict, Iterable, List, Optional
+
+from app.domain.infractions.adapters.vehicle_adapter import (
+    BaseVehicleAdapter,
+    VehicleDTO,
+    VehiclePlateMatchDTO,
+)
+from app.infrastructure.batch_loader import Deferred, RequestBatchLoader
+
+# Routes a vehicle adapter's lookups through a RequestBatchLoader, so a plate
+# looked up again during one request is not queried twice, and plates
+# registered with ``defer`` are fetched with a single multi-get.
+
+
+def _loader_name(kind: str, adapter) -> str:
+    return f"{kind}:{type(adapter).__module__}.{type(adapter).__qualname__}"
+
+
+class BatchingVehicleAdapter(BaseVehicleAdapter):
+    def __init__(self, adapter: BaseVehicleAdapter):
+        self.adapter = adapter
+        self.loader = RequestBatchLoader(
+            _loader_name("vehicles", adapter), adapter.get_vehicles
+        )
+
+    def defer(self, license_plate: str) -> Deferred[str, VehicleDTO]:
+        return self.loader.defer(license_plate)
+
+    def get_vehicle(self, license_plate: str) -> Optional[VehicleDTO]:
+        return self.loader.load(license_plate)
+
+    def get_vehicles(self, license_plates: Iterable[str]) -> Dict[str, VehicleDTO]:
+        loaded = self.loader.load_many(license_plates)
+        return {plate: vehicle for plate, vehicle in loaded.items() if vehicle}
+
+    def search_plates(
+        self, query: str, mode: str = "fuzzy", limit: int = 10
+    ) -> List[VehiclePlateMatchDTO]:
+        return self.adapter.search_plates(query, mode=mode, limit=limit)
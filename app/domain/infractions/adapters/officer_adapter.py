@@ -1,14 +1,32 @@
 # app/domain/infractions/adapters/vehicle_adapter.py
 from abc import ABC, abstractmethod
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Mapping, Optional
 
-from pydantic import BaseModel
-
-from app.domain.users.services.officer_service import get_officer_by_unique_identifier
+from app.domain.users.services.officer_service import (
+    OFFICER_ID_CLAIM,
+    OFFICER_NAME_CLAIM,
+    get_officer_by_unique_identifier,
+    get_officers_by_unique_identifiers,
+)
+from app.infrastructure.database import use_replica
+from app.infrastructure.log_policy import log_event
 from app.infrastructure.logger import app_logger
+from app.infrastructure.tracing import traced
+
+
+class OfficerMismatchError(Exception):
+    """Exception raised when a request names an officer other than the caller."""
+
+    def __init__(self, unique_identifier: str):
+        self.message = (
+            f"Officer {unique_identifier} does not match the authenticated officer."
+        )
+        super().__init__(self.message)
 
 
-class OfficerDTO(BaseModel):
+@dataclass(frozen=True, slots=True)
+class OfficerDTO:
     id: int
     name: str
     unique_identifier: str
@@ -19,9 +37,26 @@ class BaseOfficerAdapter(ABC):
     def get_officer(self, unique_identifier: str) -> OfficerDTO:
         pass
 
+    def get_officers(self, unique_identifiers: Iterable[str]) -> Dict[str, OfficerDTO]:
+        """
+        Retrieve many officers at once, keyed by unique identifier.
+
+        The default falls back to one lookup per identifier; adapters backed by
+        a database should override it with a set-based query. Unknown
+        identifiers are left out.
+        """
+        officers = {}
+        for unique_identifier in dict.fromkeys(unique_identifiers):
+            officer = self.get_officer(unique_identifier)
+            if officer is not None:
+                officers[unique_identifier] = officer
+        return officers
+
 
 class OfficerAdapter(BaseOfficerAdapter):
     @staticmethod
+    @use_replica
+    @traced
     def get_officer(unique_identifier: str) -> Optional[OfficerDTO]:
         """
         Retrieve an officer by their unique identifier.
@@ -34,7 +69,7 @@ class OfficerAdapter(BaseOfficerAdapter):
         """
         officer = get_officer_by_unique_identifier(unique_identifier=unique_identifier)
         if officer:
-            app_logger.info("officer is True")
+            log_event("officer.retrieved", officer_id=officer.id)
             return OfficerDTO(
                 id=officer.id,
                 name=officer.name,
@@ -42,6 +77,64 @@ class OfficerAdapter(BaseOfficerAdapter):
             )
         return None
 
+    @staticmethod
+    @use_replica
+    @traced
+    def get_officers(unique_identifiers: Iterable[str]) -> Dict[str, OfficerDTO]:
+        """
+        Retrieve many officers with one IN query per chunk of identifiers.
+
+        Args:
+            unique_identifiers (Iterable[str]): Unique identifiers to find.
+
+        Returns:
+            Dict[str, OfficerDTO]: Found officers keyed by unique identifier.
+        """
+        officers = get_officers_by_unique_identifiers(unique_identifiers)
+        return {
+            identifier: OfficerDTO(
+                id=officer.id,
+                name=officer.name,
+                unique_identifier=officer.unique_identifier,
+            )
+            for identifier, officer in officers.items()
+        }
+
+
+class ClaimsOfficerAdapter(BaseOfficerAdapter):
+    """
+    Resolves the authenticated officer from the claims of their access token.
+
+    Only the caller's own identifier can be looked up; any other raises
+    ``OfficerMismatchError``. Tokens issued before the claims were added are
+    resolved through ``fallback``.
+    """
+
+    def __init__(
+        self,
+        identity: str,
+        claims: Mapping[str, Any],
+        fallback: Optional[BaseOfficerAdapter] = None,
+    ):
+        self.identity = str(identity)
+        self.claims = claims
+        self.fallback = fallback or OfficerAdapter()
+
+    @traced
+    def get_officer(self, unique_identifier: str) -> Optional[OfficerDTO]:
+        if unique_identifier != self.identity:
+            app_logger.warning(
+                f"Officer {unique_identifier} requested by token of {self.identity}"
+            )
+            raise OfficerMismatchError(unique_identifier)
+        if OFFICER_ID_CLAIM not in self.claims:
+            return self.fallback.get_officer(unique_identifier)
+        return OfficerDTO(
+            id=self.claims[OFFICER_ID_CLAIM],
+            name=self.claims.get(OFFICER_NAME_CLAIM, ""),
+            unique_identifier=self.identity,
+        )
+
 
 class FakeOfficerAdapter(BaseOfficerAdapter):
     def get_officer(self, unique_identifier: str) -> OfficerDTO:
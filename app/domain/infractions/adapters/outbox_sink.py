@@ -0,0 +1,53 @@
+# app/domain/infractions/adapters/outbox_sink.py
+import os
+import socket
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class BaseOutboxSink(ABC):
+    """
+    Where drained outbox events go. ``send`` gets one batch of events, each a
+    JSON document, and must only return once the batch is delivered: the
+    drain advances its cursor right after.
+    """
+
+    @abstractmethod
+    def send(self, events: List[str]) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class FileSink(BaseOutboxSink):
+    """Appends the events to ``path`` as newline-delimited JSON."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "a", encoding="utf-8")
+
+    def send(self, events: List[str]) -> None:
+        self._file.write("".join(f"{event}\n" for event in events))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class SocketSink(BaseOutboxSink):
+    """
+    Streams the events as newline-delimited JSON to a local consumer
+    listening on the Unix socket ``path``.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect(path)
+
+    def send(self, events: List[str]) -> None:
+        self._socket.sendall("".join(f"{event}\n" for event in events).encode())
+
+    def close(self) -> None:
+        self._socket.close()
@@ -1,8 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
-from app.domain.users.services.person_services import get_person_by_email
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+from app.domain.users.services.person_services import (
+    PersonResponseDTO,
+    get_person_by_email,
+    get_persons_by_emails,
+    normalize_email,
+)
+from app.infrastructure.database import use_replica
+from app.infrastructure.log_policy import log_event
 from app.infrastructure.logger import app_logger
-from pydantic import BaseModel, EmailStr, Field
+from app.infrastructure.tracing import traced
 
 
 class NoVehiclesFoundError(Exception):
@@ -13,19 +21,34 @@ class NoVehiclesFoundError(Exception):
         super().__init__(message)
 
 
-class VehicleDTO(BaseModel):
-    license_plate: str = Field(..., description="The vehicle's license plate.")
-    make: str = Field(..., description="The make of the vehicle.")
-    model: str = Field(..., description="The model of the vehicle.")
-    color: str = Field(..., description="The color of the vehicle.")
+# Adapter DTOs are built from data another domain already read from our own
+# database, so they are frozen records without validation.
 
 
-class PersonDTO(BaseModel):
-    name: str = Field(..., description="The full name of the person.")
-    email: EmailStr = Field(..., description="The email address of the person.")
-    vehicles: List[VehicleDTO] = Field(
-        default=[], description="List of vehicles associated with the person."
-    )
+@dataclass(frozen=True, slots=True)
+class VehicleDTO:
+    license_plate: str
+    make: str
+    model: str
+    color: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class PersonDTO:
+    name: str
+    email: str
+    vehicles: Tuple[VehicleDTO, ...] = ()
+
+    @classmethod
+    def from_person(cls, person: PersonResponseDTO) -> "PersonDTO":
+        return cls(
+            name=person.name,
+            email=person.email,
+            vehicles=tuple(
+                VehicleDTO(v.license_plate, v.make, v.model, v.color)
+                for v in person.vehicles
+            ),
+        )
 
 
 class BasePersonAdapter(ABC):
@@ -34,8 +57,27 @@ class BasePersonAdapter(ABC):
         """Retrieve a person by their email address and return a PersonDTO."""
         pass
 
+    def get_persons_by_email(
+        self, emails: Iterable[str]
+    ) -> Dict[str, Optional[PersonDTO]]:
+        """
+        Retrieve many persons at once, keyed by each email as given.
+
+        The default falls back to one lookup per email; adapters backed by a
+        database should override it with a set-based query.
+        """
+        persons = {}
+        for email in emails:
+            try:
+                persons[email] = self.get_person_by_email(email)
+            except NoVehiclesFoundError:
+                persons[email] = None
+        return persons
+
 
 class PersonAdapter(BasePersonAdapter):
+    @use_replica
+    @traced
     def get_person_by_email(self, email: str) -> Optional[PersonDTO]:
         """
         Retrieves a person by their email address from the database and returns a PersonDTO.
@@ -49,23 +91,35 @@ class PersonAdapter(BasePersonAdapter):
             app_logger.warning(f"No person found with email: {email}")
             return None
 
-        app_logger.info(f"{person.model_dump()}")
         if not person.vehicles:
             app_logger.error(f"No vehicles found for person with email: {email}")
             raise NoVehiclesFoundError(person_id=person.id)
 
-        person_dto = PersonDTO(
-            name=person.name,
-            email=person.email,
-            vehicles=[
-                VehicleDTO(
-                    license_plate=v.license_plate,
-                    make=v.make,
-                    model=v.model,
-                    color=v.color,
-                )
-                for v in person.vehicles
-            ],
-        )
-        app_logger.info(f"Person with email {email} retrieved successfully.")
+        person_dto = PersonDTO.from_person(person)
+        log_event("person.retrieved", email=email)
         return person_dto
+
+    @use_replica
+    @traced
+    def get_persons_by_email(
+        self, emails: Iterable[str]
+    ) -> Dict[str, Optional[PersonDTO]]:
+        """
+        Retrieves many persons and their vehicles in a constant number of queries.
+
+        Unlike ``get_person_by_email``, persons without vehicles are returned
+        with an empty vehicle list instead of raising.
+
+        Args:
+            emails (Iterable[str]): The email addresses to look up.
+        Returns:
+            Dict[str, Optional[PersonDTO]]: Each given email mapped to its person, or None.
+        """
+        emails = list(emails)
+        found = get_persons_by_emails(emails)
+        persons = {}
+        for email in emails:
+            person = found.get(normalize_email(email))
+            persons[email] = PersonDTO.from_person(person) if person else None
+        log_event("persons.retrieved", found=len(found), requested=len(emails))
+        return persons
@@ -1,19 +1,46 @@
 # app/domain/infractions/adapters/vehicle_adapter.py
 from abc import ABC, abstractmethod
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
 
-from pydantic import BaseModel
+from app.domain.vehicles.services.plate_search_service import (
+    InvalidPlateQueryError,
+    search_plates,
+)
+from app.domain.vehicles.services.vehicle_service import (
+    get_vehicle_by_license_plate,
+    get_vehicles_by_license_plates,
+)
+from app.infrastructure.database import use_replica
+from app.infrastructure.tracing import traced
 
-from app.domain.vehicles.services.vehicle_service import get_vehicle_by_license_plate
 
-
-class VehicleDTO(BaseModel):
+@dataclass(frozen=True, slots=True)
+class VehicleDTO:
     id: str
     license_plate: str
     make: str
     model: str
-    color: str
-    owner_id: int
+    color: Optional[str]
+    owner_id: Optional[int]
+
+    @classmethod
+    def from_vehicle(cls, vehicle) -> "VehicleDTO":
+        return cls(
+            id=str(vehicle.id),
+            license_plate=vehicle.license_plate,
+            make=vehicle.make,
+            model=vehicle.model,
+            color=vehicle.color,
+            owner_id=vehicle.owner_id,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class VehiclePlateMatchDTO:
+    vehicle: VehicleDTO
+    # Edits between the searched plate and this one, once both are normalized.
+    distance: int
 
 
 class BaseVehicleAdapter(ABC):
@@ -21,9 +48,39 @@ class BaseVehicleAdapter(ABC):
     def get_vehicle(self, license_plate: str) -> VehicleDTO:
         pass
 
+    def get_vehicles(self, license_plates: Iterable[str]) -> Dict[str, VehicleDTO]:
+        """
+        Retrieve many vehicles at once, keyed by license plate.
+
+        The default falls back to one lookup per plate; adapters backed by a
+        database should override it with a set-based query. Unknown plates are
+        left out.
+        """
+        vehicles = {}
+        for license_plate in dict.fromkeys(license_plates):
+            vehicle = self.get_vehicle(license_plate)
+            if vehicle is not None:
+                vehicles[license_plate] = vehicle
+        return vehicles
+
+    @abstractmethod
+    def search_plates(
+        self, query: str, mode: str = "fuzzy", limit: int = 10
+    ) -> List[VehiclePlateMatchDTO]:
+        """
+        Vehicles whose plate starts with (``mode="prefix"``) or resembles
+        (``mode="fuzzy"``) ``query``, best match first.
+
+        Raises:
+            ValueError: If the query or the options are not usable.
+        """
+        pass
+
 
 class VehicleAdapter(BaseVehicleAdapter):
     @staticmethod
+    @use_replica
+    @traced
     def get_vehicle(license_plate: str) -> Optional[VehicleDTO]:
         """
         Retrieve a vehicle by its license plate through the vehicle service.
@@ -39,18 +96,73 @@ class VehicleAdapter(BaseVehicleAdapter):
         if vehicle_obj is None:
             return None
 
-        return VehicleDTO(
-            id=str(vehicle_obj.id),
-            license_plate=vehicle_obj.license_plate,
-            make=vehicle_obj.make,
-            model=vehicle_obj.model,
-            color=vehicle_obj.color,
-            owner_id=vehicle_obj.owner_id,
-        )
+        return VehicleDTO.from_vehicle(vehicle_obj)
+
+    @staticmethod
+    @use_replica
+    @traced
+    def get_vehicles(license_plates: Iterable[str]) -> Dict[str, VehicleDTO]:
+        """
+        Retrieve many vehicles with one IN query per chunk of plates.
+
+        Args:
+            license_plates (Iterable[str]): License plates of the vehicles to find.
+
+        Returns:
+            Dict[str, VehicleDTO]: Found vehicles keyed by license plate.
+        """
+        return {
+            plate: VehicleDTO.from_vehicle(vehicle)
+            for plate, vehicle in get_vehicles_by_license_plates(license_plates).items()
+        }
+
+    @staticmethod
+    def search_plates(
+        query: str, mode: str = "fuzzy", limit: int = 10
+    ) -> List[VehiclePlateMatchDTO]:
+        """
+        Search plates through the vehicle service's prefix and trigram indexes.
+
+        Args:
+            query (str): Full or partial plate, in any case and punctuation.
+            mode (str): "prefix" or "fuzzy".
+            limit (int): Matches to return.
+
+        Returns:
+            List[VehiclePlateMatchDTO]: Ranked matches, best first.
+        """
+        try:
+            matches = search_plates(query, mode=mode, limit=limit)
+        except InvalidPlateQueryError as e:
+            raise ValueError(e.message) from e
+        return [
+            VehiclePlateMatchDTO(
+                vehicle=VehicleDTO(
+                    id=str(match.id),
+                    license_plate=match.license_plate,
+                    make=match.make,
+                    model=match.model,
+                    color=match.color,
+                    owner_id=match.owner_id,
+                ),
+                distance=match.distance,
+            )
+            for match in matches
+        ]
 
 
 class FakeVehicleAdapter(BaseVehicleAdapter):
     def get_vehicle(self, license_plate: str) -> VehicleDTO:
         return VehicleDTO(
-            license_plate=license_plate, make="Test", model="Car", color="Blue"
+            id="1",
+            license_plate=license_plate,
+            make="Test",
+            model="Car",
+            color="Blue",
+            owner_id=1,
         )
+
+    def search_plates(
+        self, query: str, mode: str = "fuzzy", limit: int = 10
+    ) -> List[VehiclePlateMatchDTO]:
+        return [VehiclePlateMatchDTO(vehicle=self.get_vehicle(query), distance=0)]
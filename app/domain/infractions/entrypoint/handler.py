@@ -1,34 +1,82 @@
-from flask import Blueprint, request
-from flask_jwt_extended import jwt_required
+from datetime import date, datetime, timedelta
+
+from flask import Blueprint, current_app, json, request, stream_with_context, url_for
+from flask_jwt_extended import get_jwt, get_jwt_identity, jwt_required
 from pydantic import ValidationError
 
 from app.commons.responses import handle_api_response
+from app.infrastructure.pubsub import BrokerFullError, SubscriptionDropped
+from app.infrastructure.versioning import VersionConflictError
+from app.extensions import db, rate_limiter
+from app.domain.infractions.adapters.batching import BatchingVehicleAdapter
 from app.domain.infractions.adapters.vehicle_adapter import VehicleAdapter
-from app.domain.infractions.adapters.officer_adapter import OfficerAdapter
+from app.domain.infractions.adapters.officer_adapter import (
+    ClaimsOfficerAdapter,
+    OfficerAdapter,
+    OfficerMismatchError,
+)
 from app.domain.infractions.adapters.person_adapter import PersonAdapter
 from app.domain.infractions.services.infraction_service import (
+    BatchReportRequestDTO,
+    InfractionBulkDeleteDTO,
     InfractionDTO,
+    InfractionPatchDTO,
+    bulk_delete_infractions,
     create_infraction,
     delete_infraction,
     get_infraction,
+    patch_infraction,
     update_infraction,
     generate_report,
+    generate_batch_report,
     InfractionNotFoundError,
     InfractionCreationError,
+    InfractionBulkDeletionError,
     InfractionDeletionError,
     InfractionUpdateError,
 )
+from app.domain.infractions.services.analytics_service import (
+    InvalidAnalyticsQueryError,
+    get_officer_activity,
+)
+from app.domain.infractions.services.feed_service import (
+    FeedFilterDTO,
+    get_infractions_after,
+    subscribe,
+)
+from app.domain.infractions.services.report_job_service import (
+    ReportJobDTO,
+    ReportJobNotFoundError,
+    ReportJobNotReadyError,
+    ReportRequestDTO,
+    enqueue_report,
+    get_report_job,
+    get_report_result,
+)
+from app.domain.infractions.services.search_service import (
+    DEFAULT_PER_PAGE,
+    InvalidSearchQueryError,
+    search_infractions,
+    search_infractions_by_plate,
+)
 
 infraction_blueprint = Blueprint("infractions", __name__)
 
+# Batches with more emails than this are streamed as NDJSON, one report per line.
+BATCH_REPORT_STREAM_THRESHOLD = 50
+
 
 @infraction_blueprint.route("/recording_infraction", methods=["POST"])
 @jwt_required()
+@rate_limiter.limit("write")
 def add_infraction():
     try:
         infraction_dto = InfractionDTO(**request.json)
         vehicle_adapter = VehicleAdapter()
-        officer_adapter = OfficerAdapter()
+        # The token already names the caller, so recording needs no officer query.
+        officer_adapter = ClaimsOfficerAdapter(
+            get_jwt_identity(), get_jwt(), fallback=OfficerAdapter()
+        )
         message, status_code = create_infraction(
             infraction_dto=infraction_dto,
             vehicle_adapter=vehicle_adapter,
@@ -37,12 +85,68 @@ def add_infraction():
         return handle_api_response(data={"message": message}, status_code=status_code)
     except ValidationError as e:
         return handle_api_response(error={"errors": str(e)}, status_code=400)
+    except OfficerMismatchError as e:
+        return handle_api_response(error={"message": e.message}, status_code=403)
     except InfractionCreationError as e:
         return handle_api_response(error={"message": str(e)}, status_code=404)
 
 
+@infraction_blueprint.route("/search", methods=["GET"])
+@jwt_required()
+@rate_limiter.limit("read")
+def search_infractions_endpoint():
+    try:
+        results = search_infractions(
+            request.args.get("q", ""),
+            page=request.args.get("page", 1, type=int),
+            per_page=request.args.get("per_page", DEFAULT_PER_PAGE, type=int),
+            vehicle_adapter=BatchingVehicleAdapter(VehicleAdapter()),
+        )
+        return handle_api_response(data=results.dict())
+    except InvalidSearchQueryError as e:
+        return handle_api_response(error={"message": str(e)}, status_code=400)
+
+
+@infraction_blueprint.route("/search/plates", methods=["GET"])
+@jwt_required()
+@rate_limiter.limit("read")
+def search_plates_endpoint():
+    try:
+        results = search_infractions_by_plate(
+            request.args.get("plate", ""),
+            vehicle_adapter=VehicleAdapter(),
+            mode=request.args.get("mode", "fuzzy"),
+            limit=request.args.get("limit", 10, type=int),
+        )
+        return handle_api_response(
+            data={"matches": [result.dict() for result in results]}
+        )
+    except InvalidSearchQueryError as e:
+        return handle_api_response(error={"message": str(e)}, status_code=400)
+
+
+@infraction_blueprint.route("/analytics/officers", methods=["GET"])
+@jwt_required()
+@rate_limiter.limit("report")
+def officer_activity_endpoint():
+    try:
+        end = request.args.get("end", type=date.fromisoformat)
+        end = end or datetime.utcnow().date()
+        start = request.args.get("start", type=date.fromisoformat)
+        activity = get_officer_activity(
+            request.args.get("granularity", "day"),
+            start=start or end - timedelta(days=29),
+            end=end,
+            officer_id=request.args.get("officer_id", type=int),
+        )
+        return handle_api_response(data=activity.dict())
+    except InvalidAnalyticsQueryError as e:
+        return handle_api_response(error={"message": str(e)}, status_code=400)
+
+
 @infraction_blueprint.route("/<int:infraction_id>", methods=["GET"])
 @jwt_required()
+@rate_limiter.limit("read")
 def retrieve_infraction(infraction_id):
     try:
         infraction = get_infraction(infraction_id)
@@ -53,6 +157,7 @@ def retrieve_infraction(infraction_id):
 
 @infraction_blueprint.route("/<int:infraction_id>", methods=["PUT"])
 @jwt_required()
+@rate_limiter.limit("write")
 def modify_infraction(infraction_id):
     try:
         infraction_dto = InfractionDTO(**request.json)
@@ -62,12 +167,39 @@ def modify_infraction(infraction_id):
         return handle_api_response(error={"errors": e.errors()}, status_code=400)
     except InfractionNotFoundError as e:
         return handle_api_response(error={"message": str(e)}, status_code=404)
+    except VersionConflictError as e:
+        return handle_api_response(
+            error={"message": e.message, "version": e.current_version},
+            status_code=409,
+        )
+    except InfractionUpdateError as e:
+        return handle_api_response(error={"message": str(e)}, status_code=500)
+
+
+@infraction_blueprint.route("/<int:infraction_id>", methods=["PATCH"])
+@jwt_required()
+@rate_limiter.limit("write")
+def patch_infraction_endpoint(infraction_id):
+    try:
+        infraction_dto = InfractionPatchDTO(**(request.json or {}))
+        infraction = patch_infraction(infraction_id, infraction_dto)
+        return handle_api_response(data=infraction)
+    except ValidationError as e:
+        return handle_api_response(error={"errors": str(e)}, status_code=400)
+    except InfractionNotFoundError as e:
+        return handle_api_response(error={"message": str(e)}, status_code=404)
+    except VersionConflictError as e:
+        return handle_api_response(
+            error={"message": e.message, "version": e.current_version},
+            status_code=409,
+        )
     except InfractionUpdateError as e:
         return handle_api_response(error={"message": str(e)}, status_code=500)
 
 
 @infraction_blueprint.route("/<int:infraction_id>", methods=["DELETE"])
 @jwt_required()
+@rate_limiter.limit("write")
 def delete_infraction_endpoint(infraction_id):
     try:
         success = delete_infraction(infraction_id)
@@ -81,8 +213,24 @@ def delete_infraction_endpoint(infraction_id):
         return handle_api_response(error={"message": str(e)}, status_code=500)
 
 
+@infraction_blueprint.route("/bulk_delete", methods=["POST"])
+@jwt_required()
+@rate_limiter.limit("write")
+def bulk_delete_infractions_endpoint():
+    try:
+        bulk_request = InfractionBulkDeleteDTO(**(request.json or {}))
+    except ValidationError as e:
+        return handle_api_response(error={"errors": str(e)}, status_code=400)
+    try:
+        deleted = bulk_delete_infractions(bulk_request)
+        return handle_api_response(data={"deleted": deleted})
+    except InfractionBulkDeletionError as e:
+        return handle_api_response(error={"message": str(e)}, status_code=500)
+
+
 @infraction_blueprint.route("/generate_report/<string:email>", methods=["GET"])
 @jwt_required()
+@rate_limiter.limit("report")
 def generate_report_endpoint(email):
     person_adapter = PersonAdapter()
     try:
@@ -94,3 +242,135 @@ def generate_report_endpoint(email):
         return handle_api_response(data=report, status_code=200)
     except Exception as e:
         return handle_api_response(error={"message": str(e)}, status_code=500)
+
+
+@infraction_blueprint.route("/reports", methods=["POST"])
+@jwt_required()
+@rate_limiter.limit("report")
+def enqueue_report_endpoint():
+    try:
+        report_request = ReportRequestDTO(**(request.json or {}))
+    except ValidationError as e:
+        return handle_api_response(error={"errors": str(e)}, status_code=400)
+    job = enqueue_report(
+        report_request.email,
+        requested_by=get_jwt_identity(),
+        person_adapter=PersonAdapter(),
+    )
+    location = url_for(".report_job_endpoint", job_id=job.id)
+    return handle_api_response(
+        data={**job.dict(), "status_url": location},
+        status_code=202,
+        headers={"Location": location},
+    )
+
+
+@infraction_blueprint.route("/reports/<string:job_id>", methods=["GET"])
+@jwt_required()
+@rate_limiter.limit("read")
+def report_job_endpoint(job_id):
+    try:
+        job = ReportJobDTO.from_job(get_report_job(job_id, get_jwt_identity()))
+    except ReportJobNotFoundError as e:
+        return handle_api_response(error={"message": str(e)}, status_code=404)
+    data = job.dict()
+    if job.status == "done":
+        data["download_url"] = url_for(".download_report_endpoint", job_id=job_id)
+    return handle_api_response(data=data)
+
+
+@infraction_blueprint.route("/reports/<string:job_id>/download", methods=["GET"])
+@jwt_required()
+@rate_limiter.limit("read")
+def download_report_endpoint(job_id):
+    try:
+        result = get_report_result(job_id, get_jwt_identity())
+    except ReportJobNotFoundError as e:
+        return handle_api_response(error={"message": str(e)}, status_code=404)
+    except ReportJobNotReadyError as e:
+        return handle_api_response(error={"message": str(e)}, status_code=409)
+    return current_app.response_class(
+        result,
+        mimetype="application/json",
+        headers={"Content-Disposition": f"attachment; filename=report-{job_id}.json"},
+    )
+
+
+@infraction_blueprint.route("/reports/batch", methods=["POST"])
+@jwt_required()
+@rate_limiter.limit("report")
+def batch_report_endpoint():
+    try:
+        batch_request = BatchReportRequestDTO(**(request.json or {}))
+    except ValidationError as e:
+        return handle_api_response(error={"errors": str(e)}, status_code=400)
+    reports = generate_batch_report(batch_request.emails, PersonAdapter())
+    if len(batch_request.emails) <= BATCH_REPORT_STREAM_THRESHOLD:
+        return handle_api_response(data={"reports": list(reports)})
+    return current_app.response_class(
+        stream_with_context(json.dumps(report) + "\n" for report in reports),
+        mimetype="application/x-ndjson",
+    )
+
+
+@infraction_blueprint.route("/stream", methods=["GET"])
+@jwt_required()
+def stream_infractions_endpoint():
+    """
+    Server-Sent Events feed of infractions as they are recorded, optionally
+    only those of an ``officer_id`` or ``license_plate``.
+
+    A client reconnecting with ``Last-Event-ID`` first receives what it missed.
+    Clients that fall behind get an ``event: dropped`` and are disconnected.
+    """
+    try:
+        filters = FeedFilterDTO(**request.args.to_dict())
+    except ValidationError as e:
+        return handle_api_response(error={"errors": str(e)}, status_code=400)
+    config = current_app.config
+    try:
+        subscription = subscribe(filters)
+    except BrokerFullError as e:
+        return handle_api_response(
+            error={"message": e.message},
+            status_code=503,
+            headers={"Retry-After": "30"},
+        )
+    missed = []
+    last_event_id = request.headers.get("Last-Event-ID", type=int)
+    if last_event_id is not None:
+        missed = get_infractions_after(
+            last_event_id, filters, limit=config.get("SSE_REPLAY_LIMIT", 500)
+        )
+    # Do not hold a pooled connection for the lifetime of the stream.
+    db.session.remove()
+    heartbeat = config.get("SSE_HEARTBEAT_SECONDS", 15)
+
+    def events():
+        replayed = {event.id for event in missed}
+        try:
+            yield f"retry: {int(heartbeat * 1000)}\n\n"
+            for event in missed:
+                yield _sse_frame(event)
+            while True:
+                try:
+                    event = subscription.get(timeout=heartbeat)
+                except SubscriptionDropped:
+                    yield "event: dropped\ndata: {}\n\n"
+                    return
+                if event is None:
+                    yield ": keep-alive\n\n"
+                elif event.id not in replayed:
+                    yield _sse_frame(event)
+        finally:
+            subscription.close()
+
+    return current_app.response_class(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse_frame(event) -> str:
+    return f"id: {event.id}\nevent: infraction\ndata: {event.model_dump_json()}\n\n"
@@ -1 +1,3 @@
 from app.domain.infractions.models.infractions import Infraction
+from app.domain.infractions.models.outbox import OutboxCursor, OutboxEvent
+from app.domain.infractions.models.report_job import ReportJob
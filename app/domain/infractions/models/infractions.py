@@ -2,27 +2,86 @@
 import datetime
 
 from app.extensions import db
+from app.infrastructure.database import unmanaged_tables
+from app.infrastructure.soft_delete import SoftDeleteMixin
+from app.infrastructure.versioning import VersionedMixin
 
 
-class Infraction(db.Model):
+class Infraction(SoftDeleteMixin, VersionedMixin, db.Model):
     __tablename__ = "infractions"
 
     id = db.Column(db.Integer, primary_key=True)
     license_plate = db.Column(
-        db.String(255), db.ForeignKey("vehicles.license_plate"), nullable=False
+        db.String(255),
+        db.ForeignKey("vehicles.license_plate", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
     )
     timestamp = db.Column(db.DateTime, default=datetime.datetime.utcnow)
     comments = db.Column(db.Text)
     officer_id = db.Column(
-        db.Integer, db.ForeignKey("officers.id")
+        db.Integer, db.ForeignKey("officers.id", ondelete="SET NULL"), index=True
     )  # Usar el ID del oficial como FK
 
+    # Deleting a vehicle deletes its infractions and deleting an officer keeps
+    # theirs without an officer; the database does both (ON DELETE), so the
+    # ORM never loads the collections for it.
     vehicle = db.relationship(
-        "Vehicle", backref=db.backref("infractions", lazy="dynamic")
+        "Vehicle",
+        backref=db.backref("infractions", lazy="dynamic", passive_deletes=True),
     )
     officer = db.relationship(
-        "Officer", backref=db.backref("infractions", lazy="dynamic")
+        "Officer",
+        backref=db.backref("infractions", lazy="dynamic", passive_deletes=True),
     )
 
     def __repr__(self):
         return f"<Infraction {self.id} - {self.timestamp}>"
+
+
+# Full-text index over comments, used by services/search_service.py. The
+# database keeps it in sync on its own (triggers on SQLite, an expression index
+# on Postgres), so bulk updates and raw SQL writes stay searchable too.
+COMMENTS_FTS_TABLE = "infractions_fts"
+COMMENTS_FTS_INDEX = "ix_infractions_comments_fts"
+unmanaged_tables.update(
+    f"{COMMENTS_FTS_TABLE}{suffix}"
+    for suffix in ("", "_data", "_idx", "_docsize", "_config")
+)
+
+_sqlite_fts_ddl = [
+    f"CREATE VIRTUAL TABLE {COMMENTS_FTS_TABLE} USING fts5("
+    "comments, content='infractions', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER {COMMENTS_FTS_TABLE}_ai AFTER INSERT ON infractions BEGIN "
+    f"INSERT INTO {COMMENTS_FTS_TABLE}(rowid, comments) "
+    "VALUES (new.id, new.comments); END",
+    f"CREATE TRIGGER {COMMENTS_FTS_TABLE}_ad AFTER DELETE ON infractions BEGIN "
+    f"INSERT INTO {COMMENTS_FTS_TABLE}({COMMENTS_FTS_TABLE}, rowid, comments) "
+    "VALUES ('delete', old.id, old.comments); END",
+    f"CREATE TRIGGER {COMMENTS_FTS_TABLE}_au AFTER UPDATE OF comments "
+    "ON infractions BEGIN "
+    f"INSERT INTO {COMMENTS_FTS_TABLE}({COMMENTS_FTS_TABLE}, rowid, comments) "
+    "VALUES ('delete', old.id, old.comments); "
+    f"INSERT INTO {COMMENTS_FTS_TABLE}(rowid, comments) "
+    "VALUES (new.id, new.comments); END",
+]
+for _statement in _sqlite_fts_ddl:
+    db.event.listen(
+        Infraction.__table__,
+        "after_create",
+        db.DDL(_statement).execute_if(dialect="sqlite"),
+    )
+db.event.listen(
+    Infraction.__table__,
+    "before_drop",
+    db.DDL(f"DROP TABLE IF EXISTS {COMMENTS_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
+db.event.listen(
+    Infraction.__table__,
+    "after_create",
+    db.DDL(
+        f"CREATE INDEX {COMMENTS_FTS_INDEX} ON infractions "
+        "USING gin (to_tsvector('simple', coalesce(comments, '')))"
+    ).execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,46 @@
+# app/domain/infractions/models/outbox.py
+import datetime
+
+from app.extensions import db
+
+
+class OutboxEvent(db.Model):
+    """
+    A change to an infraction, written in the same transaction as the change
+    and drained to downstream systems in id order (see services/outbox_service).
+
+    Bulk deletes, vehicle deletes and plate renames the database cascades to
+    infractions are recorded too. Officer deletes are not: the infractions
+    they detach (ON DELETE SET NULL) get no ``UPDATED`` event.
+    """
+
+    __tablename__ = "outbox_events"
+
+    CREATED = "infraction.created"
+    UPDATED = "infraction.updated"
+    DELETED = "infraction.deleted"
+
+    id = db.Column(db.Integer, primary_key=True)
+    event_type = db.Column(db.String(64), nullable=False)
+    # Not a foreign key: the event outlives a deleted infraction.
+    infraction_id = db.Column(db.Integer, nullable=False)
+    payload = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+
+    def __repr__(self):
+        return f"<OutboxEvent {self.id} - {self.event_type}>"
+
+
+class OutboxCursor(db.Model):
+    """Id of the last outbox event a consumer has handed to its sink."""
+
+    __tablename__ = "outbox_cursors"
+
+    consumer = db.Column(db.String(64), primary_key=True)
+    position = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow
+    )
+
+    def __repr__(self):
+        return f"<OutboxCursor {self.consumer} - {self.position}>"
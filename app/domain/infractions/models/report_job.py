@@ -0,0 +1,28 @@
+# app/domain/infractions/models/report_job.py
+import datetime
+import uuid
+
+from app.extensions import db
+
+
+class ReportJob(db.Model):
+    __tablename__ = "report_jobs"
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    id = db.Column(db.String(32), primary_key=True, default=lambda: uuid.uuid4().hex)
+    email = db.Column(db.String(255), nullable=False)
+    requested_by = db.Column(db.String(255), nullable=False, index=True)
+    status = db.Column(db.String(16), nullable=False, default=QUEUED)
+    created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    error = db.Column(db.Text)
+    # The finished report, serialized once as JSON so downloads stream it as is.
+    result = db.Column(db.Text)
+
+    def __repr__(self):
+        return f"<ReportJob {self.id} - {self.status}>"
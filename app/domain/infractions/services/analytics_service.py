@@ -0,0 +1,309 @@
+# app/domain/infractions/services/analytics_service.py
+import threading
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+from sqlalchemy import event, func, literal_column
+from sqlalchemy.orm import attributes, object_session
+
+from app.domain.infractions.models import Infraction
+from app.domain.users.models import Officer
+from app.domain.vehicles.models import Vehicle
+from app.extensions import db, warmup
+from app.infrastructure.cache import LRUCache
+from app.infrastructure.database import RoutingSession, use_replica
+from app.infrastructure.logger import app_logger
+from app.infrastructure.tracing import traced
+
+GRANULARITIES = ("day", "week", "month")
+MAX_PERIODS = 400
+
+# Recent history dashboards ask for first; warm-up caches it per granularity.
+WARMUP_HISTORY = {
+    "day": timedelta(days=31),
+    "week": timedelta(weeks=12),
+    "month": timedelta(days=365),
+}
+
+# Counts for closed periods, keyed by (granularity, period_start) and stored as
+# immutable ((officer_id, count), ...) tuples. The current period is never
+# cached, so it is recomputed on every call.
+officer_activity_cache = LRUCache("officer_activity", maxsize=4096)
+
+_generation_lock = threading.Lock()
+_generation = 0
+
+########################################
+#             Exceptions               #
+########################################
+
+
+class InvalidAnalyticsQueryError(Exception):
+    """Exception raised when an analytics request cannot be run."""
+
+    def __init__(self, reason):
+        self.message = f"Invalid analytics query: {reason}"
+        super().__init__(self.message)
+
+
+########################################
+#                  DTO                 #
+########################################
+
+
+class OfficerCountDTO(BaseModel):
+    officer_id: Optional[int]
+    infractions: int
+
+
+class OfficerActivityPeriodDTO(BaseModel):
+    period_start: date
+    closed: bool
+    officers: List[OfficerCountDTO]
+
+
+class OfficerActivityDTO(BaseModel):
+    granularity: str
+    periods: List[OfficerActivityPeriodDTO]
+
+
+########################################
+#                Periods               #
+########################################
+
+
+def period_start(day: date, granularity: str) -> date:
+    """First day of the day, ISO week (Monday) or month containing ``day``."""
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def next_period(start: date, granularity: str) -> date:
+    if granularity == "week":
+        return start + timedelta(days=7)
+    if granularity == "month":
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def _bucket(granularity: str, dialect: str):
+    # Granularities come from GRANULARITIES, so they are inlined as literals:
+    # Postgres only accepts the GROUP BY if it repeats the SELECT expression
+    # exactly, which separate bound parameters would prevent.
+    column = Infraction.timestamp
+    if dialect == "sqlite":
+        modifiers = {
+            "day": [],
+            "week": ["'weekday 0'", "'-6 days'"],
+            "month": ["'start of month'"],
+        }[granularity]
+        return func.date(column, *map(literal_column, modifiers))
+    return func.date(func.date_trunc(literal_column(f"'{granularity}'"), column))
+
+
+def _as_date(value) -> date:
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+########################################
+#             Invalidation             #
+########################################
+
+
+def _touched(session, *timestamps) -> None:
+    if session is None:
+        return
+    pending = session.info.setdefault("officer_activity_dirty", set())
+    pending.update(ts for ts in timestamps if ts is not None)
+
+
+@event.listens_for(Infraction, "after_insert")
+@event.listens_for(Infraction, "after_delete")
+def _infraction_written(mapper, connection, target):
+    _touched(object_session(target), target.timestamp)
+
+
+@event.listens_for(Infraction, "after_update")
+def _infraction_updated(mapper, connection, target):
+    history = attributes.get_history(target, "timestamp")
+    _touched(object_session(target), target.timestamp, *(history.deleted or ()))
+
+
+# Deleting one of these makes the database delete or detach its infractions
+# (ON DELETE), which the ORM never sees.
+_INFRACTION_PARENTS = (Vehicle.__mapper__, Officer.__mapper__)
+
+
+@event.listens_for(Vehicle, "after_delete")
+@event.listens_for(Officer, "after_delete")
+def _infraction_parent_deleted(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info["officer_activity_dirty_all"] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _infractions_bulk_written(execute_state):
+    # Bulk statements (e.g. soft deletes) do not say which rows they touched.
+    mapper = execute_state.bind_mapper
+    if (
+        (execute_state.is_update or execute_state.is_delete)
+        and mapper is Infraction.__mapper__
+    ) or (execute_state.is_delete and mapper in _INFRACTION_PARENTS):
+        execute_state.session.info["officer_activity_dirty_all"] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _invalidate_closed_periods(session):
+    global _generation
+    timestamps = session.info.pop("officer_activity_dirty", None)
+    everything = session.info.pop("officer_activity_dirty_all", False)
+    if not timestamps and not everything:
+        return
+    with _generation_lock:
+        _generation += 1
+    if everything:
+        officer_activity_cache.clear()
+        return
+    for ts in timestamps:
+        for granularity in GRANULARITIES:
+            officer_activity_cache.discard(
+                (granularity, period_start(ts.date(), granularity))
+            )
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _forget_uncommitted(session):
+    session.info.pop("officer_activity_dirty", None)
+    session.info.pop("officer_activity_dirty_all", None)
+
+
+########################################
+#                Services              #
+########################################
+
+
+def _count_by_period(
+    granularity: str, lower: date, upper: date
+) -> Dict[date, Dict[Optional[int], int]]:
+    dialect = db.session.get_bind(mapper=Infraction.__mapper__).dialect.name
+    bucket = _bucket(granularity, dialect)
+    rows = (
+        db.session.query(bucket, Infraction.officer_id, func.count(Infraction.id))
+        .filter(
+            Infraction.timestamp >= datetime.combine(lower, time.min),
+            Infraction.timestamp < datetime.combine(upper, time.min),
+        )
+        .group_by(bucket, Infraction.officer_id)
+        .all()
+    )
+    counts: Dict[date, Dict[Optional[int], int]] = {}
+    for bucket_value, officer_id, total in rows:
+        counts.setdefault(_as_date(bucket_value), {})[officer_id] = total
+    return counts
+
+
+@use_replica
+@traced
+def get_officer_activity(
+    granularity: str, start: date, end: date, officer_id: Optional[int] = None
+) -> OfficerActivityDTO:
+    """
+    Count infractions per officer for every period between ``start`` and ``end``.
+
+    Periods are whole days, ISO weeks or calendar months (UTC), so the first
+    and last ones may extend past the requested dates. Closed periods are
+    served from ``officer_activity_cache``; only the missing ones and the
+    current period are aggregated, with a single GROUP BY query.
+
+    Args:
+        granularity (str): One of "day", "week" or "month".
+        start (date): First day to include.
+        end (date): Last day to include; clamped to today.
+        officer_id (int): Only report this officer when given.
+
+    Returns:
+        OfficerActivityDTO: Periods in chronological order.
+    """
+    if granularity not in GRANULARITIES:
+        raise InvalidAnalyticsQueryError(
+            f"granularity must be one of {', '.join(GRANULARITIES)}"
+        )
+    today = datetime.utcnow().date()
+    end = min(end, today)
+    if start > end:
+        raise InvalidAnalyticsQueryError("start must not be after end or today")
+
+    current = period_start(today, granularity)
+    periods = [period_start(start, granularity)]
+    while next_period(periods[-1], granularity) <= end:
+        periods.append(next_period(periods[-1], granularity))
+        if len(periods) > MAX_PERIODS:
+            raise InvalidAnalyticsQueryError(
+                f"the range spans more than {MAX_PERIODS} periods"
+            )
+
+    counts: Dict[date, Tuple[Tuple[Optional[int], int], ...]] = {}
+    missing = []
+    for period in periods:
+        cached = (
+            officer_activity_cache.get((granularity, period))
+            if period < current
+            else None
+        )
+        if cached is None:
+            missing.append(period)
+        else:
+            counts[period] = cached
+
+    if missing:
+        generation = _generation
+        fresh = _count_by_period(
+            granularity, missing[0], next_period(missing[-1], granularity)
+        )
+        for period in missing:
+            counts[period] = tuple(
+                sorted(
+                    fresh.get(period, {}).items(),
+                    key=lambda item: (item[0] is None, item[0] or 0),
+                )
+            )
+            # Skip caching if an infraction was committed while we counted.
+            if period < current and generation == _generation:
+                officer_activity_cache.set((granularity, period), counts[period])
+        app_logger.info(
+            f"Aggregated {len(missing)} {granularity} periods of officer activity"
+        )
+
+    return OfficerActivityDTO(
+        granularity=granularity,
+        periods=[
+            OfficerActivityPeriodDTO(
+                period_start=period,
+                closed=period < current,
+                officers=[
+                    OfficerCountDTO(officer_id=officer, infractions=total)
+                    for officer, total in counts[period]
+                    if officer_id is None or officer == officer_id
+                ],
+            )
+            for period in periods
+        ],
+    )
+
+
+########################################
+#               Warm-up                #
+########################################
+
+
+@warmup.task
+def prime_officer_activity() -> None:
+    """Aggregate the closed periods in ``WARMUP_HISTORY`` into the cache."""
+    today = datetime.utcnow().date()
+    for granularity, history in WARMUP_HISTORY.items():
+        get_officer_activity(granularity, today - history, today)
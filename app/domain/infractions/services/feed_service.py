@@ -0,0 +1,119 @@
+# app/domain/infractions/services/feed_service.py
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask import current_app
+from pydantic import BaseModel, Field
+from sqlalchemy import func, select
+
+from app.commons.signals import infraction_created
+from app.domain.infractions.models import Infraction
+from app.extensions import db
+from app.infrastructure.database import use_replica
+from app.infrastructure.pubsub import Broker, PollingRelay, Subscription
+from app.infrastructure.tracing import traced
+
+########################################
+#                 DTOs                 #
+########################################
+
+
+class InfractionEventDTO(BaseModel):
+    id: int
+    license_plate: str
+    officer_id: Optional[int] = None
+    timestamp: Optional[datetime] = None
+    comments: Optional[str] = None
+
+
+class FeedFilterDTO(BaseModel):
+    """Both filters are optional; an event must match every one given."""
+
+    officer_id: Optional[int] = None
+    license_plate: Optional[str] = Field(None, min_length=1, max_length=255)
+
+    def matches(self, event: InfractionEventDTO) -> bool:
+        return (self.officer_id is None or event.officer_id == self.officer_id) and (
+            self.license_plate is None or event.license_plate == self.license_plate
+        )
+
+
+########################################
+#                 Feed                 #
+########################################
+
+_EVENT_COLUMNS = [getattr(Infraction, name) for name in InfractionEventDTO.model_fields]
+
+# Infractions recorded by this process are published as soon as
+# create_infraction commits; the relay picks up those of other processes.
+infraction_feed = Broker("infractions")
+
+
+def _head() -> int:
+    return db.session.execute(select(func.max(Infraction.id))).scalar() or 0
+
+
+def _fetch(after: int, limit: int) -> List[Tuple[int, int, InfractionEventDTO]]:
+    rows = db.session.execute(
+        select(*_EVENT_COLUMNS)
+        .where(Infraction.id > after)
+        .order_by(Infraction.id)
+        .limit(limit)
+    )
+    return [(row.id, row.id, InfractionEventDTO(**row._mapping)) for row in rows]
+
+
+relay = PollingRelay(infraction_feed, head=_head, fetch=_fetch)
+
+
+@infraction_created.connect
+def _publish_created(sender, infraction: Dict[str, Any], **kwargs) -> None:
+    event = InfractionEventDTO(
+        **{name: infraction.get(name) for name in InfractionEventDTO.model_fields}
+    )
+    infraction_feed.publish(event, event_id=event.id)
+
+
+########################################
+#               Services               #
+########################################
+
+
+def subscribe(filters: FeedFilterDTO) -> Subscription:
+    """
+    Start receiving the infractions matching ``filters`` as they are recorded.
+
+    The subscription buffers up to ``SSE_BUFFER_SIZE`` events and is dropped
+    when a consumer lets it fill up. Callers must close it.
+
+    Raises:
+        BrokerFullError: If ``SSE_MAX_SUBSCRIBERS`` are already listening.
+    """
+    config = current_app.config
+    subscription = infraction_feed.subscribe(
+        filters.matches,
+        maxsize=config.get("SSE_BUFFER_SIZE", 100),
+        max_subscribers=config.get("SSE_MAX_SUBSCRIBERS", 500),
+    )
+    relay.interval = config.get("SSE_RELAY_INTERVAL", 1.0)
+    relay.lookback = config.get("SSE_RELAY_LOOKBACK", 50)
+    relay.ensure_running(current_app._get_current_object())
+    return subscription
+
+
+@use_replica
+@traced
+def get_infractions_after(
+    after_id: int, filters: FeedFilterDTO, limit: int = 500
+) -> List[InfractionEventDTO]:
+    """
+    The infractions recorded after ``after_id`` that match ``filters``, oldest
+    first, so a client that reconnects can catch up on what it missed.
+    """
+    query = select(*_EVENT_COLUMNS).where(Infraction.id > after_id)
+    if filters.officer_id is not None:
+        query = query.where(Infraction.officer_id == filters.officer_id)
+    if filters.license_plate is not None:
+        query = query.where(Infraction.license_plate == filters.license_plate)
+    rows = db.session.execute(query.order_by(Infraction.id).limit(limit))
+    return [InfractionEventDTO(**row._mapping) for row in rows]
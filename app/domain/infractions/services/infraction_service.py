@@ -1,14 +1,26 @@
 from datetime import datetime
-from typing import Dict, Optional, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
 
-from pydantic import BaseModel, Field, field_validator
+from flask import current_app
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.exc import StaleDataError
 
+from app.commons.iterables import chunked
+from app.commons.signals import infraction_created, infractions_changed, notify
 from app.domain.infractions.adapters.person_adapter import BasePersonAdapter
 from app.domain.infractions.adapters.vehicle_adapter import BaseVehicleAdapter
 from app.domain.infractions.adapters.officer_adapter import BaseOfficerAdapter
-from app.domain.infractions.models import Infraction
+from app.domain.infractions.models import Infraction, OutboxEvent
+from app.domain.infractions.services.outbox_service import record_infraction_event
+from app.domain.infractions.services.report_cache import report_cache
 from app.extensions import db
+from app.infrastructure.database import replica_scope, use_primary, use_replica
+from app.infrastructure.log_policy import log_event
 from app.infrastructure.logger import app_logger
+from app.infrastructure.soft_delete import bulk_delete
+from app.infrastructure.versioning import patch_row, version_conflict
+from app.infrastructure.tracing import traced
 
 ########################################
 #             Exceptions               #
@@ -51,6 +63,13 @@ class InfractionDeletionError(InfractionError):
         )
 
 
+class InfractionBulkDeletionError(InfractionError):
+    """Exception raised when a bulk delete of infractions fails."""
+
+    def __init__(self, reason):
+        super().__init__(f"Failed to delete infractions: {reason}")
+
+
 ########################################
 #                  DTO                 #
 ########################################
@@ -70,6 +89,20 @@ class InfractionDTO(BaseModel):
         return value
 
 
+class InfractionPatchDTO(BaseModel):
+    license_plate: Optional[str] = Field(None, alias="placa_patente", min_length=1)
+    timestamp: Optional[datetime] = None
+    comments: Optional[str] = Field(None, alias="comentarios")
+    # Version the client read; the patch fails with a conflict if it changed.
+    version: Optional[int] = None
+
+    @field_validator("timestamp")
+    def validate_timestamp(cls, value):
+        if value is None:
+            return value
+        return InfractionDTO.validate_timestamp(value)
+
+
 class VehicleResponseDTO(BaseModel):
     license_plate: str
     make: str
@@ -92,11 +125,51 @@ class InfractionResponseDTO(BaseModel):
     officer: OfficerResponseDTO
 
 
+class BatchReportRequestDTO(BaseModel):
+    emails: List[EmailStr] = Field(..., min_length=1, max_length=1000)
+
+
+class InfractionBulkDeleteDTO(BaseModel):
+    """Filters are combined; at least one is required."""
+
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=50000)
+    license_plates: Optional[List[str]] = Field(None, min_length=1, max_length=50000)
+    officer_id: Optional[int] = None
+    before: Optional[datetime] = None
+    soft: Optional[bool] = None
+
+    @model_validator(mode="after")
+    def check_filters(self):
+        if all(
+            value is None
+            for value in (self.ids, self.license_plates, self.officer_id, self.before)
+        ):
+            raise ValueError(
+                "At least one of ids, license_plates, officer_id or before is required."
+            )
+        if self.ids is not None and self.license_plates is not None:
+            raise ValueError("Filter by ids or by license_plates, not both.")
+        return self
+
+
 ########################################
 #                Services              #
 ########################################
 
 
+def _infractions_changed(plates: Optional[Iterable[str]]) -> None:
+    notify(infractions_changed, __name__, plates=plates)
+
+
+def _columns(infraction: Infraction) -> Dict[str, Any]:
+    return {
+        column.key: getattr(infraction, column.key)
+        for column in Infraction.__table__.columns
+    }
+
+
+@use_primary
+@traced
 def create_infraction(
     infraction_dto: InfractionDTO,
     vehicle_adapter: BaseVehicleAdapter,
@@ -126,17 +199,25 @@ def create_infraction(
             officer_id=officer.id,
         )
         db.session.add(new_infraction)
+        db.session.flush()
+        # Read before the commit expires them, which would cost a SELECT.
+        created = _columns(new_infraction)
+        record_infraction_event(OutboxEvent.CREATED, created)
         db.session.commit()
-        app_logger.info("Infraction created successfully")
-        return {"message": "Infraction logged successfully"}, 200
+        log_event("infraction.created", infraction_id=created["id"])
     except Exception as e:
         app_logger.error(f"Failed to log infraction: {e}")
         raise InfractionCreationError(str(e))
+    _infractions_changed([vehicle.license_plate])
+    notify(infraction_created, __name__, infraction=created)
+    return {"message": "Infraction logged successfully"}, 200
 
 
+@use_replica
+@traced
 def get_infraction(infraction_id: int) -> InfractionResponseDTO:
 
-    infraction = Infraction.query.get(infraction_id)
+    infraction = db.session.get(Infraction, infraction_id)
     if not infraction:
         app_logger.error(f"Infraction not found: ID {infraction_id}")
         raise InfractionNotFoundError(infraction_id)
@@ -154,7 +235,7 @@ def get_infraction(infraction_id: int) -> InfractionResponseDTO:
         name=infraction.officer.name,
         unique_identifier=infraction.officer.unique_identifier,
     )
-    app_logger.info(infraction.license_plate)
+    log_event("infraction.retrieved", infraction_id=infraction_id)
     return InfractionResponseDTO(
         license_plate=infraction.license_plate,
         timestamp=infraction.timestamp,
@@ -164,38 +245,130 @@ def get_infraction(infraction_id: int) -> InfractionResponseDTO:
     )
 
 
+@use_primary
+@traced
 def update_infraction(
     infraction_id: int, infraction_dto: InfractionDTO
 ) -> Optional[Infraction]:
-    infraction = Infraction.query.get(infraction_id)
+    infraction = db.session.get(Infraction, infraction_id)
     if not infraction:
         app_logger.error(f"Infraction not found for update: ID {infraction_id}")
         raise InfractionNotFoundError(infraction_id)
+    plates = {infraction.license_plate, infraction_dto.license_plate}
+    version = infraction.version
     try:
         infraction.license_plate = infraction_dto.license_plate
         infraction.timestamp = infraction_dto.timestamp
         infraction.comments = infraction_dto.comments
+        db.session.flush()
+        record_infraction_event(OutboxEvent.UPDATED, _columns(infraction))
         db.session.commit()
-        return infraction
+    except StaleDataError:
+        conflict = version_conflict(infraction, version)
+        if conflict is None:
+            raise InfractionNotFoundError(infraction_id)
+        app_logger.warning(conflict.message)
+        raise conflict
     except Exception as e:
         app_logger.error(f"Failed to update infraction: ID {infraction_id}, Error: {e}")
         raise InfractionUpdateError(infraction_id, str(e))
+    _infractions_changed(plates)
+    return infraction
+
+
+@use_primary
+@traced
+def patch_infraction(
+    infraction_id: int, infraction_dto: InfractionPatchDTO
+) -> Dict[str, Any]:
+    """
+    Update only the supplied fields of an infraction with a single UPDATE.
+
+    Raises:
+        InfractionNotFoundError: If the infraction does not exist.
+        VersionConflictError: If the infraction is no longer at ``version``.
+    """
+    values = infraction_dto.dict(exclude_unset=True, exclude_none=True)
+    version = values.pop("version", None)
+    try:
+        row = patch_row(
+            Infraction,
+            infraction_id,
+            values,
+            expected_version=version,
+            before_commit=lambda row: record_infraction_event(OutboxEvent.UPDATED, row),
+        )
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        app_logger.error(f"Failed to patch infraction: ID {infraction_id}, Error: {e}")
+        raise InfractionUpdateError(infraction_id, str(e))
+    if row is None:
+        app_logger.error(f"Infraction not found for patch: ID {infraction_id}")
+        raise InfractionNotFoundError(infraction_id)
+    # The plate it had before a plate change is not known here.
+    _infractions_changed(None if "license_plate" in values else [row.license_plate])
+    return dict(row)
 
 
+@use_primary
+@traced
 def delete_infraction(infraction_id: int) -> bool:
-    infraction = Infraction.query.get(infraction_id)
+    infraction = db.session.get(Infraction, infraction_id)
     if not infraction:
         app_logger.error(f"Infraction not found for deletion: ID {infraction_id}")
         raise InfractionNotFoundError(infraction_id)
+    plate = infraction.license_plate
     try:
+        record_infraction_event(OutboxEvent.DELETED, _columns(infraction))
         db.session.delete(infraction)
         db.session.commit()
-        return True
     except Exception as e:
         app_logger.error(f"Failed to delete infraction: ID {infraction_id}, Error: {e}")
         raise InfractionDeletionError(infraction_id, str(e))
+    _infractions_changed([plate])
+    return True
 
 
+@use_primary
+@traced
+def bulk_delete_infractions(request: InfractionBulkDeleteDTO) -> int:
+    """
+    Delete every infraction matching the request filters in chunked
+    set-based statements, see ``soft_delete.bulk_delete``.
+
+    Returns:
+        int: Number of infractions deleted.
+    """
+    criteria = []
+    if request.officer_id is not None:
+        criteria.append(Infraction.officer_id == request.officer_id)
+    if request.before is not None:
+        criteria.append(Infraction.timestamp < request.before)
+    in_column, in_values = None, None
+    if request.ids is not None:
+        in_column, in_values = Infraction.id, request.ids
+    elif request.license_plates is not None:
+        in_column, in_values = Infraction.license_plate, request.license_plates
+    try:
+        deleted = bulk_delete(
+            Infraction,
+            *criteria,
+            in_column=in_column,
+            in_values=in_values,
+            soft=request.soft,
+        )
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        app_logger.error(f"Bulk delete of infractions failed: {e}")
+        raise InfractionBulkDeletionError(str(e))
+    app_logger.info(f"Bulk deleted {deleted} infractions")
+    if deleted:
+        _infractions_changed(request.license_plates if request.ids is None else None)
+    return deleted
+
+
+@use_replica
+@traced
 def generate_report(email: str, person_adapter: BasePersonAdapter) -> Dict[str, Any]:
     """
     Generates a report of all infractions for vehicles owned by the person with the given email.
@@ -213,24 +386,36 @@ def generate_report(email: str, person_adapter: BasePersonAdapter) -> Dict[str,
             app_logger.error(f"No person found with email: {email}")
             return {"error": "No person found with this email."}
 
-        infractions = []
-        for vehicle in person.vehicles:
-            vehicle_infractions = Infraction.query.filter_by(
-                license_plate=vehicle.license_plate
-            ).all()
-            for infraction in vehicle_infractions:
-                infractions.append(
-                    {
-                        "license_plate": vehicle.license_plate,
-                        "timestamp": infraction.timestamp,
-                        "comments": infraction.comments,
-                    }
+        plates = [vehicle.license_plate for vehicle in person.vehicles]
+        key = report_cache.key(person.email, plates)
+        max_age = current_app.config.get("REPORT_CACHE_TTL", 300)
+        infractions = report_cache.get(key, max_age) if max_age > 0 else None
+        if infractions is None:
+            generation = report_cache.generation
+            infractions = []
+            for plate_chunk in chunked(plates):
+                rows = (
+                    db.session.query(
+                        Infraction.license_plate,
+                        Infraction.timestamp,
+                        Infraction.comments,
+                    )
+                    .filter(Infraction.license_plate.in_(plate_chunk))
+                    .order_by(Infraction.license_plate, Infraction.timestamp)
                 )
+                for license_plate, timestamp, comments in rows:
+                    infractions.append(
+                        {
+                            "license_plate": license_plate,
+                            "timestamp": timestamp,
+                            "comments": comments,
+                        }
+                    )
+            if max_age > 0:
+                report_cache.set(key, infractions, generation)
 
         if not infractions:
-            app_logger.info(
-                f"No infractions found for vehicles owned by the person with email: {email}"
-            )
+            log_event("report.generated", email=email, infractions=0)
             return {"message": "No infractions found for this person's vehicles."}
 
         report = {
@@ -238,12 +423,80 @@ def generate_report(email: str, person_adapter: BasePersonAdapter) -> Dict[str,
                 "name": person.name,
                 "email": person.email,
             },
-            "infractions": infractions,
+            "infractions": list(infractions),
         }
 
-        app_logger.info(f"Report generated for person with email: {email}")
+        log_event("report.generated", email=email, infractions=len(infractions))
         return report
 
     except Exception as e:
         app_logger.error(f"Failed to generate report for email {email}: {e}")
         return {"error": "Failed to generate report due to an internal error."}
+
+
+@traced
+def generate_batch_report(
+    emails: List[str], person_adapter: BasePersonAdapter
+) -> Iterator[Dict[str, Any]]:
+    """
+    Generates the reports of many persons with set-based queries.
+
+    Emails are processed in chunks. Each chunk resolves its persons, their
+    vehicles and all of their infractions in a fixed number of queries, and its
+    reports are yielded before the next chunk is read, so callers can stream
+    large batches.
+
+    Args:
+        emails (List[str]): Email addresses to report on; duplicates are skipped.
+        person_adapter (BasePersonAdapter): Adapter to retrieve person and vehicle data.
+
+    Yields:
+        Dict[str, Any]: One report per email, in request order, with either
+        "person" and "infractions" or an "error".
+    """
+    for chunk in chunked(dict.fromkeys(emails)):
+        with replica_scope():
+            persons = person_adapter.get_persons_by_email(chunk)
+            plates = [
+                vehicle.license_plate
+                for person in persons.values()
+                if person
+                for vehicle in person.vehicles
+            ]
+            infractions_by_plate: Dict[str, List[Dict[str, Any]]] = {}
+            for plate_chunk in chunked(plates):
+                rows = (
+                    db.session.query(
+                        Infraction.license_plate,
+                        Infraction.timestamp,
+                        Infraction.comments,
+                    )
+                    .filter(Infraction.license_plate.in_(plate_chunk))
+                    .order_by(Infraction.license_plate, Infraction.timestamp)
+                )
+                for license_plate, timestamp, comments in rows:
+                    infractions_by_plate.setdefault(license_plate, []).append(
+                        {
+                            "license_plate": license_plate,
+                            "timestamp": timestamp,
+                            "comments": comments,
+                        }
+                    )
+
+        for email in chunk:
+            person = persons.get(email)
+            if not person:
+                yield {"email": email, "error": "No person found with this email."}
+                continue
+            yield {
+                "email": email,
+                "person": {"name": person.name, "email": person.email},
+                "infractions": [
+                    infraction
+                    for vehicle in person.vehicles
+                    for infraction in infractions_by_plate.get(
+                        vehicle.license_plate, []
+                    )
+                ],
+            }
+        log_event("batch_report.chunk_generated", emails=len(chunk))
@@ -0,0 +1,199 @@
+# app/domain/infractions/services/outbox_service.py
+import datetime
+import json
+from typing import Any, Mapping, Optional
+
+from flask import current_app
+from pydantic_core import to_json
+from sqlalchemy import event, func, select
+
+from app.commons.signals import vehicle_plate_changed
+from app.domain.infractions.adapters.outbox_sink import BaseOutboxSink
+from app.domain.infractions.models import Infraction, OutboxCursor, OutboxEvent
+from app.domain.vehicles.models import Vehicle
+from app.extensions import db
+from app.infrastructure.database import use_primary
+from app.infrastructure.logger import app_logger
+from app.infrastructure.soft_delete import before_bulk_delete, bulk_delete
+from app.infrastructure.tracing import traced
+
+DEFAULT_CONSUMER = "default"
+
+########################################
+#               Services               #
+########################################
+
+
+def record_infraction_event(
+    event_type: str, infraction: Mapping[str, Any]
+) -> OutboxEvent:
+    """
+    Add an outbox event for ``infraction``, a mapping of its columns, to the
+    current transaction, so it is committed or rolled back with the change.
+    """
+    event = OutboxEvent(
+        event_type=event_type,
+        infraction_id=infraction["id"],
+        payload=to_json(dict(infraction)).decode(),
+    )
+    db.session.add(event)
+    return event
+
+
+def record_infraction_events(connection, event_type: str, *criteria) -> int:
+    """
+    Add an ``event_type`` outbox event for every infraction matching
+    ``criteria`` that is not soft-deleted, through ``connection``, for changes
+    made by set-based statements or by the database's ON DELETE and ON UPDATE
+    actions rather than one infraction at a time.
+
+    Returns:
+        int: Events added.
+    """
+    table = Infraction.__table__
+    rows = connection.execute(
+        select(table).where(table.c.deleted_at.is_(None), *criteria)
+    ).mappings()
+    events = [
+        {
+            "event_type": event_type,
+            "infraction_id": row["id"],
+            "payload": to_json(dict(row)).decode(),
+        }
+        for row in rows
+    ]
+    if events:
+        connection.execute(OutboxEvent.__table__.insert(), events)
+    return len(events)
+
+
+# Infractions removed by bulk deletes, including those of deleted vehicles.
+@before_bulk_delete(Infraction)
+def _record_bulk_deleted(session, ids) -> None:
+    record_infraction_events(
+        session.connection(), OutboxEvent.DELETED, Infraction.__table__.c.id.in_(ids)
+    )
+
+
+# Infractions the database deletes with a vehicle deleted through the ORM.
+@event.listens_for(Vehicle, "before_delete")
+def _record_vehicle_deleted(mapper, connection, vehicle) -> None:
+    record_infraction_events(
+        connection,
+        OutboxEvent.DELETED,
+        Infraction.__table__.c.license_plate == vehicle.license_plate,
+    )
+
+
+# Infractions the database moved to a vehicle's new plate.
+@vehicle_plate_changed.connect
+def _record_plate_changed(sender, connection, license_plate, **kwargs) -> None:
+    record_infraction_events(
+        connection,
+        OutboxEvent.UPDATED,
+        Infraction.__table__.c.license_plate == license_plate,
+    )
+
+
+@use_primary
+@traced
+def drain_outbox(
+    sink: BaseOutboxSink,
+    consumer: str = DEFAULT_CONSUMER,
+    batch_size: Optional[int] = None,
+    max_batches: Optional[int] = None,
+) -> int:
+    """
+    Hand the outbox events ``consumer`` has not seen yet to ``sink``, oldest
+    first, and advance its cursor after each batch.
+
+    Each batch is one keyset read (``id > cursor ORDER BY id LIMIT n``) and one
+    cursor update in the same transaction, whatever the batch size. Events
+    younger than ``OUTBOX_SETTLE_SECONDS`` stop the batch: an event whose
+    transaction commits after a later id was drained would be skipped for
+    good. Delivery is at least once; a drain that fails between ``send`` and
+    the cursor update sends that batch again next time.
+
+    Returns:
+        int: Events handed to the sink.
+    """
+    config = current_app.config
+    batch_size = batch_size or config.get("OUTBOX_BATCH_SIZE", 1000)
+    settle = datetime.timedelta(seconds=config.get("OUTBOX_SETTLE_SECONDS", 5))
+    drained = batches = 0
+    while max_batches is None or batches < max_batches:
+        cursor = _lock_cursor(consumer)
+        rows = db.session.execute(
+            select(
+                OutboxEvent.id,
+                OutboxEvent.event_type,
+                OutboxEvent.created_at,
+                OutboxEvent.payload,
+            )
+            .where(OutboxEvent.id > cursor.position)
+            .order_by(OutboxEvent.id)
+            .limit(batch_size)
+        ).all()
+        settled_before = datetime.datetime.utcnow() - settle
+        settled = []
+        for row in rows:
+            if row.created_at > settled_before:
+                break
+            settled.append(row)
+        if not settled:
+            db.session.rollback()
+            break
+        try:
+            sink.send([_document(row) for row in settled])
+        except Exception:
+            db.session.rollback()
+            raise
+        cursor.position = settled[-1].id
+        db.session.commit()
+        drained += len(settled)
+        batches += 1
+        if len(settled) < batch_size:
+            break
+    if drained:
+        app_logger.info(f"Drained {drained} outbox events to {consumer}")
+    return drained
+
+
+@use_primary
+@traced
+def purge_drained_events(older_than: datetime.timedelta) -> int:
+    """
+    Delete outbox events older than ``older_than`` that every consumer has
+    drained.
+
+    Returns:
+        int: Events removed.
+    """
+    position = db.session.execute(select(func.min(OutboxCursor.position))).scalar()
+    if position is None:
+        return 0
+    cutoff = datetime.datetime.utcnow() - older_than
+    return bulk_delete(
+        OutboxEvent, OutboxEvent.id <= position, OutboxEvent.created_at < cutoff
+    )
+
+
+def _lock_cursor(consumer: str) -> OutboxCursor:
+    # Locked until the batch commits, so concurrent drains of one consumer
+    # take turns instead of sending the same events.
+    cursor = db.session.get(
+        OutboxCursor, consumer, with_for_update=True, populate_existing=True
+    )
+    if cursor is None:
+        cursor = OutboxCursor(consumer=consumer, position=0)
+        db.session.add(cursor)
+    return cursor
+
+
+def _document(row) -> str:
+    # The payload is already JSON; it is embedded as is rather than re-parsed.
+    return (
+        f'{{"id": {row.id}, "type": {json.dumps(row.event_type)}, '
+        f'"created_at": "{row.created_at.isoformat()}", '
+        f'"infraction": {row.payload}}}'
+    )
@@ -0,0 +1,91 @@
+# app/domain/infractions/services/report_cache.py
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+from app.commons.signals import infractions_changed, vehicles_changed
+from app.infrastructure.cache import LRUCache
+
+ReportKey = Tuple[str, FrozenSet[str]]
+
+
+class ReportCache:
+    """
+    Infractions of a report, keyed by the owner's email and set of plates.
+
+    A change of ownership changes the set of plates and so the key, and every
+    write to the infractions or vehicles of a plate drops the entries that
+    include it (see ``invalidate``). Readers also pass a ``max_age``:
+    invalidation only reaches the process that made the change, and reports
+    read from a replica may lag behind it.
+    """
+
+    def __init__(self, maxsize: int = 2048):
+        self.generation = 0
+        self._entries = LRUCache("reports", maxsize=maxsize, on_evict=self._forget)
+        self._keys_by_plate: Dict[str, Set[ReportKey]] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def key(email: str, plates: Iterable[str]) -> ReportKey:
+        return email.lower(), frozenset(plates)
+
+    def get(
+        self, key: ReportKey, max_age: float
+    ) -> Optional[Tuple[Dict[str, Any], ...]]:
+        """Infractions stored for ``key`` less than ``max_age`` seconds ago."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, infractions = entry
+        if time.monotonic() - stored_at > max_age:
+            return None
+        return infractions
+
+    def set(
+        self, key: ReportKey, infractions: Iterable[Dict[str, Any]], generation: int
+    ) -> None:
+        """
+        Store the infractions of ``key`` computed since ``generation``; they are
+        dropped when anything was invalidated in the meantime.
+        """
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries.set(key, (time.monotonic(), tuple(infractions)))
+            for plate in key[1]:
+                self._keys_by_plate.setdefault(plate, set()).add(key)
+
+    def invalidate(self, plates: Optional[Iterable[str]]) -> None:
+        """Drop every entry including one of ``plates``, or all when None."""
+        with self._lock:
+            self.generation += 1
+            if plates is None:
+                self._entries.clear()
+                self._keys_by_plate.clear()
+                return
+            for plate in plates:
+                for key in self._keys_by_plate.pop(plate, ()):
+                    self._entries.discard(key)
+                    self._forget(key)
+
+    def clear(self) -> None:
+        self.invalidate(None)
+
+    def _forget(self, key: ReportKey, entry: Any = None) -> None:
+        with self._lock:
+            for plate in key[1]:
+                keys = self._keys_by_plate.get(plate)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._keys_by_plate[plate]
+
+
+report_cache = ReportCache()
+
+
+@infractions_changed.connect
+@vehicles_changed.connect
+def _invalidate_reports(sender, plates: Optional[Iterable[str]] = None, **kwargs):
+    report_cache.invalidate(plates)
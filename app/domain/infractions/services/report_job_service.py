@@ -0,0 +1,180 @@
+# app/domain/infractions/services/report_job_service.py
+import datetime
+from typing import Optional
+
+from flask import current_app, json
+from pydantic import BaseModel, EmailStr
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.domain.infractions.adapters.person_adapter import BasePersonAdapter
+from app.domain.infractions.models import ReportJob
+from app.domain.infractions.services.infraction_service import generate_report
+from app.extensions import db, job_runner
+from app.infrastructure.database import use_primary
+from app.infrastructure.jobs import JobRunner
+from app.infrastructure.logger import app_logger
+from app.infrastructure.tracing import traced
+
+########################################
+#             Exceptions               #
+########################################
+
+
+class ReportJobError(Exception):
+    """Base class for report job exceptions."""
+
+
+class ReportJobNotFoundError(ReportJobError):
+    """Exception raised when a job does not exist or belongs to someone else."""
+
+    def __init__(self, job_id):
+        self.message = f"Report job {job_id} not found."
+        super().__init__(self.message)
+
+
+class ReportJobNotReadyError(ReportJobError):
+    """Exception raised when downloading a job that has not finished."""
+
+    def __init__(self, job_id, status):
+        self.message = f"Report job {job_id} is {status}, no result to download."
+        super().__init__(self.message)
+
+
+########################################
+#                  DTO                 #
+########################################
+
+
+class ReportRequestDTO(BaseModel):
+    email: EmailStr
+
+
+class ReportJobDTO(BaseModel):
+    id: str
+    email: str
+    status: str
+    created_at: datetime.datetime
+    started_at: Optional[datetime.datetime]
+    finished_at: Optional[datetime.datetime]
+    error: Optional[str]
+
+    @classmethod
+    def from_job(cls, job: ReportJob) -> "ReportJobDTO":
+        return cls(
+            id=job.id,
+            email=job.email,
+            status=job.status,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            error=job.error,
+        )
+
+
+########################################
+#               Helpers                #
+########################################
+
+
+def _finish(job: ReportJob, status: str, **values) -> None:
+    job.status = status
+    for name, value in values.items():
+        setattr(job, name, value)
+    job.finished_at = datetime.datetime.utcnow()
+    db.session.commit()
+
+
+########################################
+#                Services              #
+########################################
+
+
+@use_primary
+@traced
+def enqueue_report(
+    email: str,
+    requested_by: str,
+    person_adapter: BasePersonAdapter,
+    runner: JobRunner = job_runner,
+) -> ReportJobDTO:
+    """
+    Persist a queued report job for ``email`` and hand it to the worker pool.
+
+    Returns:
+        ReportJobDTO: The job as stored, usually still queued.
+    """
+    job = ReportJob(email=email, requested_by=str(requested_by))
+    db.session.add(job)
+    db.session.commit()
+    app_logger.info(f"Report job {job.id} queued for {email}")
+    dto = ReportJobDTO.from_job(job)
+    runner.submit(run_report_job, job.id, person_adapter)
+    return dto
+
+
+@use_primary
+@traced
+def run_report_job(job_id: str, person_adapter: BasePersonAdapter) -> None:
+    """Build the report of a queued job and store the result or the error."""
+    job = db.session.get(ReportJob, job_id)
+    if job is None or job.status != ReportJob.QUEUED:
+        return
+    job.status = ReportJob.RUNNING
+    job.started_at = datetime.datetime.utcnow()
+    db.session.commit()
+
+    try:
+        report = generate_report(job.email, person_adapter)
+    except Exception as e:
+        report = {"error": str(e)}
+
+    if "error" in report:
+        # A failed statement may have left the session unusable until rolled
+        # back, which would keep the job RUNNING until it times out.
+        db.session.rollback()
+        _finish(job, ReportJob.FAILED, error=report["error"])
+    else:
+        try:
+            _finish(job, ReportJob.DONE, result=json.dumps(report))
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            app_logger.error(f"Failed to store the result of report job {job_id}: {e}")
+            _finish(job, ReportJob.FAILED, error="Failed to store the report.")
+    app_logger.info(f"Report job {job_id} finished as {job.status}")
+
+
+@use_primary
+@traced
+def get_report_job(job_id: str, requested_by: str) -> ReportJob:
+    """
+    Fetch a job owned by ``requested_by``.
+
+    Jobs still queued or running after ``REPORT_JOB_TIMEOUT`` seconds are
+    marked as failed, since the worker that owned them is gone.
+    """
+    job = db.session.get(ReportJob, job_id)
+    if job is None or job.requested_by != str(requested_by):
+        raise ReportJobNotFoundError(job_id)
+
+    timeout = datetime.timedelta(
+        seconds=current_app.config.get("REPORT_JOB_TIMEOUT", 3600)
+    )
+    if (
+        job.status in (ReportJob.QUEUED, ReportJob.RUNNING)
+        and datetime.datetime.utcnow() - job.created_at > timeout
+    ):
+        job.status = ReportJob.FAILED
+        job.error = "Report job timed out."
+        job.finished_at = datetime.datetime.utcnow()
+        db.session.commit()
+        app_logger.error(f"Report job {job_id} timed out")
+    return job
+
+
+@traced
+def get_report_result(job_id: str, requested_by: str) -> str:
+    """Return the finished report of a job as a JSON document."""
+    job = get_report_job(job_id, requested_by)
+    if job.status != ReportJob.DONE:
+        raise ReportJobNotReadyError(job_id, job.status)
+    return job.result
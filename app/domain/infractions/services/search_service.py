@@ -0,0 +1,290 @@
+# app/domain/infractions/services/search_service.py
+import re
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import DateTime, Float, Integer, func, select, text
+
+from app.domain.infractions.adapters.vehicle_adapter import BaseVehicleAdapter
+from app.domain.infractions.models import Infraction
+from app.domain.infractions.models.infractions import COMMENTS_FTS_TABLE
+from app.extensions import db
+from app.infrastructure.database import use_replica
+from app.infrastructure.logger import app_logger
+from app.infrastructure.tracing import traced
+
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100
+MAX_TERMS = 16
+
+########################################
+#             Exceptions               #
+########################################
+
+
+class InvalidSearchQueryError(Exception):
+    """Exception raised when a search request cannot be run."""
+
+    def __init__(self, reason):
+        self.message = f"Invalid search: {reason}"
+        super().__init__(self.message)
+
+
+########################################
+#                  DTO                 #
+########################################
+
+
+class InfractionSearchHitDTO(BaseModel):
+    id: int
+    license_plate: str
+    timestamp: Optional[datetime]
+    comments: Optional[str]
+    rank: float
+    # Filled in when the search is given a vehicle adapter.
+    make: Optional[str] = None
+    model: Optional[str] = None
+
+
+class InfractionSearchPageDTO(BaseModel):
+    query: str
+    page: int
+    per_page: int
+    has_more: bool
+    results: List[InfractionSearchHitDTO]
+
+
+class PlateInfractionsDTO(BaseModel):
+    license_plate: str
+    make: str
+    model: str
+    distance: int
+    infractions: int
+    last_infraction_at: Optional[datetime]
+
+
+########################################
+#               Backends               #
+########################################
+
+
+class BaseInfractionSearchBackend(ABC):
+    """
+    Ranked full-text search over ``Infraction.comments``.
+
+    Every term must match. Raw statements bypass the session's soft-delete
+    criteria, so they skip deleted rows themselves. Results are ordered best
+    first; ``rank`` is backend-specific but always "higher is better".
+    Statements declare their column types so SQLite returns datetimes rather
+    than strings.
+    """
+
+    @abstractmethod
+    def search(
+        self, terms: List[str], limit: int, offset: int
+    ) -> List[InfractionSearchHitDTO]:
+        pass
+
+    @staticmethod
+    def _to_hits(rows) -> List[InfractionSearchHitDTO]:
+        return [
+            InfractionSearchHitDTO(
+                id=row.id,
+                license_plate=row.license_plate,
+                timestamp=row.timestamp,
+                comments=row.comments,
+                rank=row.rank,
+            )
+            for row in rows
+        ]
+
+
+class SqliteInfractionSearchBackend(BaseInfractionSearchBackend):
+    """Uses the FTS5 table kept in sync by triggers on ``infractions``."""
+
+    statement = text(
+        "SELECT i.id, i.license_plate, i.timestamp, i.comments, "
+        f"-bm25({COMMENTS_FTS_TABLE}) AS rank "
+        f"FROM {COMMENTS_FTS_TABLE} "
+        f"JOIN infractions AS i ON i.id = {COMMENTS_FTS_TABLE}.rowid "
+        f"WHERE {COMMENTS_FTS_TABLE} MATCH :query AND i.deleted_at IS NULL "
+        "ORDER BY rank DESC, i.id DESC LIMIT :limit OFFSET :offset"
+    ).columns(id=Integer, timestamp=DateTime, rank=Float)
+
+    def search(
+        self, terms: List[str], limit: int, offset: int
+    ) -> List[InfractionSearchHitDTO]:
+        # Quoting every term keeps FTS5 operators typed by users inert.
+        query = " ".join(f'"{term}"' for term in terms)
+        rows = db.session.execute(
+            self.statement,
+            {"query": query, "limit": limit, "offset": offset},
+            bind_arguments={"mapper": Infraction.__mapper__},
+        )
+        return self._to_hits(rows)
+
+
+class PostgresInfractionSearchBackend(BaseInfractionSearchBackend):
+    """Uses the GIN index on ``to_tsvector('simple', comments)``."""
+
+    # The tsvector expression must match the index definition exactly.
+    statement = text(
+        "SELECT i.id, i.license_plate, i.timestamp, i.comments, "
+        "ts_rank_cd(to_tsvector('simple', coalesce(i.comments, '')), q) "
+        "AS rank "
+        "FROM infractions AS i, to_tsquery('simple', :query) AS q "
+        "WHERE to_tsvector('simple', coalesce(i.comments, '')) @@ q "
+        "AND i.deleted_at IS NULL "
+        "ORDER BY rank DESC, i.id DESC LIMIT :limit OFFSET :offset"
+    ).columns(id=Integer, timestamp=DateTime, rank=Float)
+
+    def search(
+        self, terms: List[str], limit: int, offset: int
+    ) -> List[InfractionSearchHitDTO]:
+        rows = db.session.execute(
+            self.statement,
+            {"query": " & ".join(terms), "limit": limit, "offset": offset},
+            bind_arguments={"mapper": Infraction.__mapper__},
+        )
+        return self._to_hits(rows)
+
+
+_backends = {
+    "sqlite": SqliteInfractionSearchBackend,
+    "postgresql": PostgresInfractionSearchBackend,
+}
+
+
+def get_search_backend() -> BaseInfractionSearchBackend:
+    """Pick the backend matching the dialect the search query will run on."""
+    dialect = db.session.get_bind(mapper=Infraction.__mapper__).dialect.name
+    backend = _backends.get(dialect)
+    if backend is None:
+        raise InvalidSearchQueryError(f"full-text search is not available on {dialect}")
+    return backend()
+
+
+########################################
+#                Services              #
+########################################
+
+
+def tokenize_query(query: str) -> List[str]:
+    """Split a user query into lower-cased word terms, dropping any syntax."""
+    return re.findall(r"\w+", (query or "").lower())[:MAX_TERMS]
+
+
+@use_replica
+@traced
+def search_infractions(
+    query: str,
+    page: int = 1,
+    per_page: int = DEFAULT_PER_PAGE,
+    backend: Optional[BaseInfractionSearchBackend] = None,
+    vehicle_adapter: Optional[BaseVehicleAdapter] = None,
+) -> InfractionSearchPageDTO:
+    """
+    Search infraction comments for every word in ``query``.
+
+    Args:
+        query (str): Free text such as "school zone"; all words must match.
+        page (int): 1-based page number.
+        per_page (int): Page size, capped at MAX_PER_PAGE.
+        backend (BaseInfractionSearchBackend): Defaults to the one for the
+            current database.
+        vehicle_adapter (BaseVehicleAdapter): If given, resolves the make and
+            model of each hit's vehicle with one multi-get for the page.
+
+    Returns:
+        InfractionSearchPageDTO: One page of hits, best ranked first.
+    """
+    terms = tokenize_query(query)
+    if not terms:
+        raise InvalidSearchQueryError("the query has no searchable words")
+    if page < 1 or per_page < 1:
+        raise InvalidSearchQueryError("page and per_page must be positive")
+    per_page = min(per_page, MAX_PER_PAGE)
+
+    backend = backend or get_search_backend()
+    # One extra row tells whether a next page exists without counting matches.
+    hits = backend.search(terms, limit=per_page + 1, offset=(page - 1) * per_page)
+    app_logger.info(f"Infraction search for {terms} returned {len(hits)} hits")
+    results = hits[:per_page]
+    if vehicle_adapter is not None:
+        vehicles = vehicle_adapter.get_vehicles(hit.license_plate for hit in results)
+        for hit in results:
+            vehicle = vehicles.get(hit.license_plate)
+            if vehicle is not None:
+                hit.make, hit.model = vehicle.make, vehicle.model
+    return InfractionSearchPageDTO(
+        query=query,
+        page=page,
+        per_page=per_page,
+        has_more=len(hits) > per_page,
+        results=results,
+    )
+
+
+@use_replica
+@traced
+def search_infractions_by_plate(
+    query: str,
+    vehicle_adapter: BaseVehicleAdapter,
+    mode: str = "fuzzy",
+    limit: int = 10,
+) -> List[PlateInfractionsDTO]:
+    """
+    Find the plates starting with or resembling ``query``, e.g. one read with a
+    character wrong, and how many infractions each has.
+
+    Infractions point at vehicles by plate, so the vehicle plate indexes find
+    them; their counts then take one grouped query over the matched plates.
+
+    Args:
+        query (str): Full or partial plate.
+        vehicle_adapter (BaseVehicleAdapter): Runs the plate search.
+        mode (str): "prefix" or "fuzzy".
+        limit (int): Plates to return.
+
+    Returns:
+        List[PlateInfractionsDTO]: Matched plates, best match first, including
+        those without infractions.
+    """
+    try:
+        matches = vehicle_adapter.search_plates(query, mode=mode, limit=limit)
+    except ValueError as e:
+        raise InvalidSearchQueryError(str(e)) from e
+    if not matches:
+        return []
+    counts = {
+        row.license_plate: row
+        for row in db.session.execute(
+            select(
+                Infraction.license_plate,
+                func.count().label("infractions"),
+                func.max(Infraction.timestamp).label("last_infraction_at"),
+            )
+            .where(
+                Infraction.license_plate.in_(
+                    [match.vehicle.license_plate for match in matches]
+                )
+            )
+            .group_by(Infraction.license_plate)
+        )
+    }
+    results = []
+    for match in matches:
+        row = counts.get(match.vehicle.license_plate)
+        results.append(
+            PlateInfractionsDTO(
+                license_plate=match.vehicle.license_plate,
+                make=match.vehicle.make,
+                model=match.vehicle.model,
+                distance=match.distance,
+                infractions=row.infractions if row else 0,
+                last_infraction_at=row.last_infraction_at if row else None,
+            )
+        )
+    return results
@@ -1,16 +1,27 @@
 from flask import Blueprint, request
+from flask_jwt_extended import get_jwt, jwt_required
 from pydantic import ValidationError
 
 from app.commons.responses import handle_api_response
 from app.domain.users.services.officer_service import (
     OfficerDTO,
+    OfficerNotFoundError,
+    OfficerPatchDTO,
+    OfficerUpdateError,
     authenticate_officer,
     create_officer,
     delete_officer,
     get_officer_by_id,
+    patch_officer,
     update_officer,
 )
+from app.domain.users.services.token_service import (
+    TokenRevokedError,
+    revoke_token,
+    rotate_refresh_token,
+)
 from app.infrastructure.logger import app_logger
+from app.infrastructure.versioning import VersionConflictError
 
 officer_blueprint = Blueprint("officers", __name__)
 
@@ -59,6 +70,11 @@ def edit_officer(officer_id):
             "Validation error occurred while updating an officer.", exc_info=True
         )
         return handle_api_response(error={"errors": e.errors()}, status_code=400)
+    except VersionConflictError as e:
+        return handle_api_response(
+            error={"message": e.message, "version": e.current_version},
+            status_code=409,
+        )
     except Exception as e:
         app_logger.error(
             "Unexpected error occurred while updating an officer.", exc_info=True
@@ -66,6 +82,27 @@ def edit_officer(officer_id):
         return handle_api_response(error={"message": str(e)}, status_code=500)
 
 
+@officer_blueprint.route("/<int:officer_id>", methods=["PATCH"])
+def patch_officer_endpoint(officer_id):
+    """Endpoint to change some fields of an officer in one statement."""
+    try:
+        officer = patch_officer(officer_id, OfficerPatchDTO(**(request.json or {})))
+        return handle_api_response(data=officer)
+    except ValidationError as e:
+        return handle_api_response(
+            error={"errors": e.errors(include_context=False)}, status_code=400
+        )
+    except OfficerNotFoundError as e:
+        return handle_api_response(error={"message": e.message}, status_code=404)
+    except VersionConflictError as e:
+        return handle_api_response(
+            error={"message": e.message, "version": e.current_version},
+            status_code=409,
+        )
+    except OfficerUpdateError as e:
+        return handle_api_response(error={"message": e.message}, status_code=500)
+
+
 @officer_blueprint.route("/<int:officer_id>", methods=["GET"])
 def get_officer(officer_id):
     """Endpoint to retrieve an officer by ID."""
@@ -109,15 +146,15 @@ def remove_officer(officer_id):
 def login_officer():
     """
     Endpoint for officer login. Expects JSON containing 'unique_identifier' and 'password'.
-    Returns a JWT token if the credentials are valid.
+    Returns an access token and a refresh token if the credentials are valid.
     """
     unique_identifier = request.json.get("unique_identifier")
     password = request.json.get("password")
     try:
-        token = authenticate_officer(unique_identifier, password)
-        if token:
+        tokens = authenticate_officer(unique_identifier, password)
+        if tokens:
             app_logger.info(f"Officer {unique_identifier} logged in successfully.")
-            return handle_api_response(data={"access_token": token})
+            return handle_api_response(data=tokens.dict())
         else:
             app_logger.warning(f"Invalid credentials for officer {unique_identifier}.")
             return handle_api_response(
@@ -128,3 +165,29 @@ def login_officer():
             "Unexpected error occurred during officer login.", exc_info=True
         )
         return handle_api_response(error={"message": str(e)}, status_code=500)
+
+
+@officer_blueprint.route("/refresh", methods=["POST"])
+@jwt_required(refresh=True)
+def refresh_officer_token():
+    """
+    Exchange a refresh token for a new access and refresh token pair.
+
+    Each refresh token works once; presenting it again returns 401.
+    """
+    try:
+        tokens = rotate_refresh_token(get_jwt())
+        return handle_api_response(data=tokens.dict())
+    except TokenRevokedError as e:
+        return handle_api_response(error={"msg": e.message}, status_code=401)
+
+
+@officer_blueprint.route("/logout", methods=["POST"])
+@jwt_required(refresh=True)
+def logout_officer():
+    """Revoke the refresh token that ends the session."""
+    try:
+        revoke_token(get_jwt())
+    except TokenRevokedError:
+        pass
+    return handle_api_response(data={"message": "Logged out"})
@@ -2,12 +2,19 @@ from flask import Blueprint, request
 from pydantic import ValidationError
 
 from app.commons.responses import handle_api_response
+from app.infrastructure.versioning import VersionConflictError
 from app.domain.users.services.person_services import (
+    PersonBulkDeleteDTO,
+    PersonBulkDeletionError,
     PersonDTO,
+    PersonPatchDTO,
+    bulk_delete_persons,
     create_person,
     delete_person,
     get_person,
+    patch_person,
     update_person,
+    PersonAlreadyExistsError,
     PersonNotFoundError,
     PersonCreationError,
     PersonUpdateError,
@@ -28,6 +35,8 @@ def add_person():
         )
     except ValidationError as e:
         return handle_api_response(error={"errors": e.errors()}, status_code=400)
+    except PersonAlreadyExistsError as e:
+        return handle_api_response(error={"message": str(e)}, status_code=409)
     except PersonCreationError as e:
         return handle_api_response(error={"message": str(e)}, status_code=500)
 
@@ -58,6 +67,37 @@ def modify_person(person_id):
         return handle_api_response(
             error={"message": "Person not found"}, status_code=404
         )
+    except PersonAlreadyExistsError as e:
+        return handle_api_response(error={"message": str(e)}, status_code=409)
+    except VersionConflictError as e:
+        return handle_api_response(
+            error={"message": e.message, "version": e.current_version},
+            status_code=409,
+        )
+    except PersonUpdateError as e:
+        return handle_api_response(error={"message": str(e)}, status_code=500)
+
+
+@person_blueprint.route("/<int:person_id>", methods=["PATCH"])
+def patch_person_endpoint(person_id):
+    try:
+        person = patch_person(person_id, PersonPatchDTO(**(request.json or {})))
+        return handle_api_response(data=person)
+    except ValidationError as e:
+        return handle_api_response(
+            error={"errors": e.errors(include_context=False)}, status_code=400
+        )
+    except PersonNotFoundError:
+        return handle_api_response(
+            error={"message": "Person not found"}, status_code=404
+        )
+    except PersonAlreadyExistsError as e:
+        return handle_api_response(error={"message": str(e)}, status_code=409)
+    except VersionConflictError as e:
+        return handle_api_response(
+            error={"message": e.message, "version": e.current_version},
+            status_code=409,
+        )
     except PersonUpdateError as e:
         return handle_api_response(error={"message": str(e)}, status_code=500)
 
@@ -73,3 +113,17 @@ def remove_person(person_id):
         )
     except PersonDeletionError as e:
         return handle_api_response(error={"message": str(e)}, status_code=500)
+
+
+@person_blueprint.route("/bulk_delete", methods=["POST"])
+def bulk_remove_persons():
+    """Delete the persons listed by id or email in the body."""
+    try:
+        deleted = bulk_delete_persons(PersonBulkDeleteDTO(**(request.json or {})))
+        return handle_api_response(data={"deleted": deleted})
+    except ValidationError as e:
+        return handle_api_response(
+            error={"errors": e.errors(include_context=False)}, status_code=400
+        )
+    except PersonBulkDeletionError as e:
+        return handle_api_response(error={"message": e.message}, status_code=500)
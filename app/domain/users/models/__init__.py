@@ -1,2 +1,3 @@
 from app.domain.users.models.officer import Officer
 from app.domain.users.models.person import Person
+from app.domain.users.models.revoked_token import RevokedToken
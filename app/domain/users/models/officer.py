@@ -1,9 +1,10 @@
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from app.extensions import db
+from app.infrastructure.versioning import VersionedMixin
 
 
-class Officer(db.Model):
+class Officer(VersionedMixin, db.Model):
     """Represents a police officer who can log traffic violations."""
 
     __tablename__ = "officers"
@@ -1,16 +1,35 @@
 # app/domain/users/models.py
 from app.extensions import db
+from app.infrastructure.soft_delete import SoftDeleteMixin
+from app.infrastructure.versioning import VersionedMixin
 
 
-class Person(db.Model):
+class Person(SoftDeleteMixin, VersionedMixin, db.Model):
     __tablename__ = "persons"
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(255), nullable=False)
     email = db.Column(db.String(255), nullable=False)
+    # The database detaches a deleted person's vehicles (ON DELETE SET NULL),
+    # so the ORM does not load them to do it.
     vehicles = db.relationship(
-        "Vehicle", backref=db.backref("owner", uselist=False), lazy=True
+        "Vehicle",
+        backref=db.backref("owner", uselist=False),
+        lazy=True,
+        passive_deletes=True,
     )
 
     def __repr__(self):
         return f"<Person {self.name}>"
+
+
+# Emails are compared case-insensitively: every lookup filters on lower(email)
+# so it can use this index, which also rejects case-variant duplicates among
+# the persons that are not soft-deleted.
+db.Index(
+    "ix_persons_email_lower",
+    db.func.lower(Person.email),
+    unique=True,
+    sqlite_where=Person.deleted_at.is_(None),
+    postgresql_where=Person.deleted_at.is_(None),
+)
@@ -0,0 +1,18 @@
+import datetime
+
+from app.extensions import db
+
+
+class RevokedToken(db.Model):
+    """A refresh token that can no longer be used, identified by its ``jti``."""
+
+    __tablename__ = "revoked_tokens"
+
+    jti = db.Column(db.String(36), primary_key=True)
+    identity = db.Column(db.String(255), nullable=False)
+    # Rows are only needed until the token would have expired anyway.
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    revoked_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+
+    def __repr__(self):
+        return f"<RevokedToken {self.jti}>"
@@ -1,12 +1,18 @@
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional
 
-from flask_jwt_extended import create_access_token
 from pydantic import BaseModel, Field
-from werkzeug.security import check_password_hash
+from werkzeug.security import check_password_hash, generate_password_hash
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.exc import StaleDataError
+from app.commons.iterables import chunked
 from app.domain.users.models import Officer
-from app.extensions import db
+from app.domain.users.services.token_service import TokenPairDTO, issue_tokens
+from app.extensions import db, warmup
+from app.infrastructure.database import use_primary, use_replica
 from app.infrastructure.logger import app_logger
+from app.infrastructure.versioning import patch_row, version_conflict
+from app.infrastructure.tracing import traced
 
 ########################################
 #             Exceptions               #
@@ -84,6 +90,11 @@ class OfficerDTO(BaseModel):
     )
 
 
+class OfficerPatchDTO(OfficerDTO):
+    # Version the client read; the patch fails with a conflict if it changed.
+    version: Optional[int] = None
+
+
 class OfficerResponseDTO(BaseModel):
     name: str = Field(..., description="Name of the officer.")
     unique_identifier: str = Field(
@@ -100,6 +111,7 @@ class OfficerResponseDTO(BaseModel):
 ########################################
 
 
+@traced
 def create_officer(officer_dto: OfficerDTO) -> int:
     """
     Creates a new officer record in the database using the provided officer data transfer object (DTO).
@@ -126,6 +138,7 @@ def create_officer(officer_dto: OfficerDTO) -> int:
         raise OfficerCreationError(reason=str(e))
 
 
+@traced
 def update_officer(officer_id: int, officer_dto: OfficerDTO) -> Optional[int]:
     """
     Updates an existing officer record identified by the officer_id with the details provided in the officer DTO.
@@ -139,9 +152,10 @@ def update_officer(officer_id: int, officer_dto: OfficerDTO) -> Optional[int]:
         Optional[int]: The ID of the updated officer if the update was successful, or None if no officer was found.
     """
     try:
-        officer = Officer.query.get(officer_id)
+        officer = db.session.get(Officer, officer_id)
         if not officer:
             raise OfficerNotFoundError(officer_id)
+        version = officer.version
 
         # Actualizar solo los campos proporcionados en el DTO
         for key, value in officer_dto.dict(exclude_unset=True).items():
@@ -157,11 +171,53 @@ def update_officer(officer_id: int, officer_dto: OfficerDTO) -> Optional[int]:
     except OfficerNotFoundError as e:
         app_logger.warning(e.message)
         raise
+    except StaleDataError:
+        conflict = version_conflict(officer, version)
+        if conflict is None:
+            raise OfficerNotFoundError(officer_id)
+        app_logger.warning(conflict.message)
+        raise conflict
     except Exception as e:
         app_logger.error(f"Failed to update officer with ID {officer_id}: {e}")
         raise OfficerUpdateError(officer_id, reason=str(e))
 
 
+@use_primary
+@traced
+def patch_officer(officer_id: int, officer_dto: OfficerPatchDTO) -> Dict[str, Any]:
+    """
+    Updates only the supplied fields of an officer with a single UPDATE statement.
+
+    Args:
+        officer_id (int): The ID of the officer to update.
+        officer_dto (OfficerPatchDTO): Fields to change and, optionally, the version they were based on.
+
+    Returns:
+        Dict[str, Any]: The updated officer without the password hash.
+
+    Raises:
+        OfficerNotFoundError: If the officer does not exist.
+        VersionConflictError: If the officer is no longer at ``version``.
+    """
+    values = officer_dto.dict(exclude_unset=True, exclude_none=True)
+    version = values.pop("version", None)
+    if "password" in values:
+        values["password_hash"] = generate_password_hash(values.pop("password"))
+    try:
+        row = patch_row(Officer, officer_id, values, expected_version=version)
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        app_logger.error(f"Failed to patch officer with ID {officer_id}: {e}")
+        raise OfficerUpdateError(officer_id, reason=str(e))
+    if row is None:
+        raise OfficerNotFoundError(officer_id)
+    officer = dict(row)
+    officer.pop("password_hash")
+    return officer
+
+
+@use_replica
+@traced
 def get_officer_by_id(officer_id: int) -> Optional[OfficerResponseDTO]:
     """
     Retrieves the details of an officer by their unique identifier, excluding sensitive information like password.
@@ -173,7 +229,7 @@ def get_officer_by_id(officer_id: int) -> Optional[OfficerResponseDTO]:
         Optional[OfficerResponseDTO]: An officer response DTO containing non-sensitive data if the officer exists, otherwise None.
     """
     try:
-        officer = Officer.query.get(officer_id)
+        officer = db.session.get(Officer, officer_id)
         if not officer:
             raise OfficerNotFoundError(officer_id)
         officer_dto = OfficerResponseDTO.model_validate(officer)
@@ -186,6 +242,7 @@ def get_officer_by_id(officer_id: int) -> Optional[OfficerResponseDTO]:
         raise OfficerError(f"An error occurred while retrieving officer: {e}")
 
 
+@traced
 def delete_officer(officer_id: int) -> bool:
     """
     Deletes an officer record from the database based on the officer's unique identifier.
@@ -197,7 +254,7 @@ def delete_officer(officer_id: int) -> bool:
         None: Indicates successful deletion of the officer.
     """
     try:
-        officer = Officer.query.get(officer_id)
+        officer = db.session.get(Officer, officer_id)
         if not officer:
             raise OfficerNotFoundError(officer_id)
         db.session.delete(officer)
@@ -211,22 +268,50 @@ def delete_officer(officer_id: int) -> bool:
         raise OfficerDeletionError(officer_id, reason=str(e))
 
 
-def authenticate_officer(unique_identifier: str, password: str) -> Optional[str]:
+def _find_by_unique_identifier(unique_identifier: str) -> Optional[Officer]:
+    return (
+        db.session.execute(
+            lambda_stmt(
+                lambda: select(Officer)
+                .where(Officer.unique_identifier == unique_identifier)
+                .limit(1)
+            )
+        )
+        .scalars()
+        .first()
+    )
+
+
+OFFICER_ID_CLAIM = "officer_id"
+OFFICER_NAME_CLAIM = "name"
+
+
+def officer_claims(officer: Officer) -> Dict[str, object]:
+    """Claims signed into officer tokens so requests can skip the officer lookup."""
+    return {OFFICER_ID_CLAIM: officer.id, OFFICER_NAME_CLAIM: officer.name}
+
+
+@traced
+def authenticate_officer(unique_identifier: str, password: str) -> TokenPairDTO:
     """
     Authenticates an officer using their unique identifier and password.
 
+    This is the only place passwords are hashed; sessions are then extended
+    with the refresh token, see ``token_service.rotate_refresh_token``.
+
     Args:
         unique_identifier (str): The unique identifier of the officer.
         password (str): The password for the officer.
 
     Returns:
-        Optional[str]: Returns a JWT access token if authentication is successful, otherwise None.
+        TokenPairDTO: A fresh access token and a refresh token, both carrying
+        the officer's id and name as claims, see ``officer_claims``.
     """
     try:
-        officer = Officer.query.filter_by(unique_identifier=unique_identifier).first()
+        officer = _find_by_unique_identifier(unique_identifier)
         if not officer or not check_password_hash(officer.password_hash, password):
             raise AuthenticationError(unique_identifier)
-        return create_access_token(identity=unique_identifier)
+        return issue_tokens(unique_identifier, officer_claims(officer))
     except AuthenticationError as e:
         app_logger.warning(e.message)
         raise
@@ -235,6 +320,7 @@ def authenticate_officer(unique_identifier: str, password: str) -> Optional[str]
         raise AuthenticationError(unique_identifier)
 
 
+@traced
 def get_officer_by_unique_identifier(
     unique_identifier: str,
 ) -> Optional[Officer]:
@@ -248,7 +334,7 @@ def get_officer_by_unique_identifier(
         Optional[Officer]: An officer response DTO containing non-sensitive data if the officer exists, otherwise None.
     """
     try:
-        officer = Officer.query.filter_by(unique_identifier=unique_identifier).first()
+        officer = _find_by_unique_identifier(unique_identifier)
         if not officer:
             raise OfficerNotFoundError(unique_identifier)
         return officer
@@ -260,3 +346,37 @@ def get_officer_by_unique_identifier(
             f"Failed to retrieve officer with unique identifier {unique_identifier}: {e}"
         )
         raise OfficerError(f"An error occurred while retrieving officer: {e}")
+
+
+@traced
+def get_officers_by_unique_identifiers(
+    unique_identifiers: Iterable[str],
+) -> Dict[str, Officer]:
+    """
+    Retrieves many officers with one IN query per chunk of identifiers.
+
+    Args:
+        unique_identifiers (Iterable[str]): Unique identifiers to look up.
+
+    Returns:
+        Dict[str, Officer]: Found officers keyed by unique identifier; unknown
+        identifiers are left out.
+    """
+    officers = {}
+    for chunk in chunked(dict.fromkeys(unique_identifiers)):
+        for officer in Officer.query.filter(Officer.unique_identifier.in_(chunk)):
+            officers[officer.unique_identifier] = officer
+    return officers
+
+
+########################################
+#               Warm-up                #
+########################################
+
+
+@warmup.task
+def compile_officer_lookups() -> None:
+    """Run the officer lookups once so their SQL is compiled and cached."""
+    db.session.get(Officer, 0)
+    _find_by_unique_identifier("")
+    get_officers_by_unique_identifiers([""])
@@ -1,10 +1,19 @@
-from pydantic import BaseModel, EmailStr, Field
-from sqlalchemy.exc import SQLAlchemyError
-from typing import Optional, List
-
+from dataclasses import dataclass
+from pydantic import BaseModel, EmailStr, Field, model_validator
+from sqlalchemy import func, lambda_stmt, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.exc import StaleDataError
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.commons.iterables import chunked
 from app.domain.users.models import Person
-from app.extensions import db
+from app.extensions import db, warmup
+from app.infrastructure.database import use_primary, use_replica
 from app.infrastructure.logger import app_logger
+from app.infrastructure.soft_delete import bulk_delete
+from app.infrastructure.versioning import patch_row, version_conflict
+from app.infrastructure.tracing import traced
 
 ########################################
 #             Exceptions               #
@@ -23,6 +32,14 @@ class PersonCreationError(PersonError):
         super().__init__(self.message)
 
 
+class PersonAlreadyExistsError(PersonError):
+    """Raised when another person already uses the same email address."""
+
+    def __init__(self, email: str):
+        self.message = f"A person with email {email} already exists"
+        super().__init__(self.message)
+
+
 class PersonNotFoundError(PersonError):
     """Raised when the person cannot be found in the database."""
 
@@ -47,6 +64,14 @@ class PersonDeletionError(PersonError):
         super().__init__(self.message)
 
 
+class PersonBulkDeletionError(PersonError):
+    """Raised when a bulk delete of persons fails."""
+
+    def __init__(self, reason: str):
+        self.message = f"Failed to delete persons: {reason}"
+        super().__init__(self.message)
+
+
 ########################################
 #                 DTOs                 #
 ########################################
@@ -57,19 +82,56 @@ class PersonDTO(BaseModel):
     email: EmailStr
 
 
-class VehicleResponseDTO(BaseModel):
-    license_plate: str = Field(..., description="The vehicle's license plate.")
-    make: str = Field(..., description="The make of the vehicle.")
-    model: str = Field(..., description="The model of the vehicle.")
-    color: str = Field(..., description="The color of the vehicle.")
+# The response DTOs carry rows read from our own database to other domains.
+# That data is trusted, so they are plain frozen records: validation only
+# happens on request bodies, through the pydantic DTOs.
 
 
-class PersonResponseDTO(BaseModel):
-    name: str = Field(..., description="The full name of the person.")
-    email: EmailStr = Field(..., description="The email address of the person.")
-    vehicles: List[VehicleResponseDTO] = Field(
-        default=[], description="List of vehicles associated with the person."
-    )
+@dataclass(frozen=True, slots=True)
+class VehicleResponseDTO:
+    license_plate: str
+    make: str
+    model: str
+    color: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class PersonResponseDTO:
+    id: int
+    name: str
+    email: str
+    vehicles: Tuple[VehicleResponseDTO, ...] = ()
+
+    @classmethod
+    def from_model(cls, person: Person) -> "PersonResponseDTO":
+        return cls(
+            id=person.id,
+            name=person.name,
+            email=person.email,
+            vehicles=tuple(
+                VehicleResponseDTO(v.license_plate, v.make, v.model, v.color)
+                for v in person.vehicles
+            ),
+        )
+
+
+class PersonPatchDTO(BaseModel):
+    name: Optional[str] = Field(None, min_length=1, strip_whitespace=True)
+    email: Optional[EmailStr] = None
+    # Version the client read; the patch fails with a conflict if it changed.
+    version: Optional[int] = None
+
+
+class PersonBulkDeleteDTO(BaseModel):
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=50000)
+    emails: Optional[List[EmailStr]] = Field(None, min_length=1, max_length=50000)
+    soft: Optional[bool] = None
+
+    @model_validator(mode="after")
+    def check_filters(self):
+        if (self.ids is None) == (self.emails is None):
+            raise ValueError("Exactly one of ids or emails is required.")
+        return self
 
 
 ########################################
@@ -77,46 +139,102 @@ class PersonResponseDTO(BaseModel):
 ########################################
 
 
+def normalize_email(email: str) -> str:
+    """Canonical form used to store and look up email addresses."""
+    return email.strip().lower()
+
+
+@traced
 def create_person(person_dto: PersonDTO) -> Person:
+    email = normalize_email(person_dto.email)
     try:
-        new_person = Person(name=person_dto.name, email=person_dto.email)
+        new_person = Person(name=person_dto.name, email=email)
         db.session.add(new_person)
         db.session.commit()
         return new_person
+    except IntegrityError:
+        db.session.rollback()
+        app_logger.warning(f"Duplicate email on person creation: {email}")
+        raise PersonAlreadyExistsError(email)
     except SQLAlchemyError as e:
         app_logger.error(f"Error creating person: {e}")
         raise PersonCreationError()
 
 
+@use_replica
+@traced
 def get_person(person_id: int) -> Optional[Person]:
-    person = Person.query.get(person_id)
+    person = db.session.get(Person, person_id)
     if not person:
         app_logger.warning(f"Person with ID {person_id} not found.")
         raise PersonNotFoundError(person_id)
     return person
 
 
+@traced
 def update_person(
     person_id: int, name: Optional[str] = None, email: Optional[str] = None
 ) -> Optional[Person]:
     try:
-        person = Person.query.get(person_id)
+        person = db.session.get(Person, person_id)
         if not person:
             raise PersonNotFoundError(person_id)
+        version = person.version
         if name is not None and name != person.name:
             person.name = name
-        if email is not None and email != person.email:
-            person.email = email
+        if email is not None and normalize_email(email) != person.email:
+            person.email = normalize_email(email)
         db.session.commit()
         return person
+    except IntegrityError:
+        db.session.rollback()
+        app_logger.warning(f"Duplicate email on person update: ID {person_id}")
+        raise PersonAlreadyExistsError(email)
+    except StaleDataError:
+        conflict = version_conflict(person, version)
+        if conflict is None:
+            raise PersonNotFoundError(person_id)
+        app_logger.warning(conflict.message)
+        raise conflict
     except SQLAlchemyError as e:
         app_logger.error(f"Error updating person with ID {person_id}: {e}")
         raise PersonUpdateError(person_id)
 
 
+@use_primary
+@traced
+def patch_person(person_id: int, person_dto: PersonPatchDTO) -> Dict[str, Any]:
+    """
+    Update only the supplied fields of a person with a single UPDATE statement.
+
+    Raises:
+        PersonNotFoundError: If the person does not exist.
+        PersonAlreadyExistsError: If the new email belongs to someone else.
+        VersionConflictError: If the person is no longer at ``version``.
+    """
+    values = person_dto.dict(exclude_unset=True, exclude_none=True)
+    version = values.pop("version", None)
+    if "email" in values:
+        values["email"] = normalize_email(values["email"])
+    try:
+        row = patch_row(Person, person_id, values, expected_version=version)
+    except IntegrityError:
+        db.session.rollback()
+        app_logger.warning(f"Duplicate email on person patch: ID {person_id}")
+        raise PersonAlreadyExistsError(values.get("email"))
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        app_logger.error(f"Error patching person with ID {person_id}: {e}")
+        raise PersonUpdateError(person_id)
+    if row is None:
+        raise PersonNotFoundError(person_id)
+    return dict(row)
+
+
+@traced
 def delete_person(person_id: int) -> bool:
     try:
-        person = Person.query.get(person_id)
+        person = db.session.get(Person, person_id)
         if not person:
             raise PersonNotFoundError(person_id)
         db.session.delete(person)
@@ -127,26 +245,102 @@ def delete_person(person_id: int) -> bool:
         raise PersonDeletionError(person_id)
 
 
+@use_primary
+@traced
+def bulk_delete_persons(request: PersonBulkDeleteDTO) -> int:
+    """
+    Delete the persons with the given ids or emails in chunked set-based
+    statements. Their vehicles are kept without an owner on hard deletes.
+
+    Returns:
+        int: Number of persons deleted.
+    """
+    if request.ids is not None:
+        in_column, in_values = Person.id, request.ids
+    else:
+        in_column = func.lower(Person.email)
+        in_values = [normalize_email(email) for email in request.emails]
+    try:
+        deleted = bulk_delete(
+            Person, in_column=in_column, in_values=in_values, soft=request.soft
+        )
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        app_logger.error(f"Bulk delete of persons failed: {e}")
+        raise PersonBulkDeletionError(str(e))
+    app_logger.info(f"Bulk deleted {deleted} persons")
+    return deleted
+
+
+def _find_by_email(normalized: str) -> Optional[Person]:
+    return (
+        db.session.execute(
+            lambda_stmt(
+                lambda: select(Person)
+                .where(func.lower(Person.email) == normalized)
+                .limit(1)
+            )
+        )
+        .scalars()
+        .first()
+    )
+
+
+@traced
 def get_person_by_email(email: str) -> Optional[PersonResponseDTO]:
     """
     Retrieves a person by their email address and returns detailed information including vehicles.
+    The comparison is case-insensitive and served by the lower(email) index.
 
     Args:
         email (str): The email address to search for.
 
     Returns:
-        Optional[PersonDTO]: Detailed information about the person if found, None otherwise.
+        Optional[PersonResponseDTO]: Detailed information about the person if found, None otherwise.
     """
-    person = Person.query.filter_by(email=email).first()
+    person = _find_by_email(normalize_email(email))
     if person:
-        vehicles = [
-            VehicleResponseDTO(
-                license_plate=v.license_plate, make=v.make, model=v.model, color=v.color
-            )
-            for v in person.vehicles
-        ]
-        person_dto = PersonResponseDTO(name=person.name, email=person.email, vehicles=vehicles)
-        return person_dto
+        return PersonResponseDTO.from_model(person)
     else:
         app_logger.warning(f"No person found with email: {email}")
     return None
+
+
+@traced
+def get_persons_by_emails(emails: Iterable[str]) -> Dict[str, PersonResponseDTO]:
+    """
+    Retrieves many persons and their vehicles with set-based queries.
+
+    Every chunk of emails costs two queries (persons, then their vehicles
+    through ``selectinload``) no matter how many persons or vehicles match.
+
+    Args:
+        emails (Iterable[str]): Email addresses to search for, in any case.
+
+    Returns:
+        Dict[str, PersonResponseDTO]: Found persons keyed by normalized email.
+    """
+    normalized = dict.fromkeys(normalize_email(email) for email in emails)
+    found = {}
+    for chunk in chunked(normalized):
+        persons = (
+            Person.query.options(selectinload(Person.vehicles))
+            .filter(func.lower(Person.email).in_(chunk))
+            .all()
+        )
+        for person in persons:
+            found[normalize_email(person.email)] = PersonResponseDTO.from_model(person)
+    return found
+
+
+########################################
+#               Warm-up                #
+########################################
+
+
+@warmup.task
+def compile_person_lookups() -> None:
+    """Run the person lookups once so their SQL is compiled and cached."""
+    db.session.get(Person, 0)
+    _find_by_email("")
+    get_persons_by_emails([""])
@@ -0,0 +1,149 @@
+import datetime
+from typing import Any, Dict, Mapping
+
+from flask_jwt_extended import create_access_token, create_refresh_token
+from pydantic import BaseModel
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+
+from app.domain.users.models import RevokedToken
+from app.extensions import db
+from app.infrastructure.cache import LRUCache
+from app.infrastructure.database import use_primary
+from app.infrastructure.logger import app_logger
+from app.infrastructure.tracing import traced
+
+# Revocation is permanent, so known revoked jtis can be cached indefinitely.
+revoked_token_cache = LRUCache("revoked_tokens", maxsize=8192)
+
+# Registered claims that flask_jwt_extended sets itself; everything else in a
+# refresh token is carried over to the tokens it is exchanged for.
+_RESERVED_CLAIMS = {"sub", "jti", "type", "exp", "iat", "nbf", "fresh", "csrf"}
+
+########################################
+#             Exceptions               #
+########################################
+
+
+class TokenError(Exception):
+    """Base class for token-related exceptions."""
+
+
+class TokenRevokedError(TokenError):
+    """Exception raised when a revoked refresh token is presented again."""
+
+    def __init__(self, jti):
+        self.message = f"Refresh token {jti} has already been used or revoked."
+        super().__init__(self.message)
+
+
+########################################
+#                  DTO                 #
+########################################
+
+
+class TokenPairDTO(BaseModel):
+    access_token: str
+    refresh_token: str
+
+
+########################################
+#                Services              #
+########################################
+
+
+@traced
+def issue_tokens(identity: str, claims: Mapping[str, Any]) -> TokenPairDTO:
+    """Create a fresh access token and a refresh token carrying ``claims``."""
+    return TokenPairDTO(
+        access_token=create_access_token(
+            identity=identity, additional_claims=dict(claims), fresh=True
+        ),
+        refresh_token=create_refresh_token(
+            identity=identity, additional_claims=dict(claims)
+        ),
+    )
+
+
+@use_primary
+@traced
+def is_token_revoked(jwt_payload: Mapping[str, Any]) -> bool:
+    """
+    Blocklist check for every request carrying a JWT.
+
+    Access tokens are short-lived and never revoked, so they are accepted
+    without touching the database. Refresh tokens are looked up by primary key
+    unless already cached as revoked.
+    """
+    if jwt_payload.get("type") != "refresh":
+        return False
+    jti = jwt_payload["jti"]
+    if revoked_token_cache.get(jti):
+        return True
+    if db.session.get(RevokedToken, jti) is None:
+        return False
+    revoked_token_cache.set(jti, True)
+    return True
+
+
+@use_primary
+@traced
+def revoke_token(jwt_payload: Mapping[str, Any]) -> None:
+    """
+    Mark a refresh token as used.
+
+    Raises:
+        TokenRevokedError: If the token had already been revoked, e.g. by a
+            concurrent refresh with the same token.
+    """
+    jti = jwt_payload["jti"]
+    # A plain INSERT so a second use always fails on the primary key, even if
+    # the row is already in the session's identity map.
+    statement = insert(RevokedToken).values(
+        jti=jti,
+        identity=str(jwt_payload["sub"]),
+        expires_at=datetime.datetime.utcfromtimestamp(jwt_payload["exp"]),
+        revoked_at=datetime.datetime.utcnow(),
+    )
+    try:
+        db.session.execute(statement)
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        revoked_token_cache.set(jti, True)
+        app_logger.warning(f"Refresh token {jti} of {jwt_payload['sub']} reused")
+        raise TokenRevokedError(jti)
+    revoked_token_cache.set(jti, True)
+
+
+@traced
+def rotate_refresh_token(jwt_payload: Mapping[str, Any]) -> TokenPairDTO:
+    """
+    Exchange a refresh token for a new token pair and revoke it.
+
+    The new tokens carry the same identity and claims, so no password check or
+    officer lookup is needed. The access token is not fresh.
+    """
+    revoke_token(jwt_payload)
+    identity = jwt_payload["sub"]
+    claims: Dict[str, Any] = {
+        key: value for key, value in jwt_payload.items() if key not in _RESERVED_CLAIMS
+    }
+    app_logger.info(f"Refresh token rotated for {identity}")
+    return TokenPairDTO(
+        access_token=create_access_token(identity=identity, additional_claims=claims),
+        refresh_token=create_refresh_token(identity=identity, additional_claims=claims),
+    )
+
+
+@use_primary
+@traced
+def purge_expired_revocations(now: datetime.datetime = None) -> int:
+    """Delete revocation rows of tokens that have expired on their own."""
+    now = now or datetime.datetime.utcnow()
+    deleted = RevokedToken.query.filter(RevokedToken.expires_at < now).delete(
+        synchronize_session=False
+    )
+    db.session.commit()
+    app_logger.info(f"Purged {deleted} expired token revocations")
+    return deleted
@@ -3,13 +3,28 @@ from flask import Blueprint, request
 from pydantic import ValidationError
 
 from app.commons.responses import handle_api_response
+from app.infrastructure.versioning import VersionConflictError
+from app.domain.vehicles.services.plate_search_service import (
+    DEFAULT_LIMIT,
+    DEFAULT_MAX_DISTANCE,
+    InvalidPlateQueryError,
+    search_plates,
+)
 from app.domain.vehicles.services.vehicle_service import (
+    VehicleAlreadyExistsError,
+    VehicleBulkDeleteDTO,
+    VehicleBulkDeletionError,
     VehicleDTO,
+    VehiclePatchDTO,
+    bulk_delete_vehicles,
     create_vehicle,
     delete_vehicle,
     get_vehicle,
+    patch_vehicle,
     update_vehicle,
+    VehicleCreationError,
     VehicleNotFoundError,
+    VehicleUpdateError,
 )
 
 vehicle_blueprint = Blueprint("vehicles", __name__)
@@ -26,6 +41,29 @@ def add_vehicle():
         )
     except ValidationError as e:
         return handle_api_response(error={"errors": e.errors()}, status_code=400)
+    except VehicleAlreadyExistsError as e:
+        return handle_api_response(error={"message": e.message}, status_code=409)
+    except VehicleCreationError as e:
+        return handle_api_response(error={"message": e.message}, status_code=500)
+
+
+@vehicle_blueprint.route("/search", methods=["GET"])
+def search_vehicles_by_plate():
+    """Vehicles whose plate starts with (mode=prefix) or resembles ``plate``."""
+    try:
+        matches = search_plates(
+            request.args.get("plate", ""),
+            mode=request.args.get("mode", "fuzzy"),
+            limit=request.args.get("limit", DEFAULT_LIMIT, type=int),
+            max_distance=request.args.get(
+                "max_distance", DEFAULT_MAX_DISTANCE, type=int
+            ),
+        )
+        return handle_api_response(
+            data={"matches": [match.model_dump() for match in matches]}
+        )
+    except InvalidPlateQueryError as e:
+        return handle_api_response(error={"message": e.message}, status_code=400)
 
 
 @vehicle_blueprint.route("/<int:vehicle_id>", methods=["GET"])
@@ -50,12 +88,51 @@ def modify_vehicle(vehicle_id):
             return handle_api_response(data={"message": "Vehicle updated successfully"})
     except ValidationError as e:
         return handle_api_response(error={"errors": e.errors()}, status_code=400)
+    except VersionConflictError as e:
+        return handle_api_response(
+            error={"message": e.message, "version": e.current_version},
+            status_code=409,
+        )
     return handle_api_response(error={"message": "Vehicle not found"}, status_code=404)
 
 
+@vehicle_blueprint.route("/<int:vehicle_id>", methods=["PATCH"])
+def patch_vehicle_endpoint(vehicle_id):
+    try:
+        vehicle = patch_vehicle(vehicle_id, VehiclePatchDTO(**(request.json or {})))
+        return handle_api_response(data=vehicle)
+    except ValidationError as e:
+        return handle_api_response(
+            error={"errors": e.errors(include_context=False)}, status_code=400
+        )
+    except VehicleNotFoundError as e:
+        return handle_api_response(error={"message": e.message}, status_code=404)
+    except VersionConflictError as e:
+        return handle_api_response(
+            error={"message": e.message, "version": e.current_version},
+            status_code=409,
+        )
+    except VehicleUpdateError as e:
+        return handle_api_response(error={"message": e.message}, status_code=500)
+
+
 @vehicle_blueprint.route("/<int:vehicle_id>", methods=["DELETE"])
 def delete_vehicles(vehicle_id):
     bool_response = delete_vehicle(vehicle_id=vehicle_id)
     if bool_response:
         return handle_api_response(data={"message": "Vehicle deleted successfully"})
     return handle_api_response(error={"message": "Vehicle not found"}, status_code=404)
+
+
+@vehicle_blueprint.route("/bulk_delete", methods=["POST"])
+def bulk_remove_vehicles():
+    """Delete every vehicle matching the filters in the body, with its infractions."""
+    try:
+        deleted = bulk_delete_vehicles(VehicleBulkDeleteDTO(**(request.json or {})))
+        return handle_api_response(data={"deleted": deleted})
+    except ValidationError as e:
+        return handle_api_response(
+            error={"errors": e.errors(include_context=False)}, status_code=400
+        )
+    except VehicleBulkDeletionError as e:
+        return handle_api_response(error={"message": e.message}, status_code=500)
@@ -1 +1 @@
-from app.domain.vehicles.models.vehicle import Vehicle
+from app.domain.vehicles.models.vehicle import Vehicle, VehiclePlateTrigram
@@ -1,16 +1,114 @@
 # app/domain/vehicles/models.py
+import re
+from typing import Set
+
+from app.commons.signals import vehicle_plate_changed
 from app.extensions import db
+from app.infrastructure.soft_delete import SoftDeleteMixin
+from app.infrastructure.versioning import VersionedMixin
+
+_NOT_PLATE_CHARACTERS = re.compile(r"[^0-9A-Z]")
+
+
+def normalize_plate(plate: str) -> str:
+    """Upper-case ``plate`` and drop spaces, dashes and dots: "ab-12 c" -> "AB12C"."""
+    return _NOT_PLATE_CHARACTERS.sub("", (plate or "").upper())
+
+
+def plate_trigrams(normalized: str) -> Set[str]:
+    """
+    Three-character substrings of ``normalized`` framed by ``^`` and ``$``, so
+    even one- and two-character plates have some and the ends weigh more.
+    """
+    framed = f"^{normalized}$"
+    return {framed[i : i + 3] for i in range(len(framed) - 2)}
 
 
-class Vehicle(db.Model):
+class Vehicle(SoftDeleteMixin, VersionedMixin, db.Model):
     __tablename__ = "vehicles"
 
     id = db.Column(db.Integer, primary_key=True)
     license_plate = db.Column(db.String(255), unique=True, nullable=False)
+    # Kept equal to normalize_plate(license_plate) for plate search. The default
+    # covers Core inserts, which skip the validator below.
+    plate_normalized = db.Column(
+        db.String(255),
+        nullable=False,
+        default=lambda context: normalize_plate(
+            context.get_current_parameters()["license_plate"]
+        ),
+    )
     make = db.Column(db.String(255), nullable=False)
     model = db.Column(db.String(255), nullable=False)
     color = db.Column(db.String(255))
-    owner_id = db.Column(db.Integer, db.ForeignKey("persons.id"))
+    owner_id = db.Column(
+        db.Integer, db.ForeignKey("persons.id", ondelete="SET NULL"), index=True
+    )
+
+    @db.validates("license_plate")
+    def _normalize(self, key, plate):
+        self.plate_normalized = normalize_plate(plate)
+        return plate
 
     def __repr__(self):
         return f"<Vehicle {self.license_plate} - {self.make} {self.model}>"
+
+
+# Prefix searches are range scans of this index. deleted_at leads, as every ORM
+# query filters on it and SQLite would otherwise scan its own index instead.
+db.Index(
+    "ix_vehicles_deleted_at_plate_normalized",
+    Vehicle.deleted_at,
+    Vehicle.plate_normalized,
+)
+
+
+class VehiclePlateTrigram(db.Model):
+    """
+    Inverted index from plate trigrams to vehicles, for fuzzy plate search.
+
+    Rows are rewritten whenever a vehicle's plate is written through the ORM
+    (see ``index_plate``) and go away with the vehicle (ON DELETE CASCADE).
+    """
+
+    __tablename__ = "vehicle_plate_trigrams"
+
+    trigram = db.Column(db.String(3), primary_key=True)
+    vehicle_id = db.Column(
+        db.Integer,
+        db.ForeignKey("vehicles.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+
+    def __repr__(self):
+        return f"<VehiclePlateTrigram {self.trigram} - {self.vehicle_id}>"
+
+
+def index_plate(connection, vehicle_id: int, normalized: str) -> None:
+    """Replace the trigram rows of ``vehicle_id`` with those of ``normalized``."""
+    table = VehiclePlateTrigram.__table__
+    connection.execute(table.delete().where(table.c.vehicle_id == vehicle_id))
+    connection.execute(
+        table.insert(),
+        [
+            {"trigram": trigram, "vehicle_id": vehicle_id}
+            for trigram in sorted(plate_trigrams(normalized))
+        ],
+    )
+
+
+@db.event.listens_for(Vehicle, "after_insert")
+def _index_new_plate(mapper, connection, vehicle):
+    index_plate(connection, vehicle.id, vehicle.plate_normalized)
+
+
+@db.event.listens_for(Vehicle, "after_update")
+def _index_changed_plate(mapper, connection, vehicle):
+    attrs = db.inspect(vehicle).attrs
+    if attrs.plate_normalized.history.has_changes():
+        index_plate(connection, vehicle.id, vehicle.plate_normalized)
+    if attrs.license_plate.history.has_changes():
+        vehicle_plate_changed.send(
+            __name__, connection=connection, license_plate=vehicle.license_plate
+        )
@@ -0,0 +1,198 @@
+# app/domain/vehicles/services/plate_search_service.py
+from typing import List, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import func, select
+
+from app.domain.vehicles.models import Vehicle, VehiclePlateTrigram
+from app.domain.vehicles.models.vehicle import normalize_plate, plate_trigrams
+from app.extensions import db
+from app.infrastructure.database import use_replica
+from app.infrastructure.tracing import traced
+
+PLATE_SEARCH_MODES = ("prefix", "fuzzy")
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+DEFAULT_MAX_DISTANCE = 2
+MAX_DISTANCE = 3
+# Vehicles sharing the most trigrams with the query whose edit distance is
+# computed; the rest are not considered.
+FUZZY_CANDIDATES = 200
+
+# Normalized plates only hold these, in the order every collation sorts them.
+_PLATE_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+########################################
+#             Exceptions               #
+########################################
+
+
+class InvalidPlateQueryError(Exception):
+    """Exception raised when a plate search request cannot be run."""
+
+    def __init__(self, reason):
+        self.message = f"Invalid plate search: {reason}"
+        super().__init__(self.message)
+
+
+########################################
+#                  DTO                 #
+########################################
+
+
+class PlateMatchDTO(BaseModel):
+    id: int
+    license_plate: str
+    make: str
+    model: str
+    color: Optional[str]
+    owner_id: Optional[int]
+    # Characters to insert, delete or replace to turn the query into the plate.
+    distance: int
+
+
+########################################
+#               Helpers                #
+########################################
+
+
+def edit_distance(a: str, b: str, bound: int) -> int:
+    """
+    Levenshtein distance between ``a`` and ``b``, or ``bound + 1`` as soon as
+    it is known to exceed ``bound``.
+    """
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+    previous = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        current = [i]
+        for j, other in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char != other),
+                )
+            )
+        if min(current) > bound:
+            return bound + 1
+        previous = current
+    return previous[-1]
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """Smallest string above every string starting with ``prefix``, if any."""
+    stripped = prefix.rstrip(_PLATE_ALPHABET[-1])
+    if not stripped:
+        return None
+    last = _PLATE_ALPHABET.index(stripped[-1])
+    return stripped[:-1] + _PLATE_ALPHABET[last + 1]
+
+
+def _to_match(vehicle: Vehicle, distance: int) -> PlateMatchDTO:
+    return PlateMatchDTO(
+        id=vehicle.id,
+        license_plate=vehicle.license_plate,
+        make=vehicle.make,
+        model=vehicle.model,
+        color=vehicle.color,
+        owner_id=vehicle.owner_id,
+        distance=distance,
+    )
+
+
+########################################
+#               Services               #
+########################################
+
+
+def _search_prefix(normalized: str, limit: int) -> List[PlateMatchDTO]:
+    # A range rather than LIKE, so any collation can use the index.
+    criteria = [Vehicle.plate_normalized >= normalized]
+    upper = _prefix_upper_bound(normalized)
+    if upper is not None:
+        criteria.append(Vehicle.plate_normalized < upper)
+    vehicles = db.session.execute(
+        select(Vehicle).where(*criteria).order_by(Vehicle.plate_normalized).limit(limit)
+    ).scalars()
+    return [
+        _to_match(vehicle, len(vehicle.plate_normalized) - len(normalized))
+        for vehicle in vehicles
+    ]
+
+
+def _search_fuzzy(
+    normalized: str, limit: int, max_distance: int
+) -> List[PlateMatchDTO]:
+    trigrams = plate_trigrams(normalized)
+    # Every edit changes at most three trigrams, so closer plates share at
+    # least this many with the query.
+    min_shared = max(1, len(trigrams) - 3 * max_distance)
+    shared = func.count().label("shared")
+    candidates = dict(
+        db.session.execute(
+            select(VehiclePlateTrigram.vehicle_id, shared)
+            .where(VehiclePlateTrigram.trigram.in_(sorted(trigrams)))
+            .group_by(VehiclePlateTrigram.vehicle_id)
+            .having(shared >= min_shared)
+            .order_by(shared.desc())
+            .limit(FUZZY_CANDIDATES)
+        ).all()
+    )
+    if not candidates:
+        return []
+    vehicles = db.session.execute(
+        select(Vehicle).where(Vehicle.id.in_(candidates))
+    ).scalars()
+    ranked = []
+    for vehicle in vehicles:
+        distance = edit_distance(normalized, vehicle.plate_normalized, max_distance)
+        if distance <= max_distance:
+            ranked.append(
+                (distance, -candidates[vehicle.id], vehicle.plate_normalized, vehicle)
+            )
+    ranked.sort(key=lambda match: match[:3])
+    return [_to_match(vehicle, distance) for distance, _, _, vehicle in ranked[:limit]]
+
+
+@use_replica
+@traced
+def search_plates(
+    query: str,
+    mode: str = "fuzzy",
+    limit: int = DEFAULT_LIMIT,
+    max_distance: int = DEFAULT_MAX_DISTANCE,
+) -> List[PlateMatchDTO]:
+    """
+    Find the vehicles whose plate starts with, or resembles, ``query``.
+
+    Plates are compared normalized, so "ab-12 3" finds "AB123".
+
+    Args:
+        query (str): Full or partial plate.
+        mode (str): "prefix" for plates starting with ``query``, in plate
+            order, so an exact match comes first; "fuzzy" for plates within
+            ``max_distance`` edits of it, e.g. a misread character, closest
+            first.
+        limit (int): Matches to return, capped at MAX_LIMIT.
+        max_distance (int): Edits allowed in fuzzy mode, capped at MAX_DISTANCE.
+
+    Returns:
+        List[PlateMatchDTO]: Ranked matches, best first.
+
+    Raises:
+        InvalidPlateQueryError: If the query or the options are not usable.
+    """
+    normalized = normalize_plate(query)
+    if not normalized:
+        raise InvalidPlateQueryError("the plate has no letters or digits")
+    if mode not in PLATE_SEARCH_MODES:
+        raise InvalidPlateQueryError(f"mode must be one of {PLATE_SEARCH_MODES}")
+    if limit < 1 or not 0 <= max_distance <= MAX_DISTANCE:
+        raise InvalidPlateQueryError(
+            f"limit must be positive and max_distance between 0 and {MAX_DISTANCE}"
+        )
+    limit = min(limit, MAX_LIMIT)
+    if mode == "prefix":
+        return _search_prefix(normalized, limit)
+    return _search_fuzzy(normalized, limit, max_distance)
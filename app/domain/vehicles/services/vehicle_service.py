@@ -1,11 +1,20 @@
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
+from app.commons.iterables import chunked
+from app.commons.signals import notify, vehicle_plate_changed, vehicles_changed
 from app.domain.vehicles.models import Vehicle
-from app.extensions import db
+from app.domain.vehicles.models.vehicle import index_plate, normalize_plate
+from app.extensions import db, warmup
+from app.infrastructure.database import use_primary, use_replica
 from app.infrastructure.logger import app_logger
-from sqlalchemy.exc import SQLAlchemyError
+from app.infrastructure.soft_delete import INCLUDE_DELETED, bulk_delete
+from app.infrastructure.versioning import patch_row, version_conflict
+from app.infrastructure.tracing import traced
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm.exc import StaleDataError
 
 ########################################
 #             Exceptions               #
@@ -37,6 +46,13 @@ class VehicleCreationError(VehicleError):
         super().__init__(self.message)
 
 
+class VehicleAlreadyExistsError(VehicleCreationError):
+    """Exception raised when another vehicle already has the license plate."""
+
+    def __init__(self, license_plate):
+        super().__init__(f"a vehicle with license plate {license_plate} exists")
+
+
 class VehicleUpdateError(VehicleError):
     """Exception raised when there is a problem updating a vehicle."""
 
@@ -53,6 +69,14 @@ class VehicleDeletionError(VehicleError):
         super().__init__(self.message)
 
 
+class VehicleBulkDeletionError(VehicleError):
+    """Exception raised when a bulk delete of vehicles fails."""
+
+    def __init__(self, reason="Unknown reason"):
+        self.message = f"Failed to delete vehicles: {reason}"
+        super().__init__(self.message)
+
+
 ########################################
 #                 DTOs                 #
 ########################################
@@ -74,6 +98,11 @@ class VehicleUpdateDTO(BaseModel):
     owner_id: Optional[int] = None
 
 
+class VehiclePatchDTO(VehicleUpdateDTO):
+    # Version the client read; the patch fails with a conflict if it changed.
+    version: Optional[int] = None
+
+
 class VehicleResponseDTO(BaseModel):
     license_plate: Optional[str] = Field(None, min_length=1, strip_whitespace=True)
     make: Optional[str] = Field(None, min_length=1, strip_whitespace=True)
@@ -82,15 +111,66 @@ class VehicleResponseDTO(BaseModel):
     owner_id: Optional[int] = None
 
 
+class VehicleBulkDeleteDTO(BaseModel):
+    """Filters are combined; at least one is required."""
+
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=50000)
+    license_plates: Optional[List[str]] = Field(None, min_length=1, max_length=50000)
+    owner_id: Optional[int] = None
+    soft: Optional[bool] = None
+
+    @model_validator(mode="after")
+    def check_filters(self):
+        if self.ids is None and self.license_plates is None and self.owner_id is None:
+            raise ValueError(
+                "At least one of ids, license_plates or owner_id is required."
+            )
+        if self.ids is not None and self.license_plates is not None:
+            raise ValueError("Filter by ids or by license_plates, not both.")
+        return self
+
+
 ########################################
 #               Services               #
 ########################################
 
 
+def _vehicles_changed(plates: Optional[Iterable[str]]) -> None:
+    notify(vehicles_changed, __name__, plates=plates)
+
+
+def _plate_changed(row) -> None:
+    connection = db.session.connection()
+    index_plate(connection, row.id, row.plate_normalized)
+    vehicle_plate_changed.send(
+        __name__, connection=connection, license_plate=row.license_plate
+    )
+
+
+def _find_deleted(license_plate: str) -> Optional[Vehicle]:
+    return (
+        db.session.execute(
+            select(Vehicle)
+            .where(
+                Vehicle.license_plate == license_plate,
+                Vehicle.deleted_at.is_not(None),
+            )
+            .execution_options(**{INCLUDE_DELETED: True})
+        )
+        .scalars()
+        .first()
+    )
+
+
+@traced
 def create_vehicle(vehicle_dto: VehicleDTO) -> Vehicle:
     """
     Create a new vehicle in the database using the provided VehicleDTO.
 
+    A soft-deleted vehicle with the same plate is restored with the new
+    details instead: infractions reference vehicles by plate, so the plate
+    stays unique across deleted rows too. Its deleted infractions stay deleted.
+
     Args:
         vehicle_dto (VehicleDTO): Data transfer object containing all the necessary vehicle details.
 
@@ -98,21 +178,42 @@ def create_vehicle(vehicle_dto: VehicleDTO) -> Vehicle:
         Vehicle: The newly created Vehicle object.
 
     Raises:
+        VehicleAlreadyExistsError: If a vehicle already has the license plate.
         VehicleCreationError: If there is any database error during vehicle creation.
     """
+    restored = False
     try:
-        vehicle = Vehicle(**vehicle_dto.dict())
-        db.session.add(vehicle)
+        vehicle = _find_deleted(vehicle_dto.license_plate)
+        if vehicle is None:
+            vehicle = Vehicle(**vehicle_dto.dict())
+            db.session.add(vehicle)
+        else:
+            for key, value in vehicle_dto.dict().items():
+                setattr(vehicle, key, value)
+            vehicle.deleted_at = None
+            restored = True
         db.session.commit()
         app_logger.info(
             f"Vehicle created successfully with license plate: {vehicle.license_plate}"
         )
-        return vehicle
+    except IntegrityError as e:
+        db.session.rollback()
+        if _find_by_license_plate(vehicle_dto.license_plate) is not None:
+            app_logger.warning(
+                f"Duplicate license plate on vehicle creation: {vehicle_dto.license_plate}"
+            )
+            raise VehicleAlreadyExistsError(vehicle_dto.license_plate)
+        app_logger.error(f"Error creating vehicle: {e}")
+        raise VehicleCreationError(reason=str(e))
     except SQLAlchemyError as e:
         app_logger.error(f"Error creating vehicle: {e}")
         raise VehicleCreationError(reason=str(e))
+    if restored:
+        _vehicles_changed([vehicle.license_plate])
+    return vehicle
 
 
+@traced
 def update_vehicle(vehicle_id: int, vehicle_dto: VehicleUpdateDTO) -> Optional[Vehicle]:
     """
     Update an existing vehicle's details in the database.
@@ -127,23 +228,85 @@ def update_vehicle(vehicle_id: int, vehicle_dto: VehicleUpdateDTO) -> Optional[V
     Raises:
         VehicleNotFoundError: If no vehicle with the specified ID was found.
         VehicleUpdateError: If there is an error during the update process.
+        VersionConflictError: If someone else updated the vehicle meanwhile.
     """
-    vehicle = Vehicle.query.get(vehicle_id)
+    vehicle = db.session.get(Vehicle, vehicle_id)
     if not vehicle:
         app_logger.warning(f"Vehicle with ID {vehicle_id} not found for update.")
         raise VehicleNotFoundError(vehicle_id=vehicle_id)
+    previous = (vehicle.license_plate, vehicle.owner_id)
+    version = vehicle.version
     try:
         update_data = vehicle_dto.dict(exclude_unset=True, exclude_none=True)
         for key, value in update_data.items():
             setattr(vehicle, key, value)
         db.session.commit()
         app_logger.info(f"Vehicle with ID {vehicle_id} updated successfully.")
-        return vehicle
+    except StaleDataError:
+        conflict = version_conflict(vehicle, version)
+        if conflict is None:
+            raise VehicleNotFoundError(vehicle_id=vehicle_id)
+        app_logger.warning(conflict.message)
+        raise conflict
     except SQLAlchemyError as e:
         app_logger.error(f"Error updating vehicle with ID {vehicle_id}: {e}")
         raise VehicleUpdateError(vehicle_id, reason=str(e))
+    plate = update_data.get("license_plate", previous[0])
+    if (plate, update_data.get("owner_id", previous[1])) != previous:
+        _vehicles_changed({previous[0], plate})
+    return vehicle
+
+
+@use_primary
+@traced
+def patch_vehicle(vehicle_id: int, vehicle_dto: VehiclePatchDTO) -> Dict[str, Any]:
+    """
+    Update only the supplied fields of a vehicle with a single UPDATE statement.
+
+    Args:
+        vehicle_id (int): The ID of the vehicle to update.
+        vehicle_dto (VehiclePatchDTO): Fields to change and, optionally, the
+            version they were based on.
+
+    Returns:
+        Dict[str, Any]: The updated vehicle, including its new version.
+
+    Raises:
+        VehicleNotFoundError: If no vehicle with the specified ID was found.
+        VersionConflictError: If the vehicle is no longer at ``version``.
+        VehicleUpdateError: If there is an error during the update process.
+    """
+    values = vehicle_dto.dict(exclude_unset=True, exclude_none=True)
+    version = values.pop("version", None)
+    before_commit = None
+    if "license_plate" in values:
+        # A Core UPDATE skips the model's validator and events.
+        values["plate_normalized"] = normalize_plate(values["license_plate"])
+        before_commit = _plate_changed
+    try:
+        row = patch_row(
+            Vehicle,
+            vehicle_id,
+            values,
+            expected_version=version,
+            before_commit=before_commit,
+        )
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        app_logger.error(f"Error patching vehicle with ID {vehicle_id}: {e}")
+        raise VehicleUpdateError(vehicle_id, reason=str(e))
+    if row is None:
+        raise VehicleNotFoundError(vehicle_id=vehicle_id)
+    app_logger.info(f"Vehicle with ID {vehicle_id} patched to version {row.version}.")
+    if "license_plate" in values:
+        # The plate it had before is not known here.
+        _vehicles_changed(None)
+    elif "owner_id" in values:
+        _vehicles_changed([row.license_plate])
+    return dict(row)
 
 
+@traced
 def delete_vehicle(vehicle_id: int) -> bool:
     """
     Delete a vehicle from the database.
@@ -159,20 +322,24 @@ def delete_vehicle(vehicle_id: int) -> bool:
         VehicleDeletionError: If there is a problem during the deletion process.
     """
     app_logger.info(f"Vehicle with ID {vehicle_id}.")
-    vehicle = Vehicle.query.get(vehicle_id)
+    vehicle = db.session.get(Vehicle, vehicle_id)
     if not vehicle:
         app_logger.warning(f"Vehicle with ID {vehicle_id} not found for deletion.")
         raise VehicleNotFoundError(vehicle_id=vehicle_id)
+    plate = vehicle.license_plate
     try:
         db.session.delete(vehicle)
         db.session.commit()
         app_logger.info(f"Vehicle with ID {vehicle_id} deleted successfully.")
-        return True
     except SQLAlchemyError as e:
         app_logger.error(f"Error deleting vehicle with ID {vehicle_id}: {e}")
         raise VehicleDeletionError(vehicle_id)
+    _vehicles_changed([plate])
+    return True
 
 
+@use_replica
+@traced
 def get_vehicle(vehicle_id: int) -> Optional[VehicleResponseDTO]:
     """
     Retrieve a vehicle by its ID from the database.
@@ -186,7 +353,7 @@ def get_vehicle(vehicle_id: int) -> Optional[VehicleResponseDTO]:
     Raises:
         VehicleNotFoundError: If no vehicle with the specified ID was found.
     """
-    vehicle = Vehicle.query.get(vehicle_id)
+    vehicle = db.session.get(Vehicle, vehicle_id)
     if not vehicle:
         app_logger.info(f"Attempted to retrieve non-existent vehicle ID: {vehicle_id}")
         raise VehicleNotFoundError(vehicle_id=vehicle_id)
@@ -201,6 +368,23 @@ def get_vehicle(vehicle_id: int) -> Optional[VehicleResponseDTO]:
     return vehicle_dto
 
 
+def _find_by_license_plate(license_plate: str) -> Optional[Vehicle]:
+    # A lambda statement is built and cache-keyed once, not on every call; the
+    # person and officer lookups do the same (see benchmarks/bench_lookups.py).
+    return (
+        db.session.execute(
+            lambda_stmt(
+                lambda: select(Vehicle)
+                .where(Vehicle.license_plate == license_plate)
+                .limit(1)
+            )
+        )
+        .scalars()
+        .first()
+    )
+
+
+@traced
 def get_vehicle_by_license_plate(license_plate: str) -> Vehicle:
     """
     Retrieve a vehicle by its license plate from the database.
@@ -214,8 +398,77 @@ def get_vehicle_by_license_plate(license_plate: str) -> Vehicle:
     Raises:
         VehicleNotFoundError: If no vehicle with the specified license plate is found.
     """
-    vehicle = Vehicle.query.filter_by(license_plate=license_plate).first()
+    vehicle = _find_by_license_plate(license_plate)
     if not vehicle:
         app_logger.info(f"Vehicle with license plate {license_plate} not found.")
         raise VehicleNotFoundError(license_plate=license_plate)
     return vehicle
+
+
+@traced
+def get_vehicles_by_license_plates(license_plates: Iterable[str]) -> Dict[str, Vehicle]:
+    """
+    Retrieve many vehicles with one IN query per chunk of license plates.
+
+    Args:
+        license_plates (Iterable[str]): License plates to look up.
+
+    Returns:
+        Dict[str, Vehicle]: Found vehicles keyed by license plate; plates that do
+        not exist are left out.
+    """
+    vehicles = {}
+    for chunk in chunked(dict.fromkeys(license_plates)):
+        for vehicle in Vehicle.query.filter(Vehicle.license_plate.in_(chunk)):
+            vehicles[vehicle.license_plate] = vehicle
+    return vehicles
+
+
+@use_primary
+@traced
+def bulk_delete_vehicles(request: VehicleBulkDeleteDTO) -> int:
+    """
+    Delete every vehicle matching the request filters, with their infractions.
+
+    Runs as chunked set-based statements, see ``soft_delete.bulk_delete``.
+
+    Returns:
+        int: Number of vehicles deleted.
+    """
+    criteria = []
+    if request.owner_id is not None:
+        criteria.append(Vehicle.owner_id == request.owner_id)
+    in_column, in_values = None, None
+    if request.ids is not None:
+        in_column, in_values = Vehicle.id, request.ids
+    elif request.license_plates is not None:
+        in_column, in_values = Vehicle.license_plate, request.license_plates
+    try:
+        deleted = bulk_delete(
+            Vehicle,
+            *criteria,
+            in_column=in_column,
+            in_values=in_values,
+            soft=request.soft,
+        )
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        app_logger.error(f"Bulk delete of vehicles failed: {e}")
+        raise VehicleBulkDeletionError(str(e))
+    app_logger.info(f"Bulk deleted {deleted} vehicles")
+    if deleted:
+        _vehicles_changed(request.license_plates if request.ids is None else None)
+    return deleted
+
+
+########################################
+#               Warm-up                #
+########################################
+
+
+@warmup.task
+def compile_vehicle_lookups() -> None:
+    """Run the vehicle lookups once so their SQL is compiled and cached."""
+    db.session.get(Vehicle, 0)
+    _find_by_license_plate("")
+    get_vehicles_by_license_plates([""])
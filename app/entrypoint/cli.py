@@ -0,0 +1,82 @@
+# app/entrypoint/cli.py
+import datetime
+import time
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from app.domain.infractions.adapters.outbox_sink import FileSink, SocketSink
+from app.domain.infractions.services.outbox_service import (
+    DEFAULT_CONSUMER,
+    drain_outbox,
+    purge_drained_events,
+)
+from app.domain.users.services.token_service import purge_expired_revocations
+from app.infrastructure.soft_delete import purge_soft_deleted
+
+
+@click.command("purge")
+@click.option(
+    "--days",
+    type=int,
+    default=None,
+    help="Retention of soft-deleted rows; defaults to SOFT_DELETE_RETENTION_DAYS.",
+)
+@with_appcontext
+def purge_command(days):
+    """Remove expired soft-deleted rows and token revocations.
+
+    Meant to run periodically, e.g. from cron: `flask purge`.
+    """
+    if days is None:
+        days = current_app.config["SOFT_DELETE_RETENTION_DAYS"]
+    rows = purge_soft_deleted(datetime.timedelta(days=days))
+    tokens = purge_expired_revocations()
+    events = purge_drained_events(datetime.timedelta(days=days))
+    click.echo(
+        f"Purged {rows} soft-deleted rows, {tokens} token revocations "
+        f"and {events} drained outbox events."
+    )
+
+
+@click.command("drain-outbox")
+@click.option("--file", "file_path", help="Append the events to this NDJSON file.")
+@click.option("--socket", "socket_path", help="Send the events to this Unix socket.")
+@click.option(
+    "--consumer",
+    default=DEFAULT_CONSUMER,
+    show_default=True,
+    help="Name under which the position in the outbox is tracked.",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=None,
+    help="Events read per query; defaults to OUTBOX_BATCH_SIZE.",
+)
+@click.option(
+    "--follow",
+    is_flag=True,
+    help="Keep draining every OUTBOX_POLL_INTERVAL seconds instead of exiting.",
+)
+@with_appcontext
+def drain_outbox_command(file_path, socket_path, consumer, batch_size, follow):
+    """Send infraction events from the outbox to a downstream sink.
+
+    E.g. `flask drain-outbox --file events.ndjson` or, as a long-running
+    process, `flask drain-outbox --socket /run/fines.sock --follow`.
+    """
+    if (file_path is None) == (socket_path is None):
+        raise click.UsageError("Pass exactly one of --file or --socket.")
+    sink = FileSink(file_path) if file_path else SocketSink(socket_path)
+    try:
+        total = drain_outbox(sink, consumer, batch_size)
+        while follow:
+            time.sleep(current_app.config["OUTBOX_POLL_INTERVAL"])
+            total += drain_outbox(sink, consumer, batch_size)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sink.close()
+    click.echo(f"Drained {total} outbox events.")
@@ -0,0 +1,20 @@
+# app/entrypoint/debug_handler.py
+from flask import Blueprint, request
+from flask_jwt_extended import jwt_required
+
+from app.commons.responses import handle_api_response
+from app.extensions import tracer
+
+debug_blueprint = Blueprint("debug", __name__)
+
+
+@debug_blueprint.route("/debug/traces", methods=["GET"])
+@jwt_required()
+def recent_traces():
+    """The last recorded request traces, newest first; 404 unless tracing is on."""
+    if not tracer.enabled:
+        return handle_api_response(
+            error={"message": "Tracing is disabled"}, status_code=404
+        )
+    limit = request.args.get("limit", 20, type=int)
+    return handle_api_response(data={"traces": tracer.recent(limit)})
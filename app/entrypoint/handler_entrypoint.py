@@ -3,12 +3,23 @@ from app import create_app
 from app.domain.infractions import infraction_blueprint
 from app.domain.users import officer_blueprint, person_blueprint
 from app.domain.vehicles import vehicle_blueprint
+from app.entrypoint.cli import drain_outbox_command, purge_command
+from app.entrypoint.debug_handler import debug_blueprint
+from app.entrypoint.health_handler import health_blueprint
+from app.entrypoint.metrics_handler import metrics_blueprint
+from app.extensions import warmup
 
 app = create_app()
 app.register_blueprint(person_blueprint, url_prefix="/persons")
 app.register_blueprint(officer_blueprint, url_prefix="/officers")
 app.register_blueprint(infraction_blueprint, url_prefix="/infractions")
 app.register_blueprint(vehicle_blueprint, url_prefix="/vehicles")
+app.register_blueprint(metrics_blueprint)
+app.register_blueprint(health_blueprint)
+app.register_blueprint(debug_blueprint)
+app.cli.add_command(purge_command)
+app.cli.add_command(drain_outbox_command)
 
 if __name__ == "__main__":
+    warmup.start()
     app.run(host="0.0.0.0", debug=True)
@@ -0,0 +1,31 @@
+# app/entrypoint/health_handler.py
+from flask import Blueprint
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.commons.responses import handle_api_response
+from app.extensions import db, warmup
+from app.infrastructure.logger import app_logger
+
+health_blueprint = Blueprint("health", __name__)
+
+
+@health_blueprint.route("/health/live", methods=["GET"])
+def liveness():
+    """The process answers requests; restart it when this fails."""
+    return handle_api_response(data={"status": "alive"})
+
+
+@health_blueprint.route("/health/ready", methods=["GET"])
+def readiness():
+    """Route traffic here only once warm-up is done and the database answers."""
+    if not warmup.ready:
+        return handle_api_response(error={"status": "warming up"}, status_code=503)
+    try:
+        db.session.execute(text("SELECT 1"))
+    except SQLAlchemyError as e:
+        app_logger.warning(f"Readiness check failed: {e}")
+        return handle_api_response(
+            error={"status": "database unavailable"}, status_code=503
+        )
+    return handle_api_response(data={"status": "ready"})
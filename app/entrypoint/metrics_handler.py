@@ -0,0 +1,14 @@
+# app/entrypoint/metrics_handler.py
+from flask import Blueprint, Response
+
+from app.extensions import metrics
+
+metrics_blueprint = Blueprint("metrics", __name__)
+
+
+@metrics_blueprint.route("/metrics", methods=["GET"])
+def expose_metrics():
+    """Endpoint scraped by Prometheus."""
+    return Response(
+        metrics.render(), mimetype="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -1,3 +1,17 @@
-from flask_sqlalchemy import SQLAlchemy
+from app.infrastructure.database import RoutingSQLAlchemy
+from app.infrastructure.jobs import JobRunner
+from app.infrastructure.log_policy import LogPolicy
+from app.infrastructure.metrics import Metrics
+from app.infrastructure.profiler import RequestProfiler
+from app.infrastructure.rate_limiter import RateLimiter
+from app.infrastructure.tracing import Tracer
+from app.infrastructure.warmup import Warmup
 
-db = SQLAlchemy()
+db = RoutingSQLAlchemy()
+job_runner = JobRunner()
+log_policy = LogPolicy()
+metrics = Metrics()
+profiler = RequestProfiler()
+rate_limiter = RateLimiter()
+tracer = Tracer()
+warmup = Warmup()
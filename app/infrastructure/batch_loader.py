@@ -0,0 +1,101 @@
+# app/infrastructure/batch_loader.py
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from flask import g, has_app_context
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class Deferred(Generic[K, V]):
+    """A key registered with ``RequestBatchLoader.defer``, resolved on ``get``."""
+
+    __slots__ = ("_loader", "_key")
+
+    def __init__(self, loader: "RequestBatchLoader[K, V]", key: K):
+        self._loader = loader
+        self._key = key
+
+    def get(self) -> Optional[V]:
+        return self._loader.load(self._key)
+
+
+class RequestBatchLoader(Generic[K, V]):
+    """
+    Coalesces single-key lookups made during one request into batched calls.
+
+    ``batch_fn`` receives a list of keys and returns a mapping with the ones it
+    found. Results, including misses, are memoized on ``flask.g`` for the rest
+    of the request (or app context, for background jobs), so repeated lookups
+    are free. Call ``clear`` after writing to something that was loaded.
+
+    Keys registered with ``defer`` are fetched together with the first lookup
+    that actually needs a value, which turns loops of the form
+    "for each row, look up its owner" into a single query::
+
+        pending = [loader.defer(row.plate) for row in rows]
+        vehicles = [item.get() for item in pending]
+
+    Without an app context there is nowhere to memoize, so every call goes
+    straight to ``batch_fn``.
+    """
+
+    def __init__(self, name: str, batch_fn: Callable[[List[K]], Mapping[K, V]]):
+        self.name = name
+        self.batch_fn = batch_fn
+
+    def _state(self) -> Optional[Tuple[Dict[K, Optional[V]], List[K]]]:
+        if not has_app_context():
+            return None
+        loaders = g.setdefault("_batch_loaders", {})
+        return loaders.setdefault(self.name, ({}, []))
+
+    def defer(self, key: K) -> Deferred[K, V]:
+        state = self._state()
+        if state is not None and key not in state[0]:
+            state[1].append(key)
+        return Deferred(self, key)
+
+    def load(self, key: K) -> Optional[V]:
+        return self.load_many([key])[key]
+
+    def load_many(self, keys: Iterable[K]) -> Dict[K, Optional[V]]:
+        keys = list(dict.fromkeys(keys))
+        state = self._state()
+        if state is None:
+            found = self.batch_fn(keys) if keys else {}
+            return {key: found.get(key) for key in keys}
+
+        cache, pending = state
+        wanted = [key for key in dict.fromkeys(pending + keys) if key not in cache]
+        pending.clear()
+        if wanted:
+            found = self.batch_fn(wanted)
+            for key in wanted:
+                cache[key] = found.get(key)
+        return {key: cache[key] for key in keys}
+
+    def prime(self, key: K, value: Optional[V]) -> None:
+        state = self._state()
+        if state is not None:
+            state[0][key] = value
+
+    def clear(self, key: Optional[K] = None) -> None:
+        state = self._state()
+        if state is None:
+            return
+        if key is None:
+            state[0].clear()
+        else:
+            state[0].pop(key, None)
@@ -0,0 +1,66 @@
+# app/infrastructure/cache.py
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from app.extensions import metrics
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded in-process cache.
+
+    Entries never expire on their own; callers decide what is safe to cache and
+    drop entries with ``discard`` when the data behind them changes. Every
+    lookup is reported to ``/metrics`` under the cache ``name``. ``on_evict``
+    is called with the key and value of entries dropped to make room.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+    ):
+        self.name = name
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is not _MISSING:
+                self._data.move_to_end(key)
+        metrics.record_cache_access(self.name, value is not _MISSING)
+        return default if value is _MISSING else value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        evicted = []
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                evicted.append(self._data.popitem(last=False))
+        if self.on_evict is not None:
+            for item in evicted:
+                self.on_evict(*item)
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
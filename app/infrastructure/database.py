@@ -0,0 +1,126 @@
+# app/infrastructure/database.py
+import sqlite3
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Optional, Set
+
+from flask_sqlalchemy import SignallingSession, SQLAlchemy
+from sqlalchemy import event, orm
+from sqlalchemy.engine import Engine
+
+REPLICA_BIND = "replica"
+
+# None: default routing, "replica": reads may use the replica,
+# "primary": everything stays on the primary (wins over nested replica scopes).
+_route: ContextVar[Optional[str]] = ContextVar("db_route", default=None)
+
+# Tables created and maintained by the database itself (e.g. a SQLite FTS5
+# table and its shadow tables). Models register them here so Alembic
+# autogenerate does not offer to drop them.
+unmanaged_tables: Set[str] = set()
+
+
+@event.listens_for(Engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    # SQLite ignores foreign keys, and with them the ON DELETE actions the
+    # models rely on, unless every connection turns them on.
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+class RoutingSession(SignallingSession):
+    """
+    Session that sends reads made inside ``use_replica`` to the replica engine.
+
+    Statements go to the primary when any of these holds:
+      * no replica is configured (``SQLALCHEMY_BINDS["replica"]``);
+      * the statement is an INSERT, UPDATE or DELETE;
+      * the session has pending changes or has already flushed in this
+        request, so a flow that wrote keeps reading its own writes;
+      * the caller is inside a ``use_primary`` scope.
+    """
+
+    def __init__(self, db, **options):
+        self.db = db
+        super().__init__(db, **options)
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if _route.get() == REPLICA_BIND and self._replica_allowed(clause):
+            binds = self.app.config.get("SQLALCHEMY_BINDS") or {}
+            if REPLICA_BIND in binds:
+                return self.db.get_engine(self.app, bind=REPLICA_BIND)
+        if (
+            mapper is not None
+            and self.bind is not None
+            and mapper.persist_selectable.info.get("bind_key") is None
+        ):
+            # Flask-SQLAlchemy lists every table in ``binds``, which makes the
+            # base implementation walk the whole statement to find the default
+            # engine; models without a bind key always use ``self.bind``.
+            return self.bind
+        return super().get_bind(mapper=mapper, clause=clause)
+
+    def _replica_allowed(self, clause) -> bool:
+        if clause is not None and getattr(clause, "is_dml", False):
+            return False
+        if self.info.get("wrote") or self._flushing:
+            return False
+        return not (self.new or self.dirty or self.deleted)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_session_wrote(session, flush_context):
+    session.info["wrote"] = True
+
+
+class RoutingSQLAlchemy(SQLAlchemy):
+    def create_session(self, options):
+        return orm.sessionmaker(class_=RoutingSession, db=self, **options)
+
+
+@contextmanager
+def replica_scope():
+    token = _route.set(_route.get() or REPLICA_BIND)
+    try:
+        yield
+    finally:
+        _route.reset(token)
+
+
+@contextmanager
+def primary_scope():
+    token = _route.set("primary")
+    try:
+        yield
+    finally:
+        _route.reset(token)
+
+
+def use_replica(fn):
+    """Let the reads made by ``fn`` go to the read replica when one is configured."""
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with replica_scope():
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def use_primary(fn):
+    """Keep every statement made by ``fn`` (and the functions it calls) on the primary."""
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with primary_scope():
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """Alembic ``include_object`` hook that skips ``unmanaged_tables``."""
+    return not (type_ == "table" and reflected and name in unmanaged_tables)
@@ -0,0 +1,58 @@
+# app/infrastructure/jobs.py
+import atexit
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from app.infrastructure.logger import app_logger
+
+
+class JobRunner:
+    """
+    Runs slow work off the request thread on a bounded local thread pool.
+
+    Each job runs inside its own application context, so it gets its own
+    database session and returns its connection to the pool when it ends.
+    The pool only holds work in memory: persist anything a client needs to
+    poll (see ``ReportJob``). With ``JOB_RUN_INLINE`` jobs run synchronously,
+    which keeps tests and one-off scripts deterministic.
+    """
+
+    def __init__(self, app=None):
+        self._app = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.inline = False
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("JOB_WORKERS", 2)
+        app.config.setdefault("JOB_RUN_INLINE", False)
+        app.extensions["job_runner"] = self
+
+        self._app = app
+        self.inline = bool(app.config["JOB_RUN_INLINE"])
+        if not self.inline and self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=int(app.config["JOB_WORKERS"]), thread_name_prefix="job"
+            )
+            atexit.register(self._executor.shutdown, wait=False)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        if self._app is None:
+            raise RuntimeError("JobRunner.init_app() has not been called")
+        if self.inline or self._executor is None:
+            future: Future = Future()
+            try:
+                future.set_result(self._run(fn, *args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        return self._executor.submit(self._run, fn, *args, **kwargs)
+
+    def _run(self, fn: Callable, *args, **kwargs):
+        with self._app.app_context():
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                app_logger.error(f"Background job {fn.__name__} failed: {e}")
+                raise
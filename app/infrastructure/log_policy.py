@@ -0,0 +1,125 @@
+# app/infrastructure/log_policy.py
+import logging
+import random
+from typing import Any, Callable, Dict, Optional
+
+from flask import g, has_request_context, request
+
+from app.infrastructure.logger import app_logger
+
+# Share of the records of each event that is kept; events not listed keep all.
+# Only INFO and DEBUG records are sampled.
+DEFAULT_SAMPLE_RATES = {
+    "infraction.retrieved": 0.01,
+    "officer.retrieved": 0.01,
+    "person.retrieved": 0.01,
+    "persons.retrieved": 0.1,
+    "report.generated": 0.1,
+}
+
+# INFO and DEBUG records a single request may emit.
+DEFAULT_ROUTE_BUDGET = 20
+
+
+class lazy:
+    """
+    A log argument computed only if the record is emitted, e.g.
+    ``app_logger.info("Report %s", lazy(json.dumps, report))``.
+    """
+
+    __slots__ = ("fn", "args")
+
+    def __init__(self, fn: Callable[..., Any], *args: Any):
+        self.fn = fn
+        self.args = args
+
+    def __str__(self) -> str:
+        return str(self.fn(*self.args))
+
+    __repr__ = __str__
+
+
+class LogPolicy(logging.Filter):
+    """
+    Decides which INFO and DEBUG records of ``app_logger`` are worth their
+    formatting and I/O; warnings and errors always pass.
+
+      * Records logged with ``log_event`` (or ``extra={"event": name}``) are
+        kept with the probability ``LOG_SAMPLE_RATES`` gives their event.
+      * Each request emits at most ``LOG_ROUTE_BUDGET`` of them, or the budget
+        ``LOG_ROUTE_BUDGETS`` gives its endpoint; one record at the end of the
+        request counts those it dropped.
+
+    It runs before the record is formatted, so dropped records never convert
+    their arguments to text.
+    """
+
+    def __init__(self, app=None):
+        super().__init__()
+        self.sample_rates: Dict[str, float] = dict(DEFAULT_SAMPLE_RATES)
+        self.route_budget: Optional[int] = DEFAULT_ROUTE_BUDGET
+        self.route_budgets: Dict[str, int] = {}
+        self._random = random.random
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("LOG_SAMPLE_RATES", {})
+        app.config.setdefault("LOG_ROUTE_BUDGET", DEFAULT_ROUTE_BUDGET)
+        app.config.setdefault("LOG_ROUTE_BUDGETS", {})
+        self.sample_rates = {**DEFAULT_SAMPLE_RATES, **app.config["LOG_SAMPLE_RATES"]}
+        self.route_budget = app.config["LOG_ROUTE_BUDGET"]
+        self.route_budgets = dict(app.config["LOG_ROUTE_BUDGETS"])
+        app.extensions["log_policy"] = self
+        if self not in app_logger.filters:
+            app_logger.addFilter(self)
+        app.teardown_request(self._report_suppressed)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or getattr(record, "exempt", False):
+            return True
+        event = getattr(record, "event", None)
+        if event is not None:
+            rate = self.sample_rates.get(event, 1.0)
+            if rate < 1.0 and self._random() >= rate:
+                return False
+        if not has_request_context():
+            return True
+        budget = self.route_budgets.get(request.endpoint, self.route_budget)
+        if budget is None:
+            return True
+        emitted = g.get("_log_emitted", 0)
+        if emitted >= budget:
+            g._log_suppressed = g.get("_log_suppressed", 0) + 1
+            return False
+        g._log_emitted = emitted + 1
+        return True
+
+    def _report_suppressed(self, exc=None) -> None:
+        suppressed = g.pop("_log_suppressed", 0)
+        g.pop("_log_emitted", None)
+        if suppressed:
+            app_logger.info(
+                "%s suppressed %d log records over its budget",
+                request.endpoint,
+                suppressed,
+                extra={"exempt": True},
+            )
+
+
+def log_event(event: str, level: int = logging.INFO, **fields: Any) -> None:
+    """
+    Log ``event`` with ``fields`` as ``event key=value ...``.
+
+    Nothing is formatted unless the record passes the level and the
+    ``LogPolicy``; pass ``lazy`` values for fields that are costly to compute.
+    """
+    if not app_logger.isEnabledFor(level):
+        return
+    app_logger.log(
+        level,
+        "%s" + " %s=%s" * len(fields),
+        event,
+        *(item for pair in fields.items() for item in pair),
+        extra={"event": event},
+    )
@@ -1,6 +1,12 @@
 # logger.py
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Records are handed to a background thread through this queue so request
+# threads never block on file I/O. Its depth is exported by the metrics module.
+log_queue = queue.Queue(-1)
 
 
 def setup_logger(name):
@@ -15,7 +21,11 @@ def setup_logger(name):
     )
     handler.setFormatter(formatter)
 
-    logger.addHandler(handler)
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
 
@@ -0,0 +1,456 @@
+# app/infrastructure/metrics.py
+import atexit
+import glob
+import json
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from flask import g, request
+
+from app.infrastructure.logger import app_logger, log_queue
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class _ThreadShards:
+    """
+    Per-thread value dictionaries.
+
+    Writers only touch the dictionary owned by their own thread, so the hot path
+    takes no lock. Readers copy every shard (an atomic operation under the GIL)
+    and fold the shards of finished threads into ``_retired`` so short-lived
+    request threads do not accumulate.
+    """
+
+    def __init__(self, merge: Callable):
+        self._merge = merge
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[Tuple[weakref.ref, dict]] = []
+        self._retired: dict = {}
+
+    def local(self) -> dict:
+        values = getattr(self._local, "values", None)
+        if values is None:
+            values = self._local.values = {}
+            with self._lock:
+                self._shards.append((weakref.ref(threading.current_thread()), values))
+        return values
+
+    def collect(self) -> dict:
+        with self._lock:
+            alive = []
+            for thread_ref, values in self._shards:
+                if thread_ref() is None:
+                    self._merge(self._retired, values.copy())
+                else:
+                    alive.append((thread_ref, values))
+            self._shards = alive
+            result: dict = {}
+            self._merge(result, self._retired)
+            for _, values in alive:
+                self._merge(result, values.copy())
+        return result
+
+
+def _merge_counters(target: dict, source: dict) -> None:
+    for key, value in source.items():
+        target[key] = target.get(key, 0.0) + value
+
+
+def _merge_histograms(target: dict, source: dict) -> None:
+    for key, value in source.items():
+        current = target.get(key)
+        if current is None:
+            target[key] = list(value)
+        else:
+            for i, item in enumerate(value):
+                current[i] += item
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = _ThreadShards(_merge_counters)
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        values = self._values.local()
+        values[labels] = values.get(labels, 0.0) + amount
+
+    def collect(self) -> Dict[LabelValues, float]:
+        return self._values.collect()
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = _ThreadShards(_merge_histograms)
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        values = self._values.local()
+        # Layout: one slot per bucket, then +Inf, then the sum of observations.
+        slots = values.get(labels)
+        if slots is None:
+            slots = values[labels] = [0.0] * (len(self.buckets) + 2)
+        slots[bisect_left(self.buckets, value)] += 1
+        slots[-1] += value
+
+    def collect(self) -> Dict[LabelValues, List[float]]:
+        return self._values.collect()
+
+
+class Metrics:
+    """
+    Process-local Prometheus metrics for the Flask app.
+
+    Counters and histograms are sharded per thread. When
+    ``METRICS_MULTIPROC_DIR`` is set, each worker periodically writes its
+    snapshot to ``metrics-<pid>.json`` in that directory and ``/metrics``
+    merges every worker's snapshot, so whichever worker answers the scrape
+    reports the totals for the whole server. Snapshots of exited workers, and
+    those not rewritten within ``METRICS_SNAPSHOT_MAX_AGE`` seconds (say, of a
+    PID since reused), are deleted instead: their counts drop out of the totals,
+    which Prometheus treats as a counter reset.
+    """
+
+    def __init__(self, app=None):
+        self.requests_total = Counter(
+            "http_requests_total",
+            "HTTP requests by route, method and status code.",
+            ("endpoint", "method", "status"),
+        )
+        self.request_duration = Histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by route and method.",
+            ("endpoint", "method"),
+        )
+        self.pool_wait = Histogram(
+            "db_pool_checkout_wait_seconds",
+            "Time spent waiting for a connection from the SQLAlchemy pool.",
+            (),
+            buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+        )
+        self.cache_requests = Counter(
+            "cache_requests_total",
+            "Cache lookups by cache name and result (hit or miss).",
+            ("cache", "result"),
+        )
+        self._gauges: Dict[str, Tuple[str, Callable[[], Dict[LabelValues, float]]]] = {}
+        self._gauge_labels: Dict[str, Tuple[str, ...]] = {}
+        self._multiproc_dir: Optional[str] = None
+        self._flush_interval = 5.0
+        self._snapshot_max_age = 600.0
+        self._last_flush = 0.0
+        self._engines = weakref.WeakSet()
+
+        self.register_gauge(
+            "log_queue_depth",
+            "Log records waiting to be written by the logging thread.",
+            (),
+            lambda: {(): float(log_queue.qsize())},
+        )
+        self.register_gauge(
+            "cache_hit_ratio",
+            "Hits divided by lookups for each cache since process start.",
+            ("cache",),
+            self._cache_hit_ratio,
+        )
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("METRICS_ENABLED", True)
+        app.config.setdefault(
+            "METRICS_MULTIPROC_DIR", os.environ.get("METRICS_MULTIPROC_DIR")
+        )
+        app.config.setdefault("METRICS_FLUSH_INTERVAL", 5.0)
+        app.config.setdefault("METRICS_SNAPSHOT_MAX_AGE", 600.0)
+        app.extensions["metrics"] = self
+        if not app.config["METRICS_ENABLED"]:
+            return
+
+        self._multiproc_dir = app.config["METRICS_MULTIPROC_DIR"]
+        self._flush_interval = float(app.config["METRICS_FLUSH_INTERVAL"])
+        self._snapshot_max_age = float(app.config["METRICS_SNAPSHOT_MAX_AGE"])
+        if self._multiproc_dir:
+            os.makedirs(self._multiproc_dir, exist_ok=True)
+            atexit.register(self.flush)
+
+        app.before_request(self._start_timer)
+        app.after_request(self._record_request)
+
+    ########################################
+    #            Instrumentation           #
+    ########################################
+
+    def register_gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str],
+        callback: Callable[[], Dict[LabelValues, float]],
+    ) -> None:
+        """Register a gauge whose samples are read from ``callback`` at scrape time."""
+        self._gauges[name] = (documentation, callback)
+        self._gauge_labels[name] = tuple(labelnames)
+
+    def record_cache_access(self, cache_name: str, hit: bool) -> None:
+        self.cache_requests.inc((cache_name, "hit" if hit else "miss"))
+
+    def instrument_engine(self, engine) -> None:
+        """Expose pool gauges and time pool checkouts for ``engine``."""
+        if engine in self._engines:
+            return
+        self._engines.add(engine)
+        self._wrap_pool(engine.pool)
+        from sqlalchemy import event
+
+        event.listen(
+            engine, "engine_disposed", lambda conn: self._wrap_pool(engine.pool)
+        )
+
+    def _wrap_pool(self, pool) -> None:
+        if getattr(pool, "_metrics_wrapped", False):
+            return
+        connect = pool.connect
+        histogram = self.pool_wait
+
+        def timed_connect():
+            start = time.perf_counter()
+            try:
+                return connect()
+            finally:
+                histogram.observe(time.perf_counter() - start)
+
+        pool.connect = timed_connect
+        pool._metrics_wrapped = True
+
+    def _pool_samples(self, attribute: str) -> Dict[LabelValues, float]:
+        samples = {}
+        for engine in list(self._engines):
+            reader = getattr(engine.pool, attribute, None)
+            if callable(reader):
+                samples[(engine.url.render_as_string(hide_password=True),)] = float(
+                    reader()
+                )
+        return samples
+
+    def _cache_hit_ratio(self) -> Dict[LabelValues, float]:
+        totals: Dict[str, List[float]] = {}
+        for (cache, result), value in self._counter_values(self.cache_requests).items():
+            hits_and_total = totals.setdefault(cache, [0.0, 0.0])
+            if result == "hit":
+                hits_and_total[0] += value
+            hits_and_total[1] += value
+        return {
+            (cache,): hits / total for cache, (hits, total) in totals.items() if total
+        }
+
+    def _start_timer(self):
+        g._metrics_start = time.perf_counter()
+
+    def _record_request(self, response):
+        start = getattr(g, "_metrics_start", None)
+        if start is not None:
+            endpoint = request.endpoint or "unmatched"
+            self.request_duration.observe(
+                time.perf_counter() - start, (endpoint, request.method)
+            )
+            self.requests_total.inc(
+                (endpoint, request.method, str(response.status_code))
+            )
+        if self._multiproc_dir:
+            now = time.monotonic()
+            if now - self._last_flush >= self._flush_interval:
+                self._last_flush = now
+                self.flush()
+        return response
+
+    ########################################
+    #        Multi-process snapshots       #
+    ########################################
+
+    def _snapshot(self) -> dict:
+        return {
+            "counters": {
+                metric.name: [[list(k), v] for k, v in metric.collect().items()]
+                for metric in (self.requests_total, self.cache_requests)
+            },
+            "histograms": {
+                metric.name: [[list(k), v] for k, v in metric.collect().items()]
+                for metric in (self.request_duration, self.pool_wait)
+            },
+        }
+
+    def flush(self) -> None:
+        """Write this worker's counters and histograms to the shared directory."""
+        if not self._multiproc_dir:
+            return
+        path = os.path.join(self._multiproc_dir, f"metrics-{os.getpid()}.json")
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w") as handle:
+                json.dump(self._snapshot(), handle)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            app_logger.error(f"Failed to flush metrics snapshot: {e}")
+
+    def _other_snapshots(self) -> List[dict]:
+        if not self._multiproc_dir:
+            return []
+        own = os.path.join(self._multiproc_dir, f"metrics-{os.getpid()}.json")
+        oldest = time.time() - self._snapshot_max_age
+        snapshots = []
+        for path in glob.glob(os.path.join(self._multiproc_dir, "metrics-*.json")):
+            if path == own:
+                continue
+            try:
+                if _is_stale(path, oldest):
+                    os.remove(path)
+                    continue
+                with open(path) as handle:
+                    snapshots.append(json.load(handle))
+            except (OSError, ValueError):
+                continue
+        return snapshots
+
+    def _counter_values(self, metric: Counter, snapshots=()) -> dict:
+        values = metric.collect()
+        for snapshot in snapshots:
+            for labels, value in snapshot["counters"].get(metric.name, []):
+                _merge_counters(values, {tuple(labels): value})
+        return values
+
+    def _histogram_values(self, metric: Histogram, snapshots=()) -> dict:
+        values = metric.collect()
+        for snapshot in snapshots:
+            for labels, slots in snapshot["histograms"].get(metric.name, []):
+                _merge_histograms(values, {tuple(labels): slots})
+        return values
+
+    ########################################
+    #              Exposition              #
+    ########################################
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        snapshots = self._other_snapshots()
+        lines: List[str] = []
+
+        for metric in (self.requests_total, self.cache_requests):
+            lines += _header(metric.name, metric.documentation, "counter")
+            for labels, value in sorted(
+                self._counter_values(metric, snapshots).items()
+            ):
+                lines.append(
+                    f"{metric.name}{_labels(metric.labelnames, labels)} {value:g}"
+                )
+
+        for metric in (self.request_duration, self.pool_wait):
+            lines += _header(metric.name, metric.documentation, "histogram")
+            values = self._histogram_values(metric, snapshots)
+            for labels, slots in sorted(values.items()):
+                cumulative = 0.0
+                bounds = [f"{b:g}" for b in metric.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, slots[:-1]):
+                    cumulative += count
+                    bucket_labels = _labels(
+                        metric.labelnames + ("le",), labels + (bound,)
+                    )
+                    lines.append(f"{metric.name}_bucket{bucket_labels} {cumulative:g}")
+                label_text = _labels(metric.labelnames, labels)
+                lines.append(f"{metric.name}_sum{label_text} {slots[-1]:g}")
+                lines.append(f"{metric.name}_count{label_text} {cumulative:g}")
+
+        gauges = dict(self._gauges)
+        gauges.update(
+            {
+                "db_pool_checked_out": (
+                    "Connections currently checked out of the pool.",
+                    lambda: self._pool_samples("checkedout"),
+                ),
+                "db_pool_overflow": (
+                    "Connections opened beyond the pool size.",
+                    lambda: self._pool_samples("overflow"),
+                ),
+                "db_pool_size": (
+                    "Configured size of the pool.",
+                    lambda: self._pool_samples("size"),
+                ),
+            }
+        )
+        pid = str(os.getpid())
+        for name, (documentation, callback) in gauges.items():
+            labelnames = self._gauge_labels.get(name, ("engine",))
+            lines += _header(name, documentation, "gauge")
+            try:
+                samples = callback()
+            except Exception as e:
+                app_logger.error(f"Failed to collect gauge {name}: {e}")
+                continue
+            for labels, value in sorted(samples.items()):
+                label_text = _labels(labelnames + ("pid",), labels + (pid,))
+                lines.append(f"{name}{label_text} {value:g}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _is_stale(path: str, oldest: float) -> bool:
+    """Whether the snapshot was last written before ``oldest`` or its worker exited."""
+    if os.path.getmtime(path) < oldest:
+        return True
+    pid = os.path.basename(path)[len("metrics-") : -len(".json")]
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except (ValueError, PermissionError):
+        # Not a PID, or a live process owned by another user.
+        pass
+    return False
+
+
+def _header(name: str, documentation: str, kind: str) -> List[str]:
+    return [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+
+
+def _labels(names: Tuple[str, ...], values: LabelValues) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
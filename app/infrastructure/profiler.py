@@ -0,0 +1,116 @@
+# app/infrastructure/profiler.py
+import cProfile
+import hmac
+import itertools
+import os
+import random
+import re
+import time
+from typing import Optional
+
+from flask import g, request
+
+from app.infrastructure.logger import app_logger
+
+_sequence = itertools.count()
+
+
+class RequestProfiler:
+    """
+    Opt-in cProfile capture for live requests.
+
+    A request is profiled when either:
+      * it is picked by sampling (``PROFILER_SAMPLE_RATE``, 0.0 - 1.0), or
+      * it carries the ``PROFILER_HEADER`` header whose value matches
+        ``PROFILER_TOKEN``.
+
+    Each profile is written as a pstats file under
+    ``PROFILER_OUTPUT_DIR/<endpoint>/``; open it with ``python -m pstats`` or
+    turn it into a flamegraph with tools such as snakeviz or flameprof. Only
+    the newest ``PROFILER_MAX_FILES_PER_ROUTE`` files are kept per endpoint.
+    """
+
+    def __init__(self, app=None):
+        self.sample_rate = 0.0
+        self.header = "X-Profile"
+        self.token: Optional[str] = None
+        self.output_dir = "profiles"
+        self.max_files = 50
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("PROFILER_SAMPLE_RATE", 0.0)
+        app.config.setdefault("PROFILER_HEADER", "X-Profile")
+        app.config.setdefault("PROFILER_TOKEN", os.environ.get("PROFILER_TOKEN"))
+        app.config.setdefault("PROFILER_OUTPUT_DIR", "profiles")
+        app.config.setdefault("PROFILER_MAX_FILES_PER_ROUTE", 50)
+        app.extensions["profiler"] = self
+
+        self.sample_rate = float(app.config["PROFILER_SAMPLE_RATE"])
+        self.header = app.config["PROFILER_HEADER"]
+        self.token = app.config["PROFILER_TOKEN"]
+        self.output_dir = app.config["PROFILER_OUTPUT_DIR"]
+        self.max_files = int(app.config["PROFILER_MAX_FILES_PER_ROUTE"])
+
+        if self.sample_rate <= 0 and not self.token:
+            return
+        app.before_request(self._start)
+        app.after_request(self._add_header)
+        app.teardown_request(self._stop)
+
+    def _requested_by_header(self) -> bool:
+        value = request.headers.get(self.header)
+        return bool(self.token and value and hmac.compare_digest(value, self.token))
+
+    def _start(self):
+        if not (
+            self._requested_by_header()
+            or (self.sample_rate > 0 and random.random() < self.sample_rate)
+        ):
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already active on this thread.
+            return
+        g._profiler = profiler
+        g._profile_file = self._profile_path(request.endpoint or "unmatched")
+
+    def _add_header(self, response):
+        if getattr(g, "_profiler", None) is not None and self._requested_by_header():
+            response.headers["X-Profile-File"] = g._profile_file
+        return response
+
+    def _stop(self, exc=None):
+        profiler = g.pop("_profiler", None)
+        if profiler is None:
+            return
+        profiler.disable()
+        path = os.path.join(self.output_dir, g.pop("_profile_file"))
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            profiler.dump_stats(path)
+            self._prune(os.path.dirname(path))
+            app_logger.info(f"Request profile written to {path}")
+        except OSError as e:
+            app_logger.error(f"Failed to write request profile {path}: {e}")
+
+    @staticmethod
+    def _profile_path(endpoint: str) -> str:
+        folder = re.sub(r"[^A-Za-z0-9_.-]", "_", endpoint)
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        name = f"{stamp}-{os.getpid()}-{next(_sequence)}.pstats"
+        return os.path.join(folder, name)
+
+    def _prune(self, folder: str) -> None:
+        files = sorted(
+            (entry for entry in os.scandir(folder) if entry.name.endswith(".pstats")),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        for entry in files[: max(0, len(files) - self.max_files)]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
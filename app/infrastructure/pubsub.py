@@ -0,0 +1,234 @@
+# app/infrastructure/pubsub.py
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Hashable, List, Optional, Set, Tuple
+
+from app.infrastructure.logger import app_logger
+
+
+class BrokerFullError(Exception):
+    """Exception raised when a broker already has its maximum of subscribers."""
+
+    def __init__(self, name: str, limit: int):
+        self.message = f"The {name} feed already has {limit} subscribers."
+        super().__init__(self.message)
+
+
+class SubscriptionDropped(Exception):
+    """Raised to a subscriber that fell too far behind and was disconnected."""
+
+
+class Subscription:
+    """
+    One consumer of a ``Broker``: a bounded buffer of the events matching
+    ``predicate``. Consumers read it with ``get`` and must ``close`` it.
+    """
+
+    def __init__(
+        self, broker: "Broker", predicate: Callable[[Any], bool], maxsize: int
+    ):
+        self.broker = broker
+        self.predicate = predicate
+        self.dropped = False
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize)
+
+    def offer(self, event: Any) -> bool:
+        """Buffer ``event`` without blocking; False if the buffer is full."""
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            return False
+
+    def get(self, timeout: float) -> Optional[Any]:
+        """
+        Next event, or None if none arrived within ``timeout`` seconds.
+
+        Raises:
+            SubscriptionDropped: If the broker disconnected this subscriber.
+        """
+        if self.dropped:
+            raise SubscriptionDropped()
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            if self.dropped:
+                raise SubscriptionDropped()
+            return None
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+
+class Broker:
+    """
+    In-process publish/subscribe with one bounded buffer per subscriber.
+
+    ``publish`` never blocks: a subscriber whose buffer is full is dropped and
+    its next ``get`` raises ``SubscriptionDropped``, so one slow consumer
+    cannot hold back the others or grow memory. Events published with an
+    ``event_id`` are delivered once even when published twice, e.g. locally
+    and again by a ``PollingRelay``; the last ``dedupe_window`` ids are kept.
+    """
+
+    def __init__(self, name: str, dedupe_window: int = 10000):
+        self.name = name
+        self._subscribers: List[Subscription] = []
+        self._seen: Set[Hashable] = set()
+        self._seen_order: "deque[Hashable]" = deque()
+        self._dedupe_window = dedupe_window
+        self._lock = threading.Lock()
+
+    def subscribe(
+        self,
+        predicate: Callable[[Any], bool] = lambda event: True,
+        maxsize: int = 100,
+        max_subscribers: Optional[int] = None,
+    ) -> Subscription:
+        with self._lock:
+            if (
+                max_subscribers is not None
+                and len(self._subscribers) >= max_subscribers
+            ):
+                raise BrokerFullError(self.name, max_subscribers)
+            subscription = Subscription(self, predicate, maxsize)
+            self._subscribers.append(subscription)
+            return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def mark_published(self, event_id: Hashable) -> None:
+        """Treat ``event_id`` as delivered, so publishing it does nothing."""
+        with self._lock:
+            self._remember(event_id)
+
+    def _remember(self, event_id: Hashable) -> bool:
+        if event_id in self._seen:
+            return False
+        self._seen.add(event_id)
+        self._seen_order.append(event_id)
+        while len(self._seen_order) > self._dedupe_window:
+            self._seen.discard(self._seen_order.popleft())
+        return True
+
+    def publish(self, event: Any, event_id: Optional[Hashable] = None) -> int:
+        """
+        Hand ``event`` to every matching subscriber.
+
+        Returns:
+            int: Subscribers that received it; 0 for an already published id.
+        """
+        with self._lock:
+            if event_id is not None and not self._remember(event_id):
+                return 0
+            subscribers = list(self._subscribers)
+
+        delivered = 0
+        for subscription in subscribers:
+            try:
+                if not subscription.predicate(event):
+                    continue
+            except Exception as e:
+                app_logger.error(f"Subscriber filter of {self.name} failed: {e}")
+                continue
+            if subscription.offer(event):
+                delivered += 1
+            else:
+                subscription.dropped = True
+                self.unsubscribe(subscription)
+                app_logger.warning(f"Dropped a slow {self.name} subscriber")
+        return delivered
+
+
+class PollingRelay:
+    """
+    Republishes events that other processes committed, by polling the
+    database with a keyset cursor.
+
+    ``head()`` returns the current cursor position and ``fetch(after, limit)``
+    up to ``limit`` ``(position, event_id, event)`` tuples past ``after``, in
+    order. Every poll re-reads the last ``lookback`` positions, so rows whose
+    transaction committed after a later position was seen are not missed; the
+    broker skips the ids it already delivered. The relay thread only runs
+    while the broker has subscribers.
+    """
+
+    def __init__(
+        self,
+        broker: Broker,
+        head: Callable[[], int],
+        fetch: Callable[[int, int], List[Tuple[int, Hashable, Any]]],
+        interval: float = 1.0,
+        lookback: int = 100,
+        batch_size: int = 500,
+    ):
+        self.broker = broker
+        self.head = head
+        self.fetch = fetch
+        self.interval = interval
+        self.lookback = lookback
+        self.batch_size = batch_size
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def ensure_running(self, app) -> None:
+        """Start polling on behalf of ``app`` unless already running."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(app,),
+                name=f"{self.broker.name}-relay",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self, app) -> None:
+        try:
+            with app.app_context():
+                cursor = self.head()
+                # What was committed before anyone listened is not news.
+                for _, event_id, _ in self.fetch(
+                    max(cursor - self.lookback, 0), self.lookback
+                ):
+                    self.broker.mark_published(event_id)
+        except Exception as e:
+            app_logger.error(f"Relay of {self.broker.name} could not start: {e}")
+            with self._lock:
+                self._thread = None
+            return
+        while True:
+            with self._lock:
+                # Checked under the lock so a new subscriber either keeps this
+                # thread going or sees it gone and starts another.
+                if not self.broker.subscriber_count:
+                    self._thread = None
+                    return
+            time.sleep(self.interval)
+            try:
+                with app.app_context():
+                    cursor = self.poll(cursor)
+            except Exception as e:
+                app_logger.error(f"Relay of {self.broker.name} failed: {e}")
+
+    def poll(self, cursor: int) -> int:
+        """Publish what was committed past ``cursor``; returns the new cursor."""
+        position = max(cursor - self.lookback, 0)
+        while True:
+            rows = self.fetch(position, self.batch_size)
+            for position, event_id, event in rows:
+                self.broker.publish(event, event_id=event_id)
+                cursor = max(cursor, position)
+            if len(rows) < self.batch_size:
+                return cursor
@@ -0,0 +1,204 @@
+# app/infrastructure/rate_limiter.py
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Dict, Optional, Tuple
+
+from flask import current_app
+from flask_jwt_extended import get_jwt_identity
+
+from app.commons.responses import handle_api_response
+from app.infrastructure.logger import app_logger
+
+DEFAULT_BUDGETS = {
+    # Cheap writes such as recording an infraction.
+    "write": {"rate": 5.0, "burst": 20, "concurrency": 4, "global_concurrency": 32},
+    # Single-row reads.
+    "read": {"rate": 20.0, "burst": 40, "concurrency": 8, "global_concurrency": 32},
+    # Expensive reads such as generate_report.
+    "report": {"rate": 0.2, "burst": 3, "concurrency": 1, "global_concurrency": 4},
+}
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate`` tokens per second."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at", "_clock", "_lock")
+
+    def __init__(
+        self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self.updated_at = clock()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: float = 1.0) -> float:
+        """
+        Try to take ``amount`` tokens from the bucket.
+
+        Returns:
+            float: 0.0 if the tokens were taken, otherwise the number of seconds
+            until enough tokens will be available.
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self.updated_at
+            self.updated_at = now
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return 0.0
+            if self.rate <= 0:
+                return math.inf
+            return (amount - self.tokens) / self.rate
+
+
+class ConcurrencyLimiter:
+    """Non-blocking counting semaphore: callers are rejected instead of queued."""
+
+    __slots__ = ("limit", "in_flight", "_lock")
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        with self._lock:
+            if self.in_flight >= self.limit:
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+
+
+class RateLimiter:
+    """
+    In-process admission control keyed by JWT identity.
+
+    Every budget has a token bucket and a concurrency limit per identity, plus a
+    global concurrency limit shared by all identities so that a single expensive
+    route cannot take every worker thread.
+    """
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._buckets: "OrderedDict[Tuple[str, str], TokenBucket]" = OrderedDict()
+        self._slots: Dict[Tuple[str, str], ConcurrencyLimiter] = {}
+        self._global_slots: Dict[str, ConcurrencyLimiter] = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("RATE_LIMIT_ENABLED", True)
+        app.config.setdefault("RATE_LIMIT_BUDGETS", DEFAULT_BUDGETS)
+        app.config.setdefault("RATE_LIMIT_MAX_KEYS", 10000)
+        app.extensions["rate_limiter"] = self
+
+    @staticmethod
+    def _budget(name: str) -> Dict[str, float]:
+        budgets = current_app.config.get("RATE_LIMIT_BUDGETS", DEFAULT_BUDGETS)
+        return {
+            **DEFAULT_BUDGETS.get(name, DEFAULT_BUDGETS["read"]),
+            **budgets.get(name, {}),
+        }
+
+    def _get_bucket(self, name: str, identity: str) -> TokenBucket:
+        key = (name, identity)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                self._buckets.move_to_end(key)
+                return bucket
+            budget = self._budget(name)
+            bucket = TokenBucket(rate=budget["rate"], capacity=budget["burst"])
+            self._buckets[key] = bucket
+            max_keys = current_app.config.get("RATE_LIMIT_MAX_KEYS", 10000)
+            while len(self._buckets) > max_keys:
+                old_key, _ = self._buckets.popitem(last=False)
+                slot = self._slots.get(old_key)
+                if slot is not None and slot.in_flight == 0:
+                    del self._slots[old_key]
+            return bucket
+
+    def _get_slot(self, name: str, identity: str) -> ConcurrencyLimiter:
+        key = (name, identity)
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = ConcurrencyLimiter(int(self._budget(name)["concurrency"]))
+                self._slots[key] = slot
+            return slot
+
+    def _get_global_slot(self, name: str) -> ConcurrencyLimiter:
+        with self._lock:
+            slot = self._global_slots.get(name)
+            if slot is None:
+                slot = ConcurrencyLimiter(int(self._budget(name)["global_concurrency"]))
+                self._global_slots[name] = slot
+            return slot
+
+    def limit(self, budget: str) -> Callable:
+        """
+        Decorator enforcing ``budget`` for the current JWT identity.
+
+        Must be applied below ``@jwt_required()`` so the identity is available.
+        Returns 429 when the identity is over its rate and 503 when too many of
+        its (or everyone's) requests for the budget are already in flight. Both
+        responses carry a ``Retry-After`` header.
+        """
+
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not current_app.config.get("RATE_LIMIT_ENABLED", True):
+                    return fn(*args, **kwargs)
+
+                identity = str(get_jwt_identity())
+                # Slots first: a request shed with a 503 does not spend a token,
+                # so clients retrying after Retry-After keep their rate budget.
+                global_slot = self._get_global_slot(budget)
+                if not global_slot.acquire():
+                    app_logger.warning(f"Shedding load on budget {budget}")
+                    return _rejection(503, "Server busy, retry later", 1)
+                slot = self._get_slot(budget, identity)
+                if not slot.acquire():
+                    global_slot.release()
+                    app_logger.warning(
+                        f"Concurrency limit exceeded for {identity} on budget {budget}"
+                    )
+                    return _rejection(503, "Too many concurrent requests", 1)
+                wait = self._get_bucket(budget, identity).consume()
+                if wait > 0:
+                    slot.release()
+                    global_slot.release()
+                    app_logger.warning(
+                        f"Rate limit exceeded for {identity} on budget {budget}"
+                    )
+                    return _rejection(429, "Too many requests", wait)
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    slot.release()
+                    global_slot.release()
+
+            return wrapper
+
+        return decorator
+
+
+def _rejection(status_code: int, message: str, retry_after: Optional[float]):
+    retry_after = 1 if retry_after is None or math.isinf(retry_after) else retry_after
+    return handle_api_response(
+        error={"message": message},
+        status_code=status_code,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
@@ -0,0 +1,272 @@
+# app/infrastructure/soft_delete.py
+import datetime
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type
+
+from flask import current_app
+from sqlalchemy import Column, DateTime, delete, event, orm, select, update
+from sqlalchemy.orm import ONETOMANY
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from app.commons.iterables import IN_CLAUSE_CHUNK_SIZE, chunked
+from app.extensions import db
+from app.infrastructure.database import RoutingSession
+
+# Execution option that lets an ORM SELECT see soft-deleted rows.
+INCLUDE_DELETED = "include_deleted"
+
+
+class SoftDeleteMixin:
+    """
+    Rows are hidden by setting ``deleted_at`` instead of being deleted.
+
+    Every ORM SELECT made through the session (queries, ``session.get`` and
+    relationship loads) skips rows with ``deleted_at`` set, unless it runs with
+    ``execution_options(include_deleted=True)``. Raw SQL must filter on the
+    column itself. ``purge_soft_deleted`` removes the rows for good.
+    """
+
+    deleted_at = Column(DateTime, nullable=True, index=True)
+
+
+_not_deleted = orm.with_loader_criteria(
+    SoftDeleteMixin, lambda cls: cls.deleted_at.is_(None), include_aliases=True
+)
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _exclude_soft_deleted(execute_state):
+    statement = execute_state.statement
+    if (
+        not execute_state.is_select
+        or statement.is_text
+        or execute_state.execution_options.get(INCLUDE_DELETED, False)
+        or execute_state.is_column_load
+        or execute_state.is_relationship_load
+    ):
+        # Relationship loads inherit the criteria from the query that loaded
+        # their parent, so they are filtered too.
+        return
+    if isinstance(statement, StatementLambdaElement):
+        # Calling .options() on a lambda statement would drop its bound values.
+        execute_state.statement = statement.add_criteria(
+            lambda s: s.options(_not_deleted), track_on=[_not_deleted]
+        )
+    else:
+        execute_state.statement = statement.options(_not_deleted)
+
+
+# Functions called as ``hook(session, ids)`` inside the transaction that
+# deletes (or soft-deletes) the rows of a model with these primary keys, before
+# the rows go. See ``before_bulk_delete``.
+_delete_hooks: Dict[Type, List[Callable[[Any, List[Any]], None]]] = defaultdict(list)
+
+
+def before_bulk_delete(model: Type):
+    """
+    Register the decorated ``hook(session, ids)`` to run before ``bulk_delete``
+    removes rows of ``model``, directly or as dependents of a deleted parent,
+    including those the database's ON DELETE CASCADE removes. It runs in the
+    same transaction as the delete, so what it writes commits with it.
+    """
+
+    def register(hook):
+        _delete_hooks[model].append(hook)
+        return hook
+
+    return register
+
+
+def _run_delete_hooks(session, model, ids: List[Any]) -> None:
+    for hook in _delete_hooks.get(model, ()):
+        hook(session, ids)
+
+
+def _is_soft(model) -> bool:
+    return issubclass(model, SoftDeleteMixin)
+
+
+def _dependents(model) -> List[orm.RelationshipProperty]:
+    dependents = [
+        rel
+        for rel in orm.class_mapper(model).relationships
+        if rel.direction is ONETOMANY and not rel.viewonly
+    ]
+    for rel in dependents:
+        if len(rel.local_remote_pairs) != 1:
+            raise NotImplementedError(
+                f"Cannot cascade deletes over {rel}, which joins on several columns"
+            )
+    return dependents
+
+
+def _forget(session, model, ids: List[Any]) -> None:
+    """
+    Drop deleted rows from the identity map, where ``session.get`` would still
+    find them: the soft-delete criteria only apply to statements that run.
+    """
+    mapper = orm.class_mapper(model)
+    for id_ in ids:
+        instance = session.identity_map.get(mapper.identity_key_from_primary_key([id_]))
+        if instance is not None:
+            session.expunge(instance)
+
+
+def _cascade(session, model, rows, soft: bool, now: datetime.datetime) -> None:
+    """
+    Apply a parent's deletion to the rows referencing it, the way the ORM
+    would: children whose foreign key is nullable are detached on hard
+    deletes, children that cannot exist without the parent are deleted too.
+    Relationships with ``passive_deletes`` leave hard deletes to the database's
+    ON DELETE action.
+    """
+    for rel in _dependents(model):
+        child = rel.mapper.class_
+        local, remote = rel.local_remote_pairs[0]
+        values = [row._mapping[local] for row in rows]
+        if rel.passive_deletes and not soft:
+            if not remote.nullable and child in _delete_hooks:
+                # The database deletes these rows; their hooks still run.
+                (child_pk,) = orm.class_mapper(child).primary_key
+                for chunk in chunked(values):
+                    ids = session.execute(
+                        select(child_pk).where(remote.in_(chunk)),
+                        execution_options={INCLUDE_DELETED: True},
+                    ).scalars()
+                    _run_delete_hooks(session, child, list(ids))
+            continue
+        if remote.nullable:
+            if not soft:
+                for chunk in chunked(values):
+                    session.execute(
+                        update(child)
+                        .where(remote.in_(chunk))
+                        .values({remote.key: None})
+                        .execution_options(synchronize_session=False)
+                    )
+        elif not soft or _is_soft(child):
+            bulk_delete(
+                child,
+                in_column=remote,
+                in_values=values,
+                soft=soft,
+                now=now,
+                commit=False,
+            )
+
+
+def _delete_matching(
+    session, model, criteria, soft: bool, chunk_size: int, now, commit: bool
+) -> int:
+    mapper = orm.class_mapper(model)
+    (pk,) = mapper.primary_key
+    local_columns = {rel.local_remote_pairs[0][0] for rel in _dependents(model)}
+    columns = [pk, *(column for column in local_columns if column is not pk)]
+
+    total = 0
+    last = None
+    while True:
+        query = select(*columns).where(*criteria).order_by(pk).limit(chunk_size)
+        if soft:
+            query = query.where(model.deleted_at.is_(None))
+        if last is not None:
+            query = query.where(pk > last)
+        rows = session.execute(query, execution_options={INCLUDE_DELETED: True}).all()
+        if not rows:
+            return total
+
+        last = rows[-1]._mapping[pk]
+        ids = [row._mapping[pk] for row in rows]
+        _run_delete_hooks(session, model, ids)
+        _cascade(session, model, rows, soft, now)
+        if soft:
+            statement = update(model).where(pk.in_(ids)).values(deleted_at=now)
+        else:
+            statement = delete(model).where(pk.in_(ids))
+        result = session.execute(statement.execution_options(synchronize_session=False))
+        _forget(session, model, ids)
+        total += result.rowcount
+        if commit:
+            # Short transactions keep locks and replication lag small.
+            session.commit()
+
+
+def bulk_delete(
+    model: Type,
+    *criteria,
+    in_column: Optional[Column] = None,
+    in_values: Optional[Iterable[Any]] = None,
+    soft: Optional[bool] = None,
+    chunk_size: int = IN_CLAUSE_CHUNK_SIZE,
+    now: Optional[datetime.datetime] = None,
+    commit: bool = True,
+) -> int:
+    """
+    Delete every row of ``model`` matching ``criteria`` with set-based statements.
+
+    Matching rows are walked by primary key in chunks of ``chunk_size``; each
+    chunk becomes one ``DELETE ... WHERE id IN (...)`` (or ``UPDATE ... SET
+    deleted_at``) plus the statements for dependent rows, and is committed on
+    its own. Large value lists go in ``in_column``/``in_values`` so they are
+    split into IN clauses of bounded size.
+
+    Args:
+        model: Mapped class to delete from.
+        *criteria: SQL expressions all rows must match.
+        in_column: Column that must be in ``in_values``.
+        in_values: Allowed values of ``in_column``.
+        soft (bool): Set ``deleted_at`` instead of deleting; the model must
+            use ``SoftDeleteMixin``. Already deleted rows are left alone.
+            Defaults to ``SOFT_DELETE_ENABLED`` for models that support it.
+        chunk_size (int): Rows per statement.
+        now (datetime): Deletion time recorded by soft deletes.
+        commit (bool): Commit after every chunk.
+
+    Returns:
+        int: Rows of ``model`` deleted, not counting dependents.
+    """
+    if soft is None:
+        soft = _is_soft(model) and current_app.config.get("SOFT_DELETE_ENABLED", False)
+    if soft and not _is_soft(model):
+        raise ValueError(f"{model.__name__} does not support soft deletes")
+    now = now or datetime.datetime.utcnow()
+    if in_column is None:
+        return _delete_matching(
+            db.session, model, criteria, soft, chunk_size, now, commit
+        )
+    return sum(
+        _delete_matching(
+            db.session,
+            model,
+            (*criteria, in_column.in_(chunk)),
+            soft,
+            chunk_size,
+            now,
+            commit,
+        )
+        for chunk in chunked(dict.fromkeys(in_values), chunk_size)
+    )
+
+
+def purge_soft_deleted(older_than: datetime.timedelta) -> int:
+    """
+    Hard-delete rows soft-deleted more than ``older_than`` ago, in every
+    model using ``SoftDeleteMixin``.
+
+    Returns:
+        int: Rows removed.
+    """
+    cutoff = datetime.datetime.utcnow() - older_than
+    return sum(
+        bulk_delete(model, model.deleted_at < cutoff, soft=False)
+        for model in _soft_delete_models()
+    )
+
+
+def _soft_delete_models() -> List[Type]:
+    models, pending = [], list(SoftDeleteMixin.__subclasses__())
+    while pending:
+        model = pending.pop(0)
+        models.append(model)
+        pending.extend(model.__subclasses__())
+    return models
@@ -0,0 +1,257 @@
+# app/infrastructure/tracing.py
+import json
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Dict, Iterator, List, Optional
+
+from flask import g, request
+from sqlalchemy import event
+
+from app.infrastructure.logger import app_logger
+
+# Innermost open span of the current request or job; None when not tracing.
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """One timed step of a trace, with the steps it made as children."""
+
+    __slots__ = (
+        "name",
+        "attributes",
+        "children",
+        "error",
+        "started_at",
+        "duration",
+        "_started",
+    )
+
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.attributes = attributes or {}
+        self.children: List["Span"] = []
+        self.error: Optional[str] = None
+        self.started_at = time.time()
+        self.duration: Optional[float] = None
+        self._started = time.perf_counter()
+
+    def finish(self) -> None:
+        self.duration = time.perf_counter() - self._started
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "name": self.name,
+            "started_at": self.started_at,
+            "duration_ms": None if self.duration is None else self.duration * 1e3,
+        }
+        if self.attributes:
+            data["attributes"] = self.attributes
+        if self.error:
+            data["error"] = self.error
+        if self.children:
+            data["children"] = [child.to_dict() for child in self.children]
+        return data
+
+
+@contextmanager
+def _open(span: Span, parent: Optional[Span]) -> Iterator[Span]:
+    if parent is not None:
+        parent.children.append(span)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.error = type(e).__name__
+        raise
+    finally:
+        span.finish()
+        _current_span.reset(token)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    Time the enclosed block as a child of the current span. Outside a trace it
+    does nothing and yields None.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+    with _open(Span(name, attributes), parent) as child:
+        yield child
+
+
+def traced(fn):
+    """Record every call of ``fn`` as a span named after it."""
+    name = fn.__qualname__
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        parent = _current_span.get()
+        if parent is None:
+            return fn(*args, **kwargs)
+        with _open(Span(name), parent):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+class Tracer:
+    """
+    Records a tree of timed spans for each request: the request itself, the
+    functions marked with ``traced`` or wrapped in ``span``, and every SQL
+    statement run on an engine passed to ``instrument_engine``.
+
+    Finished traces are kept in a ring buffer of the last
+    ``TRACING_BUFFER_SIZE`` (served by ``/debug/traces``) and, when
+    ``TRACING_FILE`` is set, appended to it as JSON lines. Only a
+    ``TRACING_SAMPLE_RATE`` share of requests is traced, and nothing at all
+    unless ``TRACING_ENABLED``; untraced requests pay one context variable
+    lookup per traced call.
+    """
+
+    def __init__(self, app=None):
+        self.enabled = False
+        self.sample_rate = 1.0
+        self.sql_max_length = 500
+        self._path: Optional[str] = None
+        self._traces: "deque[Dict[str, Any]]" = deque(maxlen=100)
+        self._engines = set()
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("TRACING_ENABLED", False)
+        app.config.setdefault("TRACING_SAMPLE_RATE", 1.0)
+        app.config.setdefault("TRACING_BUFFER_SIZE", 100)
+        app.config.setdefault("TRACING_FILE", None)
+        app.config.setdefault("TRACING_SQL_MAX_LENGTH", 500)
+        app.extensions["tracer"] = self
+        self.enabled = app.config["TRACING_ENABLED"]
+        if not self.enabled:
+            return
+
+        self.sample_rate = float(app.config["TRACING_SAMPLE_RATE"])
+        self.sql_max_length = int(app.config["TRACING_SQL_MAX_LENGTH"])
+        self._path = app.config["TRACING_FILE"]
+        self._traces = deque(maxlen=int(app.config["TRACING_BUFFER_SIZE"]))
+        app.before_request(self._start_request)
+        app.after_request(self._record_status)
+        app.teardown_request(self._finish_request)
+
+    ########################################
+    #                Traces                #
+    ########################################
+
+    @contextmanager
+    def trace(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Trace the enclosed block, e.g. a background job, as its own root."""
+        root = Span(name, attributes)
+        try:
+            with _open(root, None):
+                yield root
+        finally:
+            self._export(root)
+
+    def recent(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """The last finished traces, newest first."""
+        with self._lock:
+            traces = list(self._traces)
+        traces.reverse()
+        return traces[:limit] if limit else traces
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+
+    def _export(self, root: Span) -> None:
+        trace = root.to_dict()
+        with self._lock:
+            self._traces.append(trace)
+            if self._path:
+                try:
+                    with open(self._path, "a", encoding="utf-8") as file:
+                        file.write(json.dumps(trace, default=str) + "\n")
+                except OSError as e:
+                    app_logger.error(f"Could not write trace to {self._path}: {e}")
+
+    ########################################
+    #            Instrumentation           #
+    ########################################
+
+    def instrument_engine(self, engine) -> None:
+        """Record the statements run on ``engine`` as spans of the current trace."""
+        if engine in self._engines:
+            return
+        self._engines.add(engine)
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    def _before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        parent = _current_span.get()
+        if parent is None or context is None:
+            return
+        child = Span("sql", {"statement": statement[: self.sql_max_length]})
+        if executemany:
+            child.attributes["executemany"] = True
+        parent.children.append(child)
+        context._trace_span = child
+
+    def _after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        child = getattr(context, "_trace_span", None)
+        if child is not None:
+            child.finish()
+            if cursor.rowcount >= 0:
+                child.attributes["rows"] = cursor.rowcount
+
+    def _handle_error(self, exception_context):
+        child = getattr(exception_context.execution_context, "_trace_span", None)
+        if child is not None:
+            child.finish()
+            child.error = type(exception_context.original_exception).__name__
+
+    ########################################
+    #               Requests               #
+    ########################################
+
+    def _start_request(self):
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        root = Span(
+            f"{request.method} {request.endpoint or request.path}",
+            {"path": request.path},
+        )
+        g._trace = (root, _current_span.set(root))
+
+    def _record_status(self, response):
+        trace = g.get("_trace")
+        if trace is not None:
+            trace[0].attributes["status"] = response.status_code
+        return response
+
+    def _finish_request(self, exc=None):
+        trace = g.pop("_trace", None)
+        if trace is None:
+            return
+        root, token = trace
+        if exc is not None:
+            root.error = type(exc).__name__
+        root.finish()
+        try:
+            _current_span.reset(token)
+        except ValueError:
+            # Torn down from another context, e.g. a streamed response.
+            _current_span.set(None)
+        self._export(root)
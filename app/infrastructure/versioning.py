@@ -0,0 +1,139 @@
+# app/infrastructure/versioning.py
+from typing import Any, Callable, Mapping, Optional, Type
+
+from sqlalchemy import Column, Integer, inspect, select, update
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.orm import class_mapper, declared_attr
+
+from app.extensions import db
+
+
+class VersionConflictError(Exception):
+    """Exception raised when a row changed since the version a client read."""
+
+    def __init__(self, model_name: str, row_id: Any, expected: int, current: int):
+        self.current_version = current
+        self.message = (
+            f"{model_name} {row_id} is at version {current}, not {expected}; "
+            "reload it and retry."
+        )
+        super().__init__(self.message)
+
+
+class VersionedMixin:
+    """
+    Adds a ``version`` counter used for optimistic concurrency.
+
+    The ORM bumps it on every flush that updates the row and fails with
+    ``StaleDataError`` if someone else got there first (see
+    ``version_conflict``); ``patch_row`` does the same in a single statement.
+    """
+
+    version = Column(Integer, nullable=False, server_default="1")
+
+    @declared_attr
+    def __mapper_args__(cls):
+        return {"version_id_col": cls.__table__.c.version}
+
+
+def _exists(mapper, row_id: Any) -> list:
+    (pk,) = mapper.primary_key
+    criteria = [pk == row_id]
+    if "deleted_at" in mapper.local_table.c:
+        criteria.append(mapper.local_table.c.deleted_at.is_(None))
+    return criteria
+
+
+def version_conflict(instance, expected: int) -> Optional[VersionConflictError]:
+    """
+    Roll back after a flush of ``instance`` failed with ``StaleDataError``
+    and describe the conflict, the way ``patch_row`` reports it.
+
+    ``expected`` is the version the change was based on; read it before
+    committing, since the failed flush expires ``instance``.
+
+    Returns:
+        The error to raise, or None if the row no longer exists.
+    """
+    state = inspect(instance)
+    mapper = state.mapper
+    version = mapper.version_id_col
+    (row_id,) = state.identity
+    db.session.rollback()
+    current = db.session.execute(
+        select(version).where(*_exists(mapper, row_id))
+    ).scalar()
+    if current is None:
+        return None
+    return VersionConflictError(mapper.class_.__name__, row_id, expected, current)
+
+
+def patch_row(
+    model: Type,
+    row_id: Any,
+    values: Mapping[str, Any],
+    expected_version: Optional[int] = None,
+    before_commit: Optional[Callable[[RowMapping], None]] = None,
+) -> Optional[RowMapping]:
+    """
+    Update only ``values`` of one row with a single UPDATE, without loading it.
+
+    The statement is ``UPDATE ... SET ..., version = version + 1 WHERE id = :id
+    [AND version = :expected] RETURNING *``, so no row lock is held between
+    reading and writing. Backends without RETURNING support in this SQLAlchemy
+    version (SQLite) read the row back in the same transaction. Soft-deleted
+    rows are never updated. Commits on success and rolls back otherwise.
+
+    Args:
+        model: Mapped class using ``VersionedMixin``.
+        row_id: Primary key of the row.
+        values: Column values to set.
+        expected_version (int): Version the client based its change on;
+            when omitted the update is unconditional.
+        before_commit: Called with the updated row before the commit, e.g. to
+            add rows that belong to the same transaction.
+
+    Returns:
+        The updated row, or None if it does not exist.
+
+    Raises:
+        VersionConflictError: If the row is at another version.
+    """
+    mapper = class_mapper(model)
+    table = mapper.local_table
+    (pk,) = mapper.primary_key
+    version = mapper.version_id_col
+
+    exists = _exists(mapper, row_id)
+    criteria = list(exists)
+    if expected_version is not None:
+        criteria.append(version == expected_version)
+
+    statement = (
+        update(model)
+        .where(*criteria)
+        .values({**values, version.key: version + 1})
+        .execution_options(synchronize_session=False)
+    )
+    session = db.session
+    if session.get_bind(mapper=mapper).dialect.full_returning:
+        row = session.execute(statement.returning(*table.c)).mappings().first()
+    else:
+        row = None
+        if session.execute(statement).rowcount:
+            row = session.execute(select(*table.c).where(pk == row_id)).mappings().one()
+
+    if row is None:
+        current = session.execute(select(version).where(*exists)).scalar()
+        session.rollback()
+        if current is None:
+            return None
+        raise VersionConflictError(model.__name__, row_id, expected_version, current)
+    if before_commit is not None:
+        try:
+            before_commit(row)
+        except Exception:
+            session.rollback()
+            raise
+    session.commit()
+    return row
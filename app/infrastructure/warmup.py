@@ -0,0 +1,124 @@
+# app/infrastructure/warmup.py
+import importlib
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import orm, text
+
+from app.infrastructure.database import REPLICA_BIND
+from app.infrastructure.logger import app_logger
+
+
+class Warmup:
+    """
+    Gets a worker ready for traffic before it reports ready.
+
+    ``run`` does, in order:
+      * configure every ORM mapper and import the modules in
+        ``WARMUP_IMPORTS``, which would otherwise happen on first use;
+      * open ``WARMUP_POOL_CONNECTIONS`` connections on the primary and the
+        replica, which stay in the pool afterwards;
+      * call the tasks registered with ``task`` inside an application
+        context, e.g. to compile hot queries or prime caches.
+
+    ``ready`` stays False until then; ``/health/ready`` reports it. A failing
+    step is logged and skipped, since a cold cache is no reason to stay out
+    of rotation.
+
+    ``init_app`` starts it in the background on the first request, normally a
+    health probe, so CLI commands never trigger it; entrypoints that serve
+    call ``start`` right away. With ``WARMUP_ENABLED`` off, ``start`` only
+    marks the worker ready.
+    """
+
+    def __init__(self, app=None):
+        self._app = None
+        self._tasks: List[Callable[[], None]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.ready = False
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("WARMUP_ENABLED", True)
+        app.config.setdefault("WARMUP_POOL_CONNECTIONS", 2)
+        app.config.setdefault("WARMUP_IMPORTS", [])
+        app.extensions["warmup"] = self
+        self._app = app
+        app.before_first_request(self.start)
+
+    def task(self, fn: Callable[[], None]) -> Callable[[], None]:
+        """Register ``fn`` to run during warm-up."""
+        self._tasks.append(fn)
+        return fn
+
+    def start(self, background: bool = True) -> None:
+        """Run the warm-up, by default on a thread so liveness probes answer."""
+        if self._app is None:
+            raise RuntimeError("Warmup.init_app() has not been called")
+        if not self._app.config["WARMUP_ENABLED"]:
+            self.ready = True
+            return
+        if not background:
+            self.run()
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self.run, name="warmup", daemon=True
+                )
+                self._thread.start()
+
+    def run(self) -> Dict[str, float]:
+        """
+        Warm the worker up and mark it ready.
+
+        Returns:
+            Dict[str, float]: Seconds spent in each step.
+        """
+        timings = {}
+        app = self._app
+        with app.app_context():
+            steps = [
+                ("imports", self._import_modules),
+                ("connections", self._open_connections),
+            ]
+            steps += [(fn.__name__, fn) for fn in self._tasks]
+            for name, step in steps:
+                started = time.perf_counter()
+                try:
+                    step()
+                except Exception as e:
+                    app_logger.error(f"Warm-up step {name} failed: {e}")
+                timings[name] = time.perf_counter() - started
+        self.ready = True
+        app_logger.info(
+            f"Warm-up finished in {sum(timings.values()):.3f}s: "
+            + ", ".join(f"{name}={seconds:.3f}s" for name, seconds in timings.items())
+        )
+        return timings
+
+    def _import_modules(self) -> None:
+        orm.configure_mappers()
+        for module in self._app.config["WARMUP_IMPORTS"]:
+            importlib.import_module(module)
+
+    def _open_connections(self) -> None:
+        db = self._app.extensions["sqlalchemy"].db
+        engines = [db.get_engine(self._app)]
+        if REPLICA_BIND in (self._app.config.get("SQLALCHEMY_BINDS") or {}):
+            engines.append(db.get_engine(self._app, bind=REPLICA_BIND))
+        count = int(self._app.config["WARMUP_POOL_CONNECTIONS"])
+        for engine in engines:
+            # Hold them all at once so the pool has to open distinct ones.
+            connections = []
+            try:
+                for _ in range(count):
+                    connection = engine.connect()
+                    connections.append(connection)
+                    connection.execute(text("SELECT 1"))
+            finally:
+                for connection in connections:
+                    connection.close()
@@ -0,0 +1,173 @@
+"""
+CPU that ``app_logger`` costs on the report and recording paths.
+
+Each path runs against an in-memory SQLite database with the report cache off,
+under three logging setups:
+
+  * "off": INFO disabled, the baseline without any INFO logging;
+  * "every": every INFO record formatted and queued, as before sampling;
+  * "policy": the default ``LogPolicy`` sample rates.
+
+CPU time covers every thread, so it includes the listener that writes the
+file. Whole-path timings vary more than logging costs on a shared machine, so
+the logging share is also given as the records each call emits times the CPU
+of emitting one. The first table has that per-record cost, next to an INFO
+call that is dropped: an eager f-string against ``log_event`` with a ``lazy``
+field.
+
+    python -m benchmarks.bench_logging [--number 200]
+"""
+
+import argparse
+import logging
+import time
+from datetime import datetime
+
+from app import create_app
+from app.domain.infractions.adapters.officer_adapter import OfficerAdapter
+from app.domain.infractions.adapters.person_adapter import PersonAdapter
+from app.domain.infractions.adapters.vehicle_adapter import VehicleAdapter
+from app.domain.infractions.models import Infraction
+from app.domain.infractions.services.infraction_service import (
+    InfractionDTO,
+    create_infraction,
+    generate_report,
+)
+from app.domain.users.models import Officer, Person
+from app.domain.vehicles.models import Vehicle
+from app.extensions import db, log_policy
+from app.infrastructure.log_policy import DEFAULT_SAMPLE_RATES, lazy, log_event
+from app.infrastructure.logger import app_logger, log_queue
+
+EMAIL = "fleet@example.com"
+
+
+def seed(vehicles):
+    owner = Person(name="Fleet Owner", email=EMAIL)
+    owner.vehicles = [
+        Vehicle(license_plate=f"LOG{i:04d}", make="Fiat", model="Uno", color="Red")
+        for i in range(vehicles)
+    ]
+    db.session.add(owner)
+    db.session.add(Officer(name="Bench", unique_identifier="BENCH"))
+    db.session.add_all(
+        Infraction(license_plate=f"LOG{i:04d}", comments=f"Infraction {i}")
+        for i in range(vehicles)
+    )
+    db.session.commit()
+
+
+def report():
+    generate_report(EMAIL, PersonAdapter())
+
+
+def record():
+    create_infraction(
+        InfractionDTO(
+            placa_patente="LOG0000",
+            timestamp=datetime.now(),
+            comentarios="Benchmark",
+            officer_unique_identifier="BENCH",
+        ),
+        vehicle_adapter=VehicleAdapter(),
+        officer_adapter=OfficerAdapter(),
+    )
+
+
+def cpu_per_call(fn, number, repeat=5):
+    fn()
+    runs = []
+    for _ in range(repeat):
+        settle()
+        started = time.process_time()
+        for _ in range(number):
+            fn()
+        # The records queued so far are written on the listener's time; wait
+        # for them so that CPU is charged to this run and not to the next one.
+        settle()
+        runs.append((time.process_time() - started) / number)
+    return min(runs)
+
+
+def settle():
+    while not log_queue.empty():
+        time.sleep(0.01)
+    time.sleep(0.05)
+
+
+def configure(setup):
+    app_logger.setLevel(logging.WARNING if setup == "off" else logging.INFO)
+    log_policy.sample_rates = dict(DEFAULT_SAMPLE_RATES) if setup == "policy" else {}
+
+
+class RecordCounter(logging.Filter):
+    """Counts the records that reach the queue, i.e. that are formatted."""
+
+    count = 0
+
+    def filter(self, record):
+        self.count += 1
+        return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--vehicles", type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_app("test")
+    app.config["REPORT_CACHE_TTL"] = 0
+    counter = RecordCounter()
+    for handler in app_logger.handlers:
+        handler.addFilter(counter)
+    with app.app_context():
+        db.create_all()
+        seed(args.vehicles)
+
+        configure("policy")
+        log_policy.sample_rates["bench.dropped"] = 0.0
+        payload = generate_report(EMAIL, PersonAdapter())
+        per_record = cpu_per_call(
+            lambda: log_event("bench.kept", email=EMAIL), args.number * 20
+        )
+        calls = [
+            ("emitted", None, per_record),
+            (
+                "dropped",
+                "f-string",
+                cpu_per_call(
+                    lambda: app_logger.debug(f"Report {payload}"), args.number * 20
+                ),
+            ),
+            (
+                "dropped",
+                "lazy",
+                cpu_per_call(
+                    lambda: log_event("bench.dropped", report=lazy(str, payload)),
+                    args.number * 20,
+                ),
+            ),
+        ]
+        print(f"{'record':<10}{'argument':<10}{'CPU us/call':>12}")
+        for name, argument, seconds in calls:
+            print(f"{name:<10}{argument or '':<10}{seconds * 1e6:>12.2f}")
+
+        print(
+            f"\n{'path':<8}{'setup':<8}{'CPU us/call':>12}"
+            f"{'records/call':>14}{'logging us':>12}"
+        )
+        for name, fn in [("report", report), ("record", record)]:
+            for setup in ["off", "every", "policy"]:
+                configure(setup)
+                counter.count = 0
+                seconds = cpu_per_call(fn, args.number)
+                records = counter.count / (args.number * 5 + 1)
+                print(
+                    f"{name:<8}{setup:<8}{seconds * 1e6:>12.1f}"
+                    f"{records:>14.2f}{records * per_record * 1e6:>12.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
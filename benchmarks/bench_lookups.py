@@ -0,0 +1,101 @@
+"""
+Per-lookup Python overhead of the hot single-row lookups.
+
+Each variant runs the same SELECT against an in-memory SQLite database. The
+raw DBAPI time for that SELECT is measured separately and subtracted, so the
+reported numbers are the ORM overhead alone (statement construction, cache key
+generation, result processing). The identity map is cleared between calls to
+keep ``Session.get`` from answering without a query.
+
+    python -m benchmarks.bench_lookups [--number 20000]
+"""
+
+import argparse
+import timeit
+
+from sqlalchemy import lambda_stmt, select
+
+from app import create_app
+from app.domain.vehicles.models import Vehicle
+from app.extensions import db
+
+PLATE = "BENCH-001"
+
+
+def legacy_filter_by():
+    return Vehicle.query.filter_by(license_plate=PLATE).first()
+
+
+def lambda_statement():
+    return (
+        db.session.execute(
+            lambda_stmt(
+                lambda: select(Vehicle).where(Vehicle.license_plate == PLATE).limit(1)
+            )
+        )
+        .scalars()
+        .first()
+    )
+
+
+def legacy_query_get():
+    return Vehicle.query.get(1)
+
+
+def session_get():
+    return db.session.get(Vehicle, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000)
+    number = parser.parse_args().number
+
+    app = create_app("test")
+    # TESTING turns on Flask-SQLAlchemy query recording, which walks the stack
+    # on every statement and would dwarf the differences being measured.
+    app.config["SQLALCHEMY_RECORD_QUERIES"] = False
+    with app.app_context():
+        db.create_all()
+        db.session.add(
+            Vehicle(license_plate=PLATE, make="Fiat", model="Uno", color="Red")
+        )
+        db.session.commit()
+
+        cursor = db.session.connection().connection.cursor()
+        sql = {
+            "plate": "SELECT * FROM vehicles WHERE license_plate = ? LIMIT 1",
+            "pk": "SELECT * FROM vehicles WHERE id = ?",
+        }
+        baseline = {
+            "plate": lambda: cursor.execute(sql["plate"], (PLATE,)).fetchall(),
+            "pk": lambda: cursor.execute(sql["pk"], (1,)).fetchall(),
+        }
+        variants = [
+            ("Query.filter_by().first()", "plate", legacy_filter_by),
+            ("lambda_stmt", "plate", lambda_statement),
+            ("Query.get()", "pk", legacy_query_get),
+            ("Session.get()", "pk", session_get),
+        ]
+
+        def timed(fn, expunge):
+            def run():
+                fn()
+                if expunge:
+                    db.session.expunge_all()
+
+            run()  # warm caches
+            return min(timeit.repeat(run, number=number, repeat=3)) / number
+
+        raw = {kind: timed(fn, expunge=False) for kind, fn in baseline.items()}
+        print(f"{'lookup':<28}{'total us':>10}{'dbapi us':>10}{'python us':>11}")
+        for name, kind, fn in variants:
+            total = timed(fn, expunge=True)
+            print(
+                f"{name:<28}{total * 1e6:>10.1f}{raw[kind] * 1e6:>10.1f}"
+                f"{(total - raw[kind]) * 1e6:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
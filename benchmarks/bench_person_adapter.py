@@ -0,0 +1,134 @@
+"""
+Cost of handing a 500-vehicle owner from the users domain to the infractions
+domain through ``PersonAdapter``.
+
+The ORM person and its vehicles are loaded once up front, so only the DTO
+hand-off is measured. "pydantic" replays the previous pipeline: validated
+response DTOs in ``person_services``, re-validated adapter DTOs (``EmailStr``
+again) and the ``model_dump()`` the adapter used to log. "records" is the
+current pipeline of frozen, slotted dataclasses.
+
+    python -m benchmarks.bench_person_adapter [--vehicles 500] [--number 200]
+"""
+
+import argparse
+import timeit
+import tracemalloc
+from typing import List
+
+from pydantic import BaseModel, EmailStr, Field
+from sqlalchemy.orm import selectinload
+
+from app import create_app
+from app.domain.infractions.adapters.person_adapter import PersonDTO
+from app.domain.users.models import Person
+from app.domain.users.services.person_services import PersonResponseDTO
+from app.domain.vehicles.models import Vehicle
+from app.extensions import db
+
+
+class LegacyVehicleResponseDTO(BaseModel):
+    license_plate: str = Field(..., description="The vehicle's license plate.")
+    make: str = Field(..., description="The make of the vehicle.")
+    model: str = Field(..., description="The model of the vehicle.")
+    color: str = Field(..., description="The color of the vehicle.")
+
+
+class LegacyPersonResponseDTO(BaseModel):
+    name: str = Field(..., description="The full name of the person.")
+    email: EmailStr = Field(..., description="The email address of the person.")
+    vehicles: List[LegacyVehicleResponseDTO] = Field(default=[])
+
+
+class LegacyVehicleDTO(LegacyVehicleResponseDTO):
+    pass
+
+
+class LegacyPersonDTO(BaseModel):
+    name: str = Field(..., description="The full name of the person.")
+    email: EmailStr = Field(..., description="The email address of the person.")
+    vehicles: List[LegacyVehicleDTO] = Field(default=[])
+
+
+def pydantic_pipeline(person):
+    response = LegacyPersonResponseDTO(
+        name=person.name,
+        email=person.email,
+        vehicles=[
+            LegacyVehicleResponseDTO(
+                license_plate=v.license_plate, make=v.make, model=v.model, color=v.color
+            )
+            for v in person.vehicles
+        ],
+    )
+    f"{response.model_dump()}"
+    return LegacyPersonDTO(
+        name=response.name,
+        email=response.email,
+        vehicles=[
+            LegacyVehicleDTO(
+                license_plate=v.license_plate, make=v.make, model=v.model, color=v.color
+            )
+            for v in response.vehicles
+        ],
+    )
+
+
+def records_pipeline(person):
+    return PersonDTO.from_person(PersonResponseDTO.from_model(person))
+
+
+def allocations(fn, person):
+    tracemalloc.start()
+    result = fn(person)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vehicles", type=int, default=500)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    app = create_app("test")
+    app.config["SQLALCHEMY_RECORD_QUERIES"] = False
+    with app.app_context():
+        db.create_all()
+        owner = Person(name="Fleet Owner", email="fleet@example.com")
+        owner.vehicles = [
+            Vehicle(license_plate=f"FLT{i:05d}", make="Fiat", model="Uno", color="Red")
+            for i in range(args.vehicles)
+        ]
+        db.session.add(owner)
+        db.session.commit()
+        person = (
+            Person.query.options(selectinload(Person.vehicles))
+            .filter_by(email="fleet@example.com")
+            .one()
+        )
+
+        print(
+            f"{args.vehicles} vehicles: "
+            f"{'pipeline':<10}{'time ms':>10}{'retained KiB':>14}{'peak KiB':>10}"
+        )
+        for name, fn in [
+            ("pydantic", pydantic_pipeline),
+            ("records", records_pipeline),
+        ]:
+            fn(person)
+            seconds = min(
+                timeit.repeat(lambda: fn(person), number=args.number, repeat=3)
+            )
+            retained, peak = allocations(fn, person)
+            print(
+                f"{'':<{len(str(args.vehicles)) + 11}}{name:<10}"
+                f"{seconds / args.number * 1e3:>10.3f}"
+                f"{retained / 1024:>14.1f}{peak / 1024:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
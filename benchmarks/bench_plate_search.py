@@ -0,0 +1,135 @@
+"""
+Latency of plate search as the number of vehicles grows.
+
+Plates like "AB123CD" are generated into an in-memory SQLite database and
+indexed the way the application indexes them. Each query is a stored plate
+with one or two characters changed, as an OCR camera or an officer would
+misread it. Three strategies are timed:
+
+  * "prefix": ``search_plates(mode="prefix")``, a range scan of the
+    ``plate_normalized`` index, on the first four characters;
+  * "fuzzy": ``search_plates(mode="fuzzy")``, trigram candidates then edit
+    distance on at most ``FUZZY_CANDIDATES`` of them;
+  * "scan": the edit distance of every stored plate, what a search without
+    an index has to do.
+
+    python -m benchmarks.bench_plate_search [--vehicles 200000] [--queries 200]
+"""
+
+import argparse
+import random
+import string
+import time
+
+from sqlalchemy import insert, select
+
+from app import create_app
+from app.domain.vehicles.models import Vehicle, VehiclePlateTrigram
+from app.domain.vehicles.models.vehicle import plate_trigrams
+from app.domain.vehicles.services.plate_search_service import (
+    edit_distance,
+    search_plates,
+)
+from app.extensions import db
+
+BATCH_SIZE = 10000
+
+
+def random_plate(rng):
+    letters = string.ascii_uppercase
+    return (
+        "".join(rng.choices(letters, k=2))
+        + "".join(rng.choices(string.digits, k=3))
+        + "".join(rng.choices(letters, k=2))
+    )
+
+
+def misread(plate, rng):
+    characters = list(plate)
+    for position in rng.sample(range(len(characters)), rng.randint(1, 2)):
+        characters[position] = rng.choice(string.ascii_uppercase + string.digits)
+    return "".join(characters)
+
+
+def seed(vehicles, rng):
+    plates = set()
+    while len(plates) < vehicles:
+        plates.add(random_plate(rng))
+    plates = list(plates)
+    for start in range(0, vehicles, BATCH_SIZE):
+        db.session.execute(
+            insert(Vehicle),
+            [
+                {"license_plate": plate, "make": "Fiat", "model": "Uno"}
+                for plate in plates[start : start + BATCH_SIZE]
+            ],
+        )
+    rows = db.session.execute(select(Vehicle.id, Vehicle.plate_normalized)).all()
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.session.execute(
+            insert(VehiclePlateTrigram),
+            [
+                {"trigram": trigram, "vehicle_id": row.id}
+                for row in rows[start : start + BATCH_SIZE]
+                for trigram in plate_trigrams(row.plate_normalized)
+            ],
+        )
+    db.session.commit()
+    return plates
+
+
+def full_scan(query):
+    plates = db.session.execute(select(Vehicle.plate_normalized)).scalars()
+    return sorted(
+        (distance, plate)
+        for plate in plates
+        if (distance := edit_distance(query, plate, 2)) <= 2
+    )[:10]
+
+
+def milliseconds(fn, queries):
+    timings = []
+    for query in queries:
+        started = time.perf_counter()
+        fn(query)
+        timings.append((time.perf_counter() - started) * 1e3)
+    timings.sort()
+    return timings[len(timings) // 2], timings[int(len(timings) * 0.95)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vehicles", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--scan-queries", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    app = create_app("test")
+    with app.app_context():
+        db.create_all()
+        started = time.perf_counter()
+        plates = seed(args.vehicles, rng)
+        print(f"Seeded {len(plates)} plates in {time.perf_counter() - started:.1f}s")
+
+        targets = rng.sample(plates, args.queries)
+        queries = [misread(plate, rng) for plate in targets]
+        found = sum(
+            any(match.license_plate == target for match in search_plates(query))
+            for target, query in zip(targets, queries)
+        )
+
+        runs = [
+            ("prefix", lambda q: search_plates(q[:4], mode="prefix"), queries),
+            ("fuzzy", search_plates, queries),
+            ("scan", full_scan, queries[: args.scan_queries]),
+        ]
+        print(f"\n{'strategy':<10}{'p50 ms':>10}{'p95 ms':>10}")
+        for name, fn, sample in runs:
+            p50, p95 = milliseconds(fn, sample)
+            print(f"{name:<10}{p50:>10.2f}{p95:>10.2f}")
+        print(f"\nfuzzy found the misread plate for {found}/{len(queries)} queries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Deduplicate person emails and add a unique lower(email) index
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 02:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep the oldest person for every case-insensitive email and hand the
+    # vehicles of its duplicates over to it before deleting them.
+    op.execute(
+        """
+        UPDATE vehicles SET owner_id = (
+            SELECT MIN(keeper.id)
+            FROM persons AS duplicate
+            JOIN persons AS keeper
+              ON lower(trim(keeper.email)) = lower(trim(duplicate.email))
+            WHERE duplicate.id = vehicles.owner_id
+        )
+        WHERE owner_id IS NOT NULL
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM persons WHERE id NOT IN (
+            SELECT MIN(id) FROM persons GROUP BY lower(trim(email))
+        )
+        """
+    )
+    op.execute("UPDATE persons SET email = lower(trim(email))")
+    op.create_index(
+        'ix_persons_email_lower', 'persons', [sa.text('lower(email)')], unique=True
+    )
+
+
+def downgrade():
+    # Merged duplicates are not restored.
+    op.drop_index('ix_persons_email_lower', table_name='persons')
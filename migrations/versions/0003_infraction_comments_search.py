@@ -0,0 +1,60 @@
+"""Add a full-text index over infraction comments
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 03:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE infractions_fts USING fts5("
+            "comments, content='infractions', content_rowid='id', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+        op.execute(
+            "CREATE TRIGGER infractions_fts_ai AFTER INSERT ON infractions BEGIN "
+            "INSERT INTO infractions_fts(rowid, comments) "
+            "VALUES (new.id, new.comments); END"
+        )
+        op.execute(
+            "CREATE TRIGGER infractions_fts_ad AFTER DELETE ON infractions BEGIN "
+            "INSERT INTO infractions_fts(infractions_fts, rowid, comments) "
+            "VALUES ('delete', old.id, old.comments); END"
+        )
+        op.execute(
+            "CREATE TRIGGER infractions_fts_au AFTER UPDATE OF comments "
+            "ON infractions BEGIN "
+            "INSERT INTO infractions_fts(infractions_fts, rowid, comments) "
+            "VALUES ('delete', old.id, old.comments); "
+            "INSERT INTO infractions_fts(rowid, comments) "
+            "VALUES (new.id, new.comments); END"
+        )
+        # Index the rows that already exist.
+        op.execute("INSERT INTO infractions_fts(infractions_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        op.execute(
+            "CREATE INDEX ix_infractions_comments_fts ON infractions "
+            "USING gin (to_tsvector('simple', coalesce(comments, '')))"
+        )
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for trigger in ('ai', 'ad', 'au'):
+            op.execute(f"DROP TRIGGER IF EXISTS infractions_fts_{trigger}")
+        op.execute("DROP TABLE IF EXISTS infractions_fts")
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_infractions_comments_fts")
@@ -0,0 +1,84 @@
+"""Let the database cascade deletes of persons, vehicles and officers
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 08:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+# SQLite foreign keys created by 0001 have no name; batch mode reflects them
+# under this convention so they can be dropped.
+naming_convention = {
+    'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s',
+}
+
+# Rebuilding infractions on SQLite drops the triggers that keep the
+# full-text index from 0003 in sync; the index itself is keyed by rowid and
+# survives the copy.
+sqlite_fts_triggers = [
+    "CREATE TRIGGER infractions_fts_ai AFTER INSERT ON infractions BEGIN "
+    "INSERT INTO infractions_fts(rowid, comments) "
+    "VALUES (new.id, new.comments); END",
+    "CREATE TRIGGER infractions_fts_ad AFTER DELETE ON infractions BEGIN "
+    "INSERT INTO infractions_fts(infractions_fts, rowid, comments) "
+    "VALUES ('delete', old.id, old.comments); END",
+    "CREATE TRIGGER infractions_fts_au AFTER UPDATE OF comments "
+    "ON infractions BEGIN "
+    "INSERT INTO infractions_fts(infractions_fts, rowid, comments) "
+    "VALUES ('delete', old.id, old.comments); "
+    "INSERT INTO infractions_fts(rowid, comments) "
+    "VALUES (new.id, new.comments); END",
+]
+
+
+def fk_name(table, column, referred):
+    if op.get_bind().dialect.name == 'sqlite':
+        return f'fk_{table}_{column}_{referred}'
+    return f'{table}_{column}_fkey'
+
+
+def restore_fts_triggers():
+    if op.get_bind().dialect.name == 'sqlite':
+        for statement in sqlite_fts_triggers:
+            op.execute(statement)
+
+
+def upgrade():
+    with op.batch_alter_table('infractions', schema=None, naming_convention=naming_convention) as batch_op:
+        batch_op.create_index(batch_op.f('ix_infractions_license_plate'), ['license_plate'], unique=False)
+        batch_op.create_index(batch_op.f('ix_infractions_officer_id'), ['officer_id'], unique=False)
+        batch_op.drop_constraint(fk_name('infractions', 'officer_id', 'officers'), type_='foreignkey')
+        batch_op.drop_constraint(fk_name('infractions', 'license_plate', 'vehicles'), type_='foreignkey')
+        batch_op.create_foreign_key(fk_name('infractions', 'officer_id', 'officers'), 'officers', ['officer_id'], ['id'], ondelete='SET NULL')
+        batch_op.create_foreign_key(fk_name('infractions', 'license_plate', 'vehicles'), 'vehicles', ['license_plate'], ['license_plate'], onupdate='CASCADE', ondelete='CASCADE')
+    restore_fts_triggers()
+
+    with op.batch_alter_table('vehicles', schema=None, naming_convention=naming_convention) as batch_op:
+        batch_op.create_index(batch_op.f('ix_vehicles_owner_id'), ['owner_id'], unique=False)
+        batch_op.drop_constraint(fk_name('vehicles', 'owner_id', 'persons'), type_='foreignkey')
+        batch_op.create_foreign_key(fk_name('vehicles', 'owner_id', 'persons'), 'persons', ['owner_id'], ['id'], ondelete='SET NULL')
+
+
+def downgrade():
+    with op.batch_alter_table('vehicles', schema=None, naming_convention=naming_convention) as batch_op:
+        batch_op.drop_constraint(fk_name('vehicles', 'owner_id', 'persons'), type_='foreignkey')
+        batch_op.create_foreign_key(fk_name('vehicles', 'owner_id', 'persons'), 'persons', ['owner_id'], ['id'])
+        batch_op.drop_index(batch_op.f('ix_vehicles_owner_id'))
+
+    with op.batch_alter_table('infractions', schema=None, naming_convention=naming_convention) as batch_op:
+        batch_op.drop_constraint(fk_name('infractions', 'license_plate', 'vehicles'), type_='foreignkey')
+        batch_op.drop_constraint(fk_name('infractions', 'officer_id', 'officers'), type_='foreignkey')
+        batch_op.create_foreign_key(fk_name('infractions', 'license_plate', 'vehicles'), 'vehicles', ['license_plate'], ['license_plate'])
+        batch_op.create_foreign_key(fk_name('infractions', 'officer_id', 'officers'), 'officers', ['officer_id'], ['id'])
+        batch_op.drop_index(batch_op.f('ix_infractions_officer_id'))
+        batch_op.drop_index(batch_op.f('ix_infractions_license_plate'))
+    restore_fts_triggers()
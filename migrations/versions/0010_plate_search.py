@@ -0,0 +1,108 @@
+"""Add vehicles.plate_normalized and the vehicle_plate_trigrams index for plate search
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+# Frozen copies of normalize_plate and plate_trigrams as of this revision.
+_NOT_PLATE_CHARACTERS = re.compile(r"[^0-9A-Z]")
+
+
+def _normalize(plate):
+    return _NOT_PLATE_CHARACTERS.sub("", (plate or "").upper())
+
+
+def _trigrams(normalized):
+    framed = f"^{normalized}$"
+    return {framed[i : i + 3] for i in range(len(framed) - 2)}
+
+
+def _backfill():
+    connection = op.get_bind()
+    vehicles = sa.table(
+        'vehicles',
+        sa.column('id', sa.Integer),
+        sa.column('license_plate', sa.String),
+        sa.column('plate_normalized', sa.String),
+    )
+    trigrams = sa.table(
+        'vehicle_plate_trigrams',
+        sa.column('trigram', sa.String),
+        sa.column('vehicle_id', sa.Integer),
+    )
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(vehicles.c.id, vehicles.c.license_plate)
+            .where(vehicles.c.id > last_id)
+            .order_by(vehicles.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        normalized = {row.id: _normalize(row.license_plate) for row in rows}
+        connection.execute(
+            vehicles.update()
+            .where(vehicles.c.id == sa.bindparam('vehicle_id'))
+            .values(plate_normalized=sa.bindparam('normalized')),
+            [
+                {'vehicle_id': vehicle_id, 'normalized': plate}
+                for vehicle_id, plate in normalized.items()
+            ],
+        )
+        connection.execute(
+            trigrams.insert(),
+            [
+                {'trigram': trigram, 'vehicle_id': vehicle_id}
+                for vehicle_id, plate in normalized.items()
+                for trigram in sorted(_trigrams(plate))
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def upgrade():
+    op.create_table('vehicle_plate_trigrams',
+    sa.Column('trigram', sa.String(length=3), nullable=False),
+    sa.Column('vehicle_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['vehicle_id'], ['vehicles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('trigram', 'vehicle_id')
+    )
+    with op.batch_alter_table('vehicle_plate_trigrams', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_vehicle_plate_trigrams_vehicle_id'), ['vehicle_id'], unique=False)
+
+    # Added nullable, filled in, then made NOT NULL, so existing rows are valid.
+    with op.batch_alter_table('vehicles', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('plate_normalized', sa.String(length=255), nullable=True))
+
+    _backfill()
+
+    with op.batch_alter_table('vehicles', schema=None) as batch_op:
+        batch_op.alter_column('plate_normalized', existing_type=sa.String(length=255), nullable=False)
+        batch_op.create_index('ix_vehicles_deleted_at_plate_normalized', ['deleted_at', 'plate_normalized'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('vehicles', schema=None) as batch_op:
+        batch_op.drop_index('ix_vehicles_deleted_at_plate_normalized')
+        batch_op.drop_column('plate_normalized')
+
+    with op.batch_alter_table('vehicle_plate_trigrams', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_vehicle_plate_trigrams_vehicle_id'))
+
+    op.drop_table('vehicle_plate_trigrams')
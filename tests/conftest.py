@@ -1,7 +1,10 @@
 # tests/conftest.py
+from contextlib import contextmanager
+
 import pytest
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 
 from app.extensions import db as _db  # Asegúrate de que esta importación es correcta
 
@@ -35,3 +38,35 @@ def db(app):
     session.remove()
     transaction.rollback()
     connection.close()
+
+
+@pytest.fixture
+def file_db(db, monkeypatch, tmp_path):
+    """
+    A fresh app with its own database file, for code that rolls the session
+    back: under ``db`` that rollback would undo the whole test transaction.
+    """
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    _db.init_app(app)
+    monkeypatch.setattr(_db, "session", _db.create_scoped_session())
+    with app.app_context():
+        _db.create_all()
+        yield _db
+        _db.session.remove()
+
+
+@contextmanager
+def count_queries(db):
+    """Collect the SQL statements run on ``db``'s engine inside the block."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
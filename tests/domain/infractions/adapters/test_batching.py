@@ -0,0 +1,19 @@
+from app.domain.infractions.adapters.batching import BatchingVehicleAdapter
+from app.domain.infractions.adapters.vehicle_adapter import VehicleAdapter
+from app.domain.vehicles.models import Vehicle
+from tests.conftest import count_queries
+
+
+def test_vehicle_lookups_in_a_request_share_one_query(app, db):
+    for plate in ("AAA111", "BBB222", "CCC333"):
+        db.session.add(Vehicle(license_plate=plate, make="Fiat", model="Uno"))
+    db.session.commit()
+
+    with app.app_context(), count_queries(db) as statements:
+        adapter = BatchingVehicleAdapter(VehicleAdapter())
+        pending = [adapter.defer(p) for p in ("AAA111", "CCC333", "ZZZ999")]
+        vehicles = [item.get() for item in pending]
+        assert adapter.get_vehicle("AAA111") is vehicles[0]
+
+    assert [v and v.license_plate for v in vehicles] == ["AAA111", "CCC333", None]
+    assert len(statements) == 1
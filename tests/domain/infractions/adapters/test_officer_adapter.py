@@ -0,0 +1,54 @@
+import pytest
+
+from app.domain.infractions.adapters.officer_adapter import (
+    BaseOfficerAdapter,
+    ClaimsOfficerAdapter,
+    OfficerAdapter,
+    OfficerDTO,
+    OfficerMismatchError,
+)
+from app.domain.users.models import Officer
+
+
+class RecordingOfficerAdapter(BaseOfficerAdapter):
+    def __init__(self):
+        self.calls = []
+
+    def get_officer(self, unique_identifier):
+        self.calls.append(unique_identifier)
+        return OfficerDTO(id=7, name="Looked up", unique_identifier=unique_identifier)
+
+
+def test_claims_resolve_the_caller_without_a_lookup():
+    fallback = RecordingOfficerAdapter()
+    adapter = ClaimsOfficerAdapter(
+        "OF-1", {"sub": "OF-1", "officer_id": 3, "name": "Rita"}, fallback
+    )
+
+    assert adapter.get_officer("OF-1") == OfficerDTO(3, "Rita", "OF-1")
+    assert fallback.calls == []
+
+
+def test_claims_reject_another_officer():
+    adapter = ClaimsOfficerAdapter("OF-1", {"officer_id": 3, "name": "Rita"})
+
+    with pytest.raises(OfficerMismatchError):
+        adapter.get_officer("OF-2")
+
+
+def test_tokens_without_claims_fall_back_to_a_lookup():
+    fallback = RecordingOfficerAdapter()
+    adapter = ClaimsOfficerAdapter("OF-1", {"sub": "OF-1"}, fallback)
+
+    assert adapter.get_officer("OF-1").name == "Looked up"
+    assert fallback.calls == ["OF-1"]
+
+
+def test_get_officers_returns_only_known_identifiers(db):
+    db.session.add(Officer(name="Rita", unique_identifier="OF-1"))
+    db.session.commit()
+
+    officers = OfficerAdapter().get_officers(["OF-1", "OF-2"])
+
+    assert list(officers) == ["OF-1"]
+    assert officers["OF-1"].name == "Rita"
@@ -0,0 +1,33 @@
+import dataclasses
+
+import pytest
+
+from app.domain.infractions.adapters.person_adapter import (
+    NoVehiclesFoundError,
+    PersonAdapter,
+)
+from app.domain.users.models import Person
+from app.domain.vehicles.models import Vehicle
+
+
+def test_get_person_by_email_returns_frozen_records(db):
+    person = Person(name="Ana", email="ana@example.com")
+    person.vehicles = [Vehicle(license_plate="ABC123", make="Fiat", model="Uno")]
+    db.session.add(person)
+    db.session.commit()
+
+    person_dto = PersonAdapter().get_person_by_email("ANA@example.com")
+
+    assert person_dto.email == "ana@example.com"
+    assert [v.license_plate for v in person_dto.vehicles] == ["ABC123"]
+    assert person_dto.vehicles[0].color is None
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        person_dto.name = "Someone else"
+
+
+def test_get_person_by_email_without_vehicles_raises(db):
+    db.session.add(Person(name="Luis", email="luis@example.com"))
+    db.session.commit()
+
+    with pytest.raises(NoVehiclesFoundError):
+        PersonAdapter().get_person_by_email("luis@example.com")
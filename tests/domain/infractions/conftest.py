@@ -0,0 +1,30 @@
+# tests/domain/infractions/conftest.py
+import pytest
+
+from app.domain.infractions.models import Infraction
+from app.domain.users.models import Person
+from app.domain.vehicles.models import Vehicle
+
+
+@pytest.fixture
+def owners(db):
+    """``owners(n)`` adds n persons with two vehicles, each with one infraction."""
+
+    def _create(count):
+        for i in range(count):
+            person = Person(name=f"Owner {i}", email=f"owner{i}@example.com")
+            person.vehicles = [
+                Vehicle(
+                    license_plate=f"P{i}-{v}", make="Fiat", model="Uno", color="Red"
+                )
+                for v in range(2)
+            ]
+            db.session.add(person)
+            db.session.add_all(
+                Infraction(license_plate=f"P{i}-{v}", comments=f"Owner {i} car {v}")
+                for v in range(2)
+            )
+        db.session.commit()
+        db.session.expunge_all()
+
+    return _create
@@ -0,0 +1,133 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.domain.infractions.models import Infraction
+from app.domain.infractions.services.analytics_service import (
+    InvalidAnalyticsQueryError,
+    get_officer_activity,
+    officer_activity_cache,
+    period_start,
+)
+from app.domain.users.models import Officer
+from app.domain.vehicles.models import Vehicle
+from app.infrastructure.soft_delete import bulk_delete
+
+
+@pytest.fixture
+def officers(db):
+    officer_activity_cache.clear()
+    vehicle = Vehicle(
+        license_plate="ABC123", make="Toyota", model="Corolla", color="Blue"
+    )
+    jane = Officer(name="Officer Jane", unique_identifier="XYZ789")
+    john = Officer(name="Officer John", unique_identifier="XYZ790")
+    db.session.add_all([vehicle, jane, john])
+    db.session.commit()
+    yield jane, john
+    officer_activity_cache.clear()
+
+
+def record(db, officer, when):
+    infraction = Infraction(
+        license_plate="ABC123", timestamp=when, comments="", officer_id=officer.id
+    )
+    db.session.add(infraction)
+    db.session.commit()
+    return infraction
+
+
+def as_dict(period):
+    return {row.officer_id: row.infractions for row in period.officers}
+
+
+def test_period_start():
+    day = date(2026, 10, 15)  # Thursday
+    assert period_start(day, "day") == day
+    assert period_start(day, "week") == date(2026, 10, 12)
+    assert period_start(day, "month") == date(2026, 10, 1)
+
+
+@pytest.mark.parametrize("granularity", ["day", "week", "month"])
+def test_counts_match_python_grouping(db, officers, granularity):
+    jane, john = officers
+    now = datetime.utcnow()
+    past = now - timedelta(days=40)
+    for when, officer in [(past, jane), (past, jane), (past, john), (now, john)]:
+        record(db, officer, when)
+
+    activity = get_officer_activity(granularity, past.date(), now.date())
+
+    by_period = {p.period_start: as_dict(p) for p in activity.periods}
+    assert by_period[period_start(past.date(), granularity)] == {jane.id: 2, john.id: 1}
+    assert by_period[period_start(now.date(), granularity)] == {john.id: 1}
+    assert activity.periods[-1].closed is False
+    assert all(p.closed for p in activity.periods[:-1])
+
+
+def test_closed_periods_are_cached_and_current_period_recomputed(db, officers):
+    jane, _ = officers
+    now = datetime.utcnow()
+    yesterday = now - timedelta(days=1)
+    record(db, jane, yesterday)
+    get_officer_activity("day", yesterday.date(), now.date())
+    assert ("day", yesterday.date()) in officer_activity_cache
+    assert ("day", now.date()) not in officer_activity_cache
+
+    # Bypass the ORM so the cache does not hear about this write.
+    db.session.execute(
+        Infraction.__table__.insert().values(
+            license_plate="ABC123", timestamp=yesterday, officer_id=jane.id
+        )
+    )
+    record(db, jane, now)
+
+    periods = get_officer_activity("day", yesterday.date(), now.date()).periods
+    assert [as_dict(p) for p in periods] == [{jane.id: 1}, {jane.id: 1}]
+
+
+def test_writes_to_closed_periods_invalidate_them(db, officers):
+    jane, _ = officers
+    yesterday = datetime.utcnow() - timedelta(days=1)
+    infraction = record(db, jane, yesterday)
+    assert as_dict(
+        get_officer_activity("day", yesterday.date(), yesterday.date()).periods[0]
+    ) == {jane.id: 1}
+
+    db.session.delete(infraction)
+    db.session.commit()
+
+    assert ("day", yesterday.date()) not in officer_activity_cache
+    assert (
+        get_officer_activity("day", yesterday.date(), yesterday.date())
+        .periods[0]
+        .officers
+        == []
+    )
+
+
+def test_filters_by_officer_and_validates(db, officers):
+    jane, john = officers
+    now = datetime.utcnow()
+    record(db, jane, now)
+    record(db, john, now)
+
+    activity = get_officer_activity("day", now.date(), now.date(), officer_id=john.id)
+    assert as_dict(activity.periods[0]) == {john.id: 1}
+
+    with pytest.raises(InvalidAnalyticsQueryError):
+        get_officer_activity("year", now.date(), now.date())
+    with pytest.raises(InvalidAnalyticsQueryError):
+        get_officer_activity("day", now.date() + timedelta(days=1), now.date())
+
+
+def test_bulk_soft_delete_invalidates_closed_periods(db, officers):
+    jane, _ = officers
+    past = datetime.utcnow() - timedelta(days=3)
+    record(db, jane, past)
+    assert as_dict(get_officer_activity("day", past.date(), past.date()).periods[0])
+
+    bulk_delete(Infraction, Infraction.officer_id == jane.id, soft=True)
+
+    activity = get_officer_activity("day", past.date(), past.date())
+    assert as_dict(activity.periods[0]) == {}
@@ -0,0 +1,132 @@
+from datetime import datetime
+
+import pytest
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+
+from app.domain.infractions.adapters.officer_adapter import OfficerAdapter
+from app.domain.infractions.adapters.vehicle_adapter import VehicleAdapter
+from app.domain.infractions.entrypoint.handler import infraction_blueprint
+from app.domain.infractions.models import Infraction
+from app.domain.infractions.services.feed_service import (
+    FeedFilterDTO,
+    InfractionEventDTO,
+    get_infractions_after,
+    infraction_feed,
+    relay,
+    subscribe,
+)
+from app.domain.infractions.services.infraction_service import (
+    InfractionDTO,
+    create_infraction,
+)
+from app.domain.users.models import Officer
+from app.extensions import db as _db
+
+
+@pytest.fixture
+def feed_app(db, monkeypatch):
+    """A fresh app serving the infraction routes, with the relay thread off."""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["JWT_SECRET_KEY"] = "test"
+    app.config["SSE_HEARTBEAT_SECONDS"] = 0.01
+    _db.init_app(app)
+    JWTManager(app)
+    app.register_blueprint(infraction_blueprint, url_prefix="/infractions")
+    # The relay polls from its own thread; tests/infrastructure/test_pubsub.py
+    # covers it.
+    monkeypatch.setattr(relay, "ensure_running", lambda app: None)
+    db.session.add(Officer(name="Officer Jane", unique_identifier="JANE"))
+    db.session.commit()
+    return app
+
+
+def record(plate):
+    create_infraction(
+        InfractionDTO(
+            placa_patente=plate,
+            timestamp=datetime.now(),
+            comentarios=f"Seen at {plate}",
+            officer_unique_identifier="JANE",
+        ),
+        vehicle_adapter=VehicleAdapter(),
+        officer_adapter=OfficerAdapter(),
+    )
+
+
+def test_subscribers_get_the_recorded_infractions_matching_their_filters(
+    feed_app, owners
+):
+    owners(1)
+    filters = FeedFilterDTO(license_plate="P0-1")
+    with feed_app.app_context():
+        subscription = subscribe(filters)
+        try:
+            record("P0-0")
+            record("P0-1")
+            event = subscription.get(timeout=0)
+            assert subscription.get(timeout=0) is None
+        finally:
+            subscription.close()
+
+        assert event.license_plate == "P0-1"
+        assert [e.id for e in get_infractions_after(0, filters)] == [
+            i.id for i in Infraction.query.filter_by(license_plate="P0-1")
+        ]
+        assert get_infractions_after(event.id, filters) == []
+
+
+def read_frames(response, count):
+    frames = []
+    for chunk in response.response:
+        frame = chunk.decode() if isinstance(chunk, bytes) else chunk
+        if not frame.startswith(": keep-alive"):
+            frames.append(frame)
+        if len(frames) == count:
+            return frames
+
+
+def test_stream_replays_missed_infractions_once_then_streams_live(feed_app, owners):
+    owners(2)
+    first, *missed = Infraction.query.order_by(Infraction.id)
+    with feed_app.app_context():
+        token = create_access_token(identity="JANE")
+    client = feed_app.test_client()
+
+    response = client.get(
+        "/infractions/stream",
+        headers={"Authorization": f"Bearer {token}", "Last-Event-ID": str(first.id)},
+        buffered=False,
+    )
+    assert response.mimetype == "text/event-stream"
+    frames = read_frames(response, 1 + len(missed))
+    assert frames[0] == "retry: 10\n\n"
+    assert [frame.split("\n")[0] for frame in frames[1:]] == [
+        f"id: {infraction.id}" for infraction in missed
+    ]
+
+    # A live copy of a replayed infraction is skipped.
+    for infraction_id in (missed[0].id, 1000):
+        infraction_feed.publish(
+            InfractionEventDTO(id=infraction_id, license_plate="P1-1"),
+            event_id=infraction_id,
+        )
+    (live,) = read_frames(response, 1)
+    assert live.startswith("id: 1000\nevent: infraction\n")
+    response.close()
+    assert infraction_feed.subscriber_count == 0
+
+
+def test_stream_is_refused_when_the_feed_is_full(feed_app, monkeypatch):
+    monkeypatch.setitem(feed_app.config, "SSE_MAX_SUBSCRIBERS", 0)
+    with feed_app.app_context():
+        token = create_access_token(identity="JANE")
+
+    response = feed_app.test_client().get(
+        "/infractions/stream", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "30"
@@ -0,0 +1,84 @@
+import pytest
+
+from app.commons.signals import infractions_changed
+from app.domain.infractions.adapters.person_adapter import PersonAdapter
+from app.domain.infractions.models import Infraction
+from app.domain.infractions.services.infraction_service import (
+    delete_infraction,
+    generate_batch_report,
+    generate_report,
+)
+from app.domain.infractions.services.report_cache import report_cache
+from tests.conftest import count_queries
+
+
+@pytest.mark.parametrize("count", [1, 30])
+def test_batch_report_uses_a_constant_number_of_queries(db, owners, count):
+    owners(count)
+    emails = [f"Owner{i}@example.com" for i in range(count)]
+
+    with count_queries(db) as statements:
+        reports = list(generate_batch_report(emails, PersonAdapter()))
+
+    # Persons, their vehicles and their infractions.
+    assert len(statements) == 3
+    assert [report["email"] for report in reports] == emails
+    assert [i["comments"] for i in reports[-1]["infractions"]] == [
+        f"Owner {count - 1} car 0",
+        f"Owner {count - 1} car 1",
+    ]
+
+
+def test_batch_report_reports_unknown_emails_and_skips_duplicates(db, owners):
+    owners(1)
+    reports = list(
+        generate_batch_report(
+            ["owner0@example.com", "ghost@example.com", "owner0@example.com"],
+            PersonAdapter(),
+        )
+    )
+
+    assert len(reports) == 2
+    assert reports[0]["person"] == {"name": "Owner 0", "email": "owner0@example.com"}
+    assert reports[1] == {
+        "email": "ghost@example.com",
+        "error": "No person found with this email.",
+    }
+
+
+def test_report_is_cached_until_one_of_its_plates_changes(app, db, owners):
+    owners(2)
+    report_cache.clear()
+    infraction_id = Infraction.query.filter_by(license_plate="P0-1").one().id
+
+    with app.app_context():
+        first = generate_report("owner0@example.com", PersonAdapter())
+        generate_report("owner1@example.com", PersonAdapter())
+        with count_queries(db) as statements:
+            assert generate_report("owner0@example.com", PersonAdapter()) == first
+        assert not [s for s in statements if "FROM infractions" in s]
+
+        delete_infraction(infraction_id)
+        with count_queries(db) as statements:
+            report = generate_report("owner0@example.com", PersonAdapter())
+            generate_report("owner1@example.com", PersonAdapter())
+        # Only the report including the changed plate was dropped.
+        assert len([s for s in statements if "FROM infractions" in s]) == 1
+
+    assert [i["license_plate"] for i in first["infractions"]] == ["P0-0", "P0-1"]
+    assert [i["license_plate"] for i in report["infractions"]] == ["P0-0"]
+
+
+def test_a_failing_receiver_does_not_fail_a_committed_change(db, owners):
+    owners(1)
+    infraction_id = Infraction.query.filter_by(license_plate="P0-0").one().id
+
+    def broken(sender, plates):
+        raise RuntimeError("cache is down")
+
+    infractions_changed.connect(broken)
+    try:
+        assert delete_infraction(infraction_id) is True
+    finally:
+        infractions_changed.disconnect(broken)
+    assert db.session.get(Infraction, infraction_id) is None
@@ -0,0 +1,93 @@
+import datetime
+import json
+
+from app.domain.infractions.adapters.outbox_sink import FileSink
+from app.domain.infractions.models import Infraction, OutboxEvent
+from app.domain.infractions.services.infraction_service import (
+    InfractionBulkDeleteDTO,
+    bulk_delete_infractions,
+    delete_infraction,
+)
+from app.domain.infractions.services.outbox_service import drain_outbox
+from app.domain.vehicles.models import Vehicle
+from app.domain.vehicles.services.vehicle_service import (
+    VehicleBulkDeleteDTO,
+    VehiclePatchDTO,
+    VehicleUpdateDTO,
+    bulk_delete_vehicles,
+    delete_vehicle,
+    patch_vehicle,
+    update_vehicle,
+)
+from app.infrastructure.soft_delete import purge_soft_deleted
+from tests.conftest import count_queries
+
+
+def test_drain_reads_the_outbox_in_batches_and_tracks_its_position(
+    app, db, owners, monkeypatch, tmp_path
+):
+    owners(2)
+    ids = [infraction.id for infraction in Infraction.query.order_by(Infraction.id)]
+    for infraction_id in ids[:3]:
+        delete_infraction(infraction_id)
+    path = tmp_path / "events.ndjson"
+
+    with app.app_context():
+        monkeypatch.setitem(app.config, "OUTBOX_SETTLE_SECONDS", 0)
+        sink = FileSink(str(path))
+        with count_queries(db) as statements:
+            assert drain_outbox(sink, batch_size=2) == 3
+        assert drain_outbox(sink, batch_size=2) == 0
+        sink.close()
+
+    reads = [s for s in statements if s.startswith("SELECT outbox_events")]
+    assert len(reads) == 2
+    events = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [event["type"] for event in events] == [OutboxEvent.DELETED] * 3
+    assert [event["infraction"]["id"] for event in events] == ids[:3]
+
+
+def recorded(db, event_type):
+    return [
+        (event.infraction_id, json.loads(event.payload)["license_plate"])
+        for event in OutboxEvent.query.filter_by(event_type=event_type).order_by(
+            OutboxEvent.id
+        )
+    ]
+
+
+def test_deletes_and_renames_cascaded_to_infractions_are_recorded(app, db, owners):
+    owners(3)
+    with app.app_context():
+        ids = {i.license_plate: i.id for i in Infraction.query}
+
+        bulk_delete_infractions(InfractionBulkDeleteDTO(ids=[ids["P0-0"]]))
+        bulk_delete_vehicles(VehicleBulkDeleteDTO(license_plates=["P0-1"], soft=False))
+        delete_vehicle(Vehicle.query.filter_by(license_plate="P1-0").one().id)
+        patch_vehicle(
+            Vehicle.query.filter_by(license_plate="P1-1").one().id,
+            VehiclePatchDTO(license_plate="NEW-1"),
+        )
+        update_vehicle(
+            Vehicle.query.filter_by(license_plate="P2-0").one().id,
+            VehicleUpdateDTO(license_plate="NEW-2"),
+        )
+
+        assert recorded(db, OutboxEvent.DELETED) == [
+            (ids["P0-0"], "P0-0"),
+            (ids["P0-1"], "P0-1"),
+            (ids["P1-0"], "P1-0"),
+        ]
+        assert recorded(db, OutboxEvent.UPDATED) == [
+            (ids["P1-1"], "NEW-1"),
+            (ids["P2-0"], "NEW-2"),
+        ]
+
+
+def test_purging_soft_deleted_infractions_records_them_once(app, db, owners):
+    owners(1)
+    with app.app_context():
+        bulk_delete_vehicles(VehicleBulkDeleteDTO(license_plates=["P0-0"], soft=True))
+        purge_soft_deleted(datetime.timedelta(seconds=-1))
+
+        assert [plate for _, plate in recorded(db, OutboxEvent.DELETED)] == ["P0-0"]
@@ -0,0 +1,19 @@
+from app.domain.infractions.services.report_cache import ReportCache
+
+
+def test_stale_computations_are_not_stored_and_evictions_are_forgotten():
+    cache = ReportCache(maxsize=1)
+    key = cache.key("Ana@example.com", ["AAA", "BBB"])
+
+    generation = cache.generation
+    cache.invalidate(["ZZZ"])
+    cache.set(key, [{"license_plate": "AAA"}], generation)
+    assert cache.get(key, max_age=60) is None
+
+    cache.set(key, [{"license_plate": "AAA"}], cache.generation)
+    assert cache.get(key, max_age=60) == ({"license_plate": "AAA"},)
+    assert cache.get(key, max_age=-1) is None
+
+    cache.set(cache.key("luis@example.com", ["CCC"]), [], cache.generation)
+    assert cache.get(key, max_age=60) is None
+    assert set(cache._keys_by_plate) == {"CCC"}
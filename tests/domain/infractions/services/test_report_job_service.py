@@ -0,0 +1,125 @@
+import datetime
+import json
+
+import pytest
+from flask import current_app
+
+from app.domain.infractions.adapters.person_adapter import (
+    BasePersonAdapter,
+    PersonDTO,
+    VehicleDTO,
+)
+from app.domain.infractions.models import Infraction, ReportJob
+from app.domain.infractions.services.report_job_service import (
+    ReportJobNotFoundError,
+    ReportJobNotReadyError,
+    enqueue_report,
+    get_report_job,
+    get_report_result,
+)
+from app.domain.vehicles.models import Vehicle
+from app.extensions import db as _db
+from app.infrastructure.jobs import JobRunner
+
+
+class FakePersonAdapter(BasePersonAdapter):
+    def get_person_by_email(self, email):
+        if email != "ana@example.com":
+            return None
+        return PersonDTO(
+            name="Ana",
+            email=email,
+            vehicles=[
+                VehicleDTO(
+                    license_plate="ABC123", make="Toyota", model="Corolla", color="Blue"
+                )
+            ],
+        )
+
+
+class BrokenPersonAdapter(BasePersonAdapter):
+    """Fails a flush, leaving the session to be rolled back."""
+
+    def get_person_by_email(self, email):
+        _db.session.add_all(ReportJob(id="dup", email=email) for _ in range(2))
+        _db.session.flush()
+
+
+@pytest.fixture
+def runner(app, db):
+    app.config["JOB_RUN_INLINE"] = True
+    job_runner = JobRunner(app)
+    with app.app_context():
+        yield job_runner
+
+
+@pytest.fixture
+def real_runner(file_db):
+    """A runner for failing jobs, whose rollback ``runner`` cannot survive."""
+    app = current_app._get_current_object()
+    app.config["JOB_RUN_INLINE"] = True
+    return JobRunner(app)
+
+
+@pytest.fixture
+def infraction(db):
+    db.session.add(
+        Vehicle(license_plate="ABC123", make="Toyota", model="Corolla", color="Blue")
+    )
+    db.session.add(Infraction(license_plate="ABC123", comments="Speeding"))
+    db.session.commit()
+
+
+def test_report_job_runs_in_background_and_stores_result(runner, infraction):
+    job = enqueue_report("ana@example.com", "officer-1", FakePersonAdapter(), runner)
+    assert job.status == ReportJob.QUEUED
+
+    assert get_report_job(job.id, "officer-1").status == ReportJob.DONE
+    report = json.loads(get_report_result(job.id, "officer-1"))
+    assert report["person"]["email"] == "ana@example.com"
+    assert [i["comments"] for i in report["infractions"]] == ["Speeding"]
+
+
+def test_failed_report_job_keeps_the_error(real_runner):
+    job = enqueue_report(
+        "nobody@example.com", "officer-1", FakePersonAdapter(), real_runner
+    )
+
+    stored = get_report_job(job.id, "officer-1")
+    assert stored.status == ReportJob.FAILED
+    assert stored.error == "No person found with this email."
+    with pytest.raises(ReportJobNotReadyError):
+        get_report_result(job.id, "officer-1")
+
+
+def test_report_jobs_are_private_to_their_requester(runner, infraction):
+    job = enqueue_report("ana@example.com", "officer-1", FakePersonAdapter(), runner)
+    with pytest.raises(ReportJobNotFoundError):
+        get_report_job(job.id, "officer-2")
+    with pytest.raises(ReportJobNotFoundError):
+        get_report_job("missing", "officer-1")
+
+
+def test_stale_report_jobs_time_out(runner, db):
+    job = ReportJob(
+        email="ana@example.com",
+        requested_by="officer-1",
+        created_at=datetime.datetime.utcnow() - datetime.timedelta(days=1),
+    )
+    db.session.add(job)
+    db.session.commit()
+
+    stored = get_report_job(job.id, "officer-1")
+    assert stored.status == ReportJob.FAILED
+    assert stored.error == "Report job timed out."
+
+
+def test_report_job_fails_cleanly_when_the_database_errors(real_runner):
+    job = enqueue_report(
+        "ana@example.com", "officer-1", BrokenPersonAdapter(), real_runner
+    )
+
+    stored = get_report_job(job.id, "officer-1")
+    assert stored.status == ReportJob.FAILED
+    assert stored.error == "Failed to generate report due to an internal error."
+    assert stored.finished_at is not None
@@ -0,0 +1,130 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.domain.infractions.adapters.batching import BatchingVehicleAdapter
+from app.domain.infractions.adapters.vehicle_adapter import VehicleAdapter
+from app.domain.infractions.models import Infraction
+from app.domain.infractions.services.search_service import (
+    InvalidSearchQueryError,
+    search_infractions,
+    search_infractions_by_plate,
+)
+from app.domain.users.models import Officer
+from app.domain.vehicles.models import Vehicle
+from tests.conftest import count_queries
+
+
+@pytest.fixture
+def add_infraction(db):
+    vehicle = Vehicle(
+        license_plate="ABC123", make="Toyota", model="Corolla", color="Blue"
+    )
+    officer = Officer(name="Officer Jane", unique_identifier="XYZ789")
+    db.session.add_all([vehicle, officer])
+    db.session.commit()
+
+    def _add(comments):
+        infraction = Infraction(
+            license_plate=vehicle.license_plate,
+            timestamp=datetime.now(timezone.utc),
+            comments=comments,
+            officer_id=officer.id,
+        )
+        db.session.add(infraction)
+        db.session.commit()
+        return infraction
+
+    return _add
+
+
+def test_search_ranks_matches_and_requires_every_word(db, add_infraction):
+    add_infraction("Speeding")
+    close = add_infraction("Speeding in a school zone near the school")
+    far = add_infraction("Parked in a loading zone outside the school")
+    add_infraction("Vehicle towed")
+
+    page = search_infractions("School ZONE")
+
+    assert [hit.id for hit in page.results] == [close.id, far.id]
+    assert page.results[0].rank >= page.results[1].rank
+    assert isinstance(page.results[0].timestamp, datetime)
+    assert page.has_more is False
+
+
+def test_search_index_follows_updates_and_deletes(db, add_infraction):
+    infraction = add_infraction("Vehicle towed")
+    assert [hit.id for hit in search_infractions("tow").results] == []
+    assert [hit.id for hit in search_infractions("towed").results] == [infraction.id]
+
+    infraction.comments = "Expired registration"
+    db.session.commit()
+    assert search_infractions("towed").results == []
+    assert [hit.id for hit in search_infractions("expired").results] == [infraction.id]
+
+    db.session.delete(infraction)
+    db.session.commit()
+    assert search_infractions("expired").results == []
+
+
+def test_search_paginates(db, add_infraction):
+    ids = [add_infraction(f"Red light number {i}").id for i in range(5)]
+
+    first = search_infractions("red light", page=1, per_page=2)
+    last = search_infractions("red light", page=3, per_page=2)
+
+    assert first.has_more is True
+    assert last.has_more is False
+    seen = [hit.id for hit in first.results + last.results]
+    assert len(seen) == 3 and set(seen) <= set(ids)
+
+
+def test_search_ignores_query_syntax(db, add_infraction):
+    infraction = add_infraction("No seat belt")
+    page = search_infractions('seat* OR "belt')
+    assert page.results == []
+    assert [hit.id for hit in search_infractions('"seat" AND belt').results] == []
+    assert [hit.id for hit in search_infractions("seat, belt!").results] == [
+        infraction.id
+    ]
+
+
+def test_search_rejects_queries_without_words(db):
+    with pytest.raises(InvalidSearchQueryError):
+        search_infractions(" *:- ")
+
+
+def test_search_resolves_the_vehicles_of_a_page_in_one_query(app, db, add_infraction):
+    add_infraction("Double parked")
+    for plate, make in (("DEF456", "Fiat"), ("GHI789", "Ford")):
+        db.session.add(Vehicle(license_plate=plate, make=make, model="Uno"))
+        db.session.add(Infraction(license_plate=plate, comments="Double parked"))
+    db.session.commit()
+
+    with app.app_context(), count_queries(db) as statements:
+        page = search_infractions(
+            "parked", vehicle_adapter=BatchingVehicleAdapter(VehicleAdapter())
+        )
+
+    assert sorted((hit.license_plate, hit.make) for hit in page.results) == [
+        ("ABC123", "Toyota"),
+        ("DEF456", "Fiat"),
+        ("GHI789", "Ford"),
+    ]
+    assert len([s for s in statements if "FROM vehicles" in s]) == 1
+
+
+def test_plate_search_counts_infractions_of_each_match(db, add_infraction):
+    add_infraction("Speeding")
+    add_infraction("Red light")
+    db.session.add(Vehicle(license_plate="ABC124", make="Fiat", model="Uno"))
+    db.session.commit()
+
+    matches = search_infractions_by_plate("abc-l23", VehicleAdapter())
+
+    assert [(m.license_plate, m.distance, m.infractions) for m in matches] == [
+        ("ABC123", 1, 2),
+        ("ABC124", 2, 0),
+    ]
+    with pytest.raises(InvalidSearchQueryError):
+        search_infractions_by_plate("AB", VehicleAdapter(), mode="regex")
@@ -1,5 +1,6 @@
 # tests/domain/users/test_users.py
 import pytest
+from sqlalchemy.exc import IntegrityError
 
 from app.domain.users.models import Officer, Person
 from app.domain.vehicles.models import Vehicle
@@ -35,3 +36,13 @@ def test_person_representation(db):
     db.session.add(person)
     db.session.commit()
     assert str(person) == "<Person John Doe>"
+
+
+def test_person_email_is_unique_ignoring_case(db):
+    """Two persons cannot share an email that differs only in case."""
+    db.session.add(Person(name="John Doe", email="john.doe@example.com"))
+    db.session.commit()
+
+    db.session.add(Person(name="Johnny", email="John.Doe@Example.com"))
+    with pytest.raises(IntegrityError):
+        db.session.commit()
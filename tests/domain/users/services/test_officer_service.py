@@ -0,0 +1,20 @@
+from flask_jwt_extended import JWTManager, decode_token
+
+from app.domain.users.models import Officer
+from app.domain.users.services.officer_service import authenticate_officer
+
+
+def test_authenticate_officer_signs_id_and_name_into_the_token(app, db):
+    app.config["JWT_SECRET_KEY"] = "test-secret"
+    JWTManager(app)
+    officer = Officer(name="Rita", unique_identifier="OF-1")
+    officer.set_password("secret")
+    db.session.add(officer)
+    db.session.commit()
+
+    with app.app_context():
+        claims = decode_token(authenticate_officer("OF-1", "secret").access_token)
+
+    assert claims["sub"] == "OF-1"
+    assert claims["officer_id"] == officer.id
+    assert claims["name"] == "Rita"
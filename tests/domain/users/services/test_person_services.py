@@ -0,0 +1,61 @@
+import pytest
+
+from app.domain.infractions.models import Infraction
+from app.domain.users.models import Person
+from app.domain.users.services.person_services import (
+    PersonAlreadyExistsError,
+    PersonDTO,
+    create_person,
+    delete_person,
+    get_person_by_email,
+)
+from app.domain.vehicles.models import Vehicle
+from tests.conftest import count_queries
+
+
+def test_create_person_stores_normalized_email(db):
+    person = create_person(PersonDTO(name="Ana", email="Ana.Perez@Example.com"))
+    assert person.email == "ana.perez@example.com"
+
+
+def test_create_person_rejects_case_variant_duplicates(db):
+    create_person(PersonDTO(name="Ana", email="ana@example.com"))
+    with pytest.raises(PersonAlreadyExistsError):
+        create_person(PersonDTO(name="Ana", email="ANA@example.com"))
+
+
+def test_get_person_by_email_ignores_case(db):
+    # Rows written before normalization may still have mixed case.
+    db.session.add(Person(name="Luis", email="Luis@Example.com"))
+    db.session.commit()
+
+    assert get_person_by_email(" luis@EXAMPLE.com").name == "Luis"
+
+
+def test_get_person_by_email_binds_each_email(db):
+    # The cached lambda statement must not freeze the first email it saw.
+    create_person(PersonDTO(name="Ana", email="ana@example.com"))
+    create_person(PersonDTO(name="Luis", email="luis@example.com"))
+
+    assert get_person_by_email("ana@example.com").name == "Ana"
+    assert get_person_by_email("luis@example.com").name == "Luis"
+    assert get_person_by_email("nobody@example.com") is None
+
+
+def test_delete_person_leaves_dependents_to_the_database(db):
+    owner = Person(name="Fleet", email="fleet@example.com")
+    for i in range(30):
+        vehicle = Vehicle(license_plate=f"FLT{i:03}", make="Ford", model="Transit")
+        vehicle.infractions.append(Infraction(comments=f"ticket {i}"))
+        owner.vehicles.append(vehicle)
+    db.session.add(owner)
+    db.session.commit()
+    owner_id = owner.id
+
+    with count_queries(db) as statements:
+        assert delete_person(owner_id)
+
+    assert [s for s in statements if "vehicles" in s or "infractions" in s] == []
+    assert len([s for s in statements if s.startswith("DELETE")]) == 1
+    assert Vehicle.query.filter(Vehicle.owner_id.is_(None)).count() == 30
+    assert Infraction.query.count() == 30
@@ -0,0 +1,46 @@
+import pytest
+from flask_jwt_extended import JWTManager, decode_token
+
+from app.domain.users.services.token_service import (
+    TokenRevokedError,
+    is_token_revoked,
+    issue_tokens,
+    revoked_token_cache,
+    rotate_refresh_token,
+)
+
+
+@pytest.fixture
+def jwt_app(app):
+    app.config["JWT_SECRET_KEY"] = "test-secret"
+    if "flask-jwt-extended" not in app.extensions:
+        JWTManager(app)
+    revoked_token_cache.clear()
+    with app.app_context():
+        yield app
+
+
+def test_refresh_tokens_rotate_once_and_keep_claims(jwt_app, db):
+    tokens = issue_tokens("OF-1", {"officer_id": 3, "name": "Rita"})
+    refresh = decode_token(tokens.refresh_token)
+    assert not is_token_revoked(refresh)
+
+    rotated = rotate_refresh_token(refresh)
+
+    access = decode_token(rotated.access_token)
+    assert access["sub"] == "OF-1"
+    assert (access["officer_id"], access["name"]) == (3, "Rita")
+    assert access["fresh"] is False
+    assert is_token_revoked(refresh)
+    assert not is_token_revoked(decode_token(rotated.refresh_token))
+    revoked_token_cache.clear()
+    assert is_token_revoked(refresh)
+    with pytest.raises(TokenRevokedError):
+        rotate_refresh_token(refresh)
+
+
+def test_access_tokens_skip_the_revocation_store(jwt_app, db):
+    access = decode_token(issue_tokens("OF-1", {}).access_token)
+    revoked_token_cache.set(access["jti"], True)
+
+    assert not is_token_revoked(access)
@@ -0,0 +1,16 @@
+# tests/domain/vehicles/conftest.py
+import pytest
+
+from app.domain.users.models import Person
+
+
+@pytest.fixture
+def owners(db):
+    """Persons the vehicles belong to; SQLite enforces the owner foreign key."""
+    persons = [
+        Person(name="Owner One", email="one@example.com"),
+        Person(name="Owner Two", email="two@example.com"),
+    ]
+    db.session.add_all(persons)
+    db.session.commit()
+    return [person.id for person in persons]
@@ -0,0 +1,69 @@
+# tests/domain/vehicles/services/test_plate_search_service.py
+import pytest
+
+from app.domain.vehicles.models import Vehicle, VehiclePlateTrigram
+from app.domain.vehicles.services.plate_search_service import (
+    InvalidPlateQueryError,
+    edit_distance,
+    search_plates,
+)
+from app.domain.vehicles.services.vehicle_service import VehiclePatchDTO, patch_vehicle
+
+PLATES = ["AB-123-CD", "AB124CD", "AB 9", "ZZ999", "XY123CD"]
+
+
+@pytest.fixture
+def vehicles(db, owners):
+    rows = [
+        Vehicle(license_plate=plate, make="Fiat", model="Uno", owner_id=owners[0])
+        for plate in PLATES
+    ]
+    db.session.add_all(rows)
+    db.session.commit()
+    return rows
+
+
+def test_edit_distance_stops_past_the_bound():
+    assert edit_distance("AB123CD", "AB123CD", 2) == 0
+    assert edit_distance("AB123CD", "A8123CD", 2) == 1
+    assert edit_distance("AB123CD", "AB12CD", 2) == 1
+    assert edit_distance("AB123CD", "ZZ999", 2) == 3
+
+
+def test_prefix_search_ignores_case_and_punctuation(vehicles):
+    matches = search_plates("ab 12", mode="prefix")
+    assert [m.license_plate for m in matches] == ["AB-123-CD", "AB124CD"]
+    assert [m.distance for m in matches] == [3, 3]
+    assert [m.license_plate for m in search_plates("ZZ", mode="prefix")] == ["ZZ999"]
+
+
+def test_fuzzy_search_ranks_misreads_by_distance(vehicles):
+    matches = search_plates("A8123CD")
+    assert [(m.license_plate, m.distance) for m in matches] == [
+        ("AB-123-CD", 1),
+        # Ties go to the plate sharing more trigrams with the query.
+        ("XY123CD", 2),
+        ("AB124CD", 2),
+    ]
+    assert search_plates("A8123CD", max_distance=1)[0].license_plate == "AB-123-CD"
+    assert search_plates("QQQQQQ") == []
+
+
+def test_patched_plate_is_reindexed(db, vehicles):
+    patch_vehicle(vehicles[3].id, VehiclePatchDTO(license_plate="QR-777"))
+
+    assert [m.license_plate for m in search_plates("QR777")] == ["QR-777"]
+    assert search_plates("ZZ999", max_distance=0) == []
+    trigrams = db.session.query(VehiclePlateTrigram.trigram).filter_by(
+        vehicle_id=vehicles[3].id
+    )
+    assert {row.trigram for row in trigrams} == {"^QR", "QR7", "R77", "777", "77$"}
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"query": "--"}, {"query": "AB", "mode": "regex"}, {"query": "AB", "limit": 0}],
+)
+def test_invalid_queries_are_rejected(db, kwargs):
+    with pytest.raises(InvalidPlateQueryError):
+        search_plates(**kwargs)
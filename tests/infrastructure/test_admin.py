@@ -0,0 +1,55 @@
+import pytest
+
+from app.domain.vehicles.models import Vehicle
+from app.infrastructure.admin import ScalableModelView
+
+
+@pytest.fixture
+def vehicles(db):
+    for i in range(7):
+        db.session.add(
+            Vehicle(license_plate=f"KEY{i}", make="Fiat", model="Uno", color="Red")
+        )
+    db.session.commit()
+    return Vehicle.query.order_by(Vehicle.id.desc()).all()
+
+
+@pytest.fixture
+def view(db):
+    class VehicleView(ScalableModelView):
+        page_size = 3
+
+    return VehicleView(Vehicle, db.session)
+
+
+def test_keyset_pages_walk_newest_first(app, view, vehicles):
+    ids = [v.id for v in vehicles]
+    with app.test_request_context("/"):
+        count, first_page = view.get_list(0, None, None, None, None)
+    with app.test_request_context(f"/?after={first_page[-1].id}"):
+        _, second_page = view.get_list(0, None, None, None, None)
+    with app.test_request_context(f"/?before={second_page[0].id}"):
+        _, back_page = view.get_list(0, None, None, None, None)
+
+    assert count == 7
+    assert [v.id for v in first_page] == ids[:3]
+    assert [v.id for v in second_page] == ids[3:6]
+    assert [v.id for v in back_page] == ids[:3]
+
+
+def test_page_size_is_capped(app, view, vehicles):
+    view.max_page_size = 5
+    with app.test_request_context("/?page_size=1000"):
+        view_args = view._get_list_extra_args()
+        _, rows = view.get_list(0, None, None, None, None, page_size=1000)
+
+    assert view_args.page_size == 5
+    assert len(rows) == 5
+
+
+def test_keyset_pages_can_be_returned_unexecuted(app, view, vehicles):
+    ids = [v.id for v in vehicles]
+    with app.test_request_context(f"/?before={ids[4]}"):
+        _, query = view.get_list(0, None, None, None, None, execute=False)
+
+    assert [v.id for v in query] == ids[1:4]
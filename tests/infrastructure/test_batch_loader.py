@@ -0,0 +1,34 @@
+from app.infrastructure.batch_loader import RequestBatchLoader
+
+
+def make_loader(calls):
+    def batch_fn(keys):
+        calls.append(list(keys))
+        return {key: key.upper() for key in keys if key != "missing"}
+
+    return RequestBatchLoader("test_letters", batch_fn)
+
+
+def test_deferred_keys_are_fetched_in_one_batch_and_memoized(app):
+    calls = []
+    loader = make_loader(calls)
+    with app.app_context():
+        pending = [loader.defer(key) for key in ("a", "b", "a", "missing")]
+        assert [item.get() for item in pending] == ["A", "B", "A", None]
+        assert loader.load_many(["b", "missing"]) == {"b": "B", "missing": None}
+        assert calls == [["a", "b", "missing"]]
+
+        loader.clear("a")
+        assert loader.load("a") == "A"
+        assert calls[-1] == ["a"]
+
+
+def test_loader_state_is_scoped_to_the_app_context(app):
+    calls = []
+    loader = make_loader(calls)
+    with app.app_context():
+        loader.prime("c", "primed")
+        assert loader.load("c") == "primed"
+    with app.app_context():
+        assert loader.load("c") == "C"
+    assert calls == [["c"]]
@@ -0,0 +1,27 @@
+from app.extensions import metrics
+from app.infrastructure.cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache("test_lru", maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    cache.discard("a")
+    assert cache.get("a", "missing") == "missing"
+    assert len(cache) == 1
+
+
+def test_lru_cache_reports_hits_and_misses():
+    cache = LRUCache("test_lru_metrics")
+    cache.set("key", "value")
+    cache.get("key")
+    cache.get("other")
+
+    counts = metrics.cache_requests.collect()
+    assert counts[("test_lru_metrics", "hit")] == 1
+    assert counts[("test_lru_metrics", "miss")] == 1
@@ -0,0 +1,52 @@
+import pytest
+from flask import Flask
+
+from app.domain.vehicles.models import Vehicle
+from app.domain.vehicles.services.vehicle_service import get_vehicle
+from app.extensions import db as _db
+from app.infrastructure.database import primary_scope, replica_scope
+
+
+@pytest.fixture
+def replica_app(tmp_path):
+    """App with a primary and a replica backed by two SQLite files."""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'primary.db'}"
+    app.config["SQLALCHEMY_BINDS"] = {"replica": f"sqlite:///{tmp_path / 'replica.db'}"}
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    _db.init_app(app)
+    previous_session = _db.session
+    with app.app_context():
+        _db.create_all()
+        _db.Model.metadata.create_all(_db.get_engine(app, bind="replica"))
+        _db.session = _db.create_scoped_session()
+        # Same id, different data, so the test can tell which database answered.
+        for bind, color in ((None, "Primary"), ("replica", "Replica")):
+            with _db.get_engine(app, bind=bind).begin() as connection:
+                connection.execute(
+                    Vehicle.__table__.insert(),
+                    dict(
+                        id=1, license_plate="RPL1", make="Ford", model="Ka", color=color
+                    ),
+                )
+        yield app
+        _db.session.remove()
+    _db.session = previous_session
+
+
+def test_read_only_services_use_the_replica(replica_app):
+    assert get_vehicle(1).color == "Replica"
+    _db.session.remove()
+    with primary_scope():
+        assert get_vehicle(1).color == "Primary"
+
+
+def test_reads_after_a_write_stay_on_the_primary(replica_app):
+    _db.session.add(
+        Vehicle(license_plate="NEW1", make="Fiat", model="Uno", color="Red")
+    )
+    _db.session.flush()
+
+    with replica_scope():
+        assert Vehicle.query.filter_by(license_plate="NEW1").count() == 1
+    assert get_vehicle(1).color == "Primary"
@@ -0,0 +1,48 @@
+import logging
+
+from flask import Flask
+
+from app.infrastructure.log_policy import LogPolicy, lazy, log_event
+from app.infrastructure.logger import app_logger
+
+
+def record(level=logging.INFO, **extra):
+    record = logging.LogRecord("app_logger", level, __file__, 1, "msg", (), None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_dropped_events_never_compute_their_lazy_fields():
+    computed = []
+    policy = LogPolicy()
+    policy.sample_rates = {"hot.path": 0.0}
+    app_logger.addFilter(policy)
+    try:
+        log_event("hot.path", payload=lazy(computed.append, "formatted"))
+        log_event("hot.path", level=logging.WARNING, payload=lazy(len, "kept"))
+    finally:
+        app_logger.removeFilter(policy)
+
+    assert computed == []
+    assert not policy.filter(record(event="hot.path"))
+    assert policy.filter(record(logging.WARNING, event="hot.path"))
+
+
+def test_requests_stop_logging_info_past_their_budget():
+    app = Flask(__name__)
+    app.config["LOG_ROUTE_BUDGETS"] = {"noisy": 2}
+    policy = LogPolicy()
+    policy.init_app(app)
+    app_logger.removeFilter(policy)
+    kept = []
+
+    @app.route("/noisy")
+    def noisy():
+        kept.extend(policy.filter(record()) for _ in range(5))
+        kept.append(policy.filter(record(logging.ERROR)))
+        return ""
+
+    app.test_client().get("/noisy")
+    app.test_client().get("/noisy")
+
+    assert kept == [True, True, False, False, False, True] * 2
@@ -0,0 +1,92 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from flask import Flask
+
+from app.infrastructure.metrics import Counter, Histogram, Metrics
+
+
+def test_counter_sums_values_written_by_several_threads():
+    counter = Counter("jobs_total", "Jobs.", ("kind",))
+
+    def work():
+        for _ in range(1000):
+            counter.inc(("a",))
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.collect() == {("a",): 4000.0}
+
+
+def test_histogram_places_observations_in_buckets():
+    histogram = Histogram("latency", "Latency.", buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5.0)
+
+    assert histogram.collect() == {(): [1.0, 1.0, 1.0, 5.55]}
+
+
+def test_metrics_endpoint_renders_route_histograms_and_merges_workers(tmp_path):
+    app = Flask(__name__)
+    app.config["METRICS_MULTIPROC_DIR"] = str(tmp_path)
+    app.config["METRICS_FLUSH_INTERVAL"] = 0
+    metrics = Metrics(app)
+
+    @app.route("/ping")
+    def ping():
+        return "pong"
+
+    client = app.test_client()
+    client.get("/ping")
+    # Another worker's snapshot left in the shared directory.
+    (tmp_path / "metrics-1.json").write_text(
+        '{"counters": {"http_requests_total": [[["ping", "GET", "200"], 2]]},'
+        ' "histograms": {}}'
+    )
+
+    text = metrics.render()
+
+    assert 'http_requests_total{endpoint="ping",method="GET",status="200"} 3' in text
+    assert 'http_request_duration_seconds_count{endpoint="ping",method="GET"} 1' in text
+    assert "# TYPE log_queue_depth gauge" in text
+
+
+def test_snapshots_of_running_workers_are_merged_and_others_dropped(tmp_path):
+    app = Flask(__name__)
+    app.config["METRICS_MULTIPROC_DIR"] = str(tmp_path)
+    app.config["METRICS_SNAPSHOT_MAX_AGE"] = 60
+    metrics = Metrics(app)
+    running = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+
+    def write(pid, count):
+        path = tmp_path / f"metrics-{pid}.json"
+        path.write_text(
+            '{"counters": {"http_requests_total": [[["ping", "GET", "200"], %d]]},'
+            ' "histograms": {}}' % count
+        )
+        return path
+
+    try:
+        live = [write(os.getppid(), 2), write(running.pid, 4)]
+        silent = write(1, 8)
+        os.utime(silent, (time.time() - 120,) * 2)
+        dead = write(exited.pid, 16)
+
+        text = metrics.render()
+    finally:
+        running.kill()
+        running.wait()
+
+    assert 'http_requests_total{endpoint="ping",method="GET",status="200"} 6' in text
+    assert all(path.exists() for path in live)
+    assert not silent.exists() and not dead.exists()
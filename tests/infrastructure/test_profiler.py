@@ -0,0 +1,44 @@
+import os
+import pstats
+
+from flask import Flask
+
+from app.infrastructure.profiler import RequestProfiler
+
+
+def make_app(tmp_path, **config):
+    app = Flask(__name__)
+    app.config["PROFILER_OUTPUT_DIR"] = str(tmp_path)
+    app.config.update(config)
+    RequestProfiler(app)
+
+    @app.route("/slow")
+    def slow():
+        return str(sum(range(1000)))
+
+    return app
+
+
+def test_header_with_token_profiles_a_single_request(tmp_path):
+    app = make_app(tmp_path, PROFILER_TOKEN="secret")
+    client = app.test_client()
+
+    assert "X-Profile-File" not in client.get("/slow").headers
+    assert (
+        "X-Profile-File"
+        not in client.get("/slow", headers={"X-Profile": "wrong"}).headers
+    )
+
+    response = client.get("/slow", headers={"X-Profile": "secret"})
+    path = os.path.join(tmp_path, response.headers["X-Profile-File"])
+    assert path.startswith(os.path.join(str(tmp_path), "slow"))
+    assert pstats.Stats(path).total_calls > 0
+
+
+def test_sample_rate_profiles_every_request_when_set_to_one(tmp_path):
+    app = make_app(tmp_path, PROFILER_SAMPLE_RATE=1.0)
+    client = app.test_client()
+    client.get("/slow")
+    client.get("/slow")
+
+    assert len(os.listdir(os.path.join(tmp_path, "slow"))) == 2
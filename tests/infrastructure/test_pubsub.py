@@ -0,0 +1,56 @@
+import pytest
+
+from app.infrastructure.pubsub import (
+    Broker,
+    BrokerFullError,
+    PollingRelay,
+    SubscriptionDropped,
+)
+
+
+def test_slow_subscriber_is_dropped_without_holding_back_others():
+    broker = Broker("test")
+    slow = broker.subscribe(maxsize=1)
+    fast = broker.subscribe(lambda event: event % 2 == 0, maxsize=10)
+
+    for event in range(4):
+        broker.publish(event, event_id=event)
+    broker.publish(2, event_id=2)
+
+    with pytest.raises(SubscriptionDropped):
+        slow.get(timeout=0)
+    assert [fast.get(timeout=0), fast.get(timeout=0), fast.get(timeout=0)] == [
+        0,
+        2,
+        None,
+    ]
+    assert broker.subscriber_count == 1
+
+
+def test_subscriber_limit():
+    broker = Broker("test")
+    broker.subscribe(max_subscribers=1)
+    with pytest.raises(BrokerFullError):
+        broker.subscribe(max_subscribers=1)
+
+
+def test_relay_publishes_rows_once_and_rereads_the_lookback():
+    rows = {1: "a", 2: "b", 4: "d"}
+    broker = Broker("test")
+    subscription = broker.subscribe()
+    relay = PollingRelay(
+        broker,
+        head=lambda: max(rows),
+        fetch=lambda after, limit: [
+            (key, key, rows[key]) for key in sorted(rows) if key > after
+        ][:limit],
+        lookback=3,
+        batch_size=2,
+    )
+    broker.publish("d", event_id=4)
+
+    # Row 3 commits after row 4 was already seen.
+    rows[3] = "c"
+    assert relay.poll(4) == 4
+    assert [subscription.get(timeout=0) for _ in range(3)] == ["d", "b", "c"]
+    assert subscription.get(timeout=0) is None
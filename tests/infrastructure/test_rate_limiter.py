@@ -0,0 +1,93 @@
+import pytest
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token, jwt_required
+
+from app.infrastructure.rate_limiter import ConcurrencyLimiter, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_refills_over_time():
+    """A drained bucket reports the wait time and refills at its rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+    assert bucket.consume() == 0.0
+    assert bucket.consume() == 0.0
+    assert bucket.consume() == pytest.approx(0.5)
+    clock.now += 0.5
+    assert bucket.consume() == 0.0
+
+
+def test_concurrency_limiter_rejects_without_blocking():
+    limiter = ConcurrencyLimiter(1)
+    assert limiter.acquire()
+    assert not limiter.acquire()
+    limiter.release()
+    assert limiter.acquire()
+
+
+@pytest.fixture
+def limited_app():
+    app = Flask(__name__)
+    app.config["JWT_SECRET_KEY"] = "test"
+    app.config["RATE_LIMIT_BUDGETS"] = {"report": {"rate": 0.001, "burst": 1}}
+    JWTManager(app)
+    limiter = RateLimiter(app)
+
+    @app.route("/report")
+    @jwt_required()
+    @limiter.limit("report")
+    def report():
+        return {"ok": True}
+
+    return app
+
+
+def test_identity_over_budget_gets_429_with_retry_after(limited_app):
+    with limited_app.app_context():
+        alice = create_access_token(identity="alice")
+        bob = create_access_token(identity="bob")
+    client = limited_app.test_client()
+
+    assert (
+        client.get("/report", headers={"Authorization": f"Bearer {alice}"}).status_code
+        == 200
+    )
+    response = client.get("/report", headers={"Authorization": f"Bearer {alice}"})
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    # Budgets are per identity.
+    assert (
+        client.get("/report", headers={"Authorization": f"Bearer {bob}"}).status_code
+        == 200
+    )
+
+
+def test_shed_requests_get_503_without_spending_their_rate_budget(limited_app):
+    with limited_app.app_context():
+        token = create_access_token(identity="alice")
+    limiter = limited_app.extensions["rate_limiter"]
+    client = limited_app.test_client()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with limited_app.app_context():
+        busy = limiter._get_global_slot("report")
+    for _ in range(busy.limit):
+        assert busy.acquire()
+    try:
+        response = client.get("/report", headers=headers)
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+    finally:
+        for _ in range(busy.limit):
+            busy.release()
+
+    # The burst of one is still there for the retry.
+    assert client.get("/report", headers=headers).status_code == 200
+    assert busy.in_flight == 0
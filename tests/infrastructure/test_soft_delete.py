@@ -0,0 +1,146 @@
+import datetime
+
+import pytest
+from sqlalchemy import Column, ForeignKeyConstraint, Integer, UniqueConstraint
+from sqlalchemy.orm import declarative_base, relationship
+
+from app.domain.infractions.models import Infraction
+from app.domain.users.models import Person
+from app.domain.users.services.person_services import (
+    PersonBulkDeleteDTO,
+    PersonDTO,
+    bulk_delete_persons,
+    create_person,
+    get_person_by_email,
+    get_persons_by_emails,
+)
+from app.domain.vehicles.models import Vehicle
+from app.domain.vehicles.services.vehicle_service import (
+    VehicleBulkDeleteDTO,
+    VehicleDTO,
+    bulk_delete_vehicles,
+    create_vehicle,
+    get_vehicle_by_license_plate,
+)
+from app.infrastructure.soft_delete import (
+    INCLUDE_DELETED,
+    bulk_delete,
+    purge_soft_deleted,
+)
+
+
+def add_fleet(db, count):
+    owner = Person(name="Fleet", email="fleet@example.com")
+    for i in range(count):
+        vehicle = Vehicle(license_plate=f"FLT{i:03}", make="Ford", model="Transit")
+        vehicle.infractions.append(Infraction(comments=f"ticket {i}"))
+        owner.vehicles.append(vehicle)
+    db.session.add(owner)
+    db.session.commit()
+    return owner.id
+
+
+def test_soft_deleted_rows_are_hidden_from_orm_reads(db):
+    owner_id = add_fleet(db, 3)
+
+    deleted = bulk_delete_vehicles(
+        VehicleBulkDeleteDTO(license_plates=["FLT000", "FLT001"], soft=True)
+    )
+
+    assert deleted == 2
+    assert Vehicle.query.count() == 1
+    assert Infraction.query.count() == 1
+    assert db.session.query(Infraction.comments).all() == [("ticket 2",)]
+    assert get_vehicle_by_license_plate("FLT002") is not None
+    person = get_persons_by_emails(["fleet@example.com"])["fleet@example.com"]
+    assert [v.license_plate for v in person.vehicles] == ["FLT002"]
+    assert db.session.get(Person, owner_id) is not None
+    hidden = Vehicle.query.execution_options(**{INCLUDE_DELETED: True}).count()
+    assert hidden == 3
+
+
+def test_session_get_misses_rows_soft_deleted_in_the_same_session(db):
+    add_fleet(db, 2)
+    vehicle = Vehicle.query.filter_by(license_plate="FLT000").one()
+    vehicle_id, infraction_id = vehicle.id, vehicle.infractions[0].id
+
+    bulk_delete(Vehicle, Vehicle.id == vehicle_id, soft=True, commit=False)
+
+    assert db.session.get(Vehicle, vehicle_id) is None
+    assert db.session.get(Infraction, infraction_id) is None
+    db.session.commit()
+    assert db.session.get(Vehicle, vehicle_id) is None
+
+
+def test_relationships_joining_on_several_columns_are_refused():
+    Base = declarative_base()
+
+    class Parent(Base):
+        __tablename__ = "parents"
+        __table_args__ = (UniqueConstraint("id", "code"),)
+        id = Column(Integer, primary_key=True)
+        code = Column(Integer)
+        children = relationship("Child")
+
+    class Child(Base):
+        __tablename__ = "children"
+        __table_args__ = (
+            ForeignKeyConstraint(
+                ["parent_id", "parent_code"], ["parents.id", "parents.code"]
+            ),
+        )
+        id = Column(Integer, primary_key=True)
+        parent_id = Column(Integer)
+        parent_code = Column(Integer)
+
+    with pytest.raises(NotImplementedError, match="Parent.children"):
+        bulk_delete(Parent, soft=False)
+
+
+def test_hard_delete_runs_in_chunks_and_cascades(db):
+    owner_id = add_fleet(db, 5)
+
+    assert (
+        bulk_delete(Vehicle, Vehicle.owner_id == owner_id, soft=False, chunk_size=2)
+        == 5
+    )
+    assert Infraction.query.count() == 0
+
+    assert bulk_delete(Person, Person.id == owner_id, soft=False) == 1
+    assert Person.query.count() == 0
+
+
+def test_purge_removes_only_expired_soft_deletes(db):
+    add_fleet(db, 2)
+    long_ago = datetime.datetime.utcnow() - datetime.timedelta(days=60)
+    bulk_delete(Vehicle, Vehicle.license_plate == "FLT000", soft=True, now=long_ago)
+    bulk_delete(Vehicle, Vehicle.license_plate == "FLT001", soft=True)
+
+    assert purge_soft_deleted(datetime.timedelta(days=30)) == 1
+
+    remaining = Vehicle.query.execution_options(**{INCLUDE_DELETED: True}).all()
+    assert [v.license_plate for v in remaining] == ["FLT001"]
+
+
+def test_plates_and_emails_are_free_again_after_a_soft_delete(db):
+    owner_id = add_fleet(db, 1)
+    bulk_delete_vehicles(VehicleBulkDeleteDTO(license_plates=["FLT000"], soft=True))
+    bulk_delete_persons(PersonBulkDeleteDTO(ids=[owner_id], soft=True))
+
+    person = create_person(PersonDTO(name="New Fleet", email="Fleet@example.com"))
+    vehicle = create_vehicle(
+        VehicleDTO(
+            license_plate="FLT000",
+            make="Fiat",
+            model="Uno",
+            color="Red",
+            owner_id=person.id,
+        )
+    )
+
+    assert person.id != owner_id
+    assert get_person_by_email("fleet@example.com").name == "New Fleet"
+    assert get_vehicle_by_license_plate("FLT000").make == "Fiat"
+    assert vehicle.owner_id == person.id
+    # The restored vehicle does not bring its deleted infractions back.
+    assert Infraction.query.count() == 0
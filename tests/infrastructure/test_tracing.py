@@ -0,0 +1,47 @@
+from flask import Flask
+from sqlalchemy import text
+
+from app.extensions import db
+from app.infrastructure.tracing import Tracer, span, traced
+
+
+def make_app():
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["TRACING_ENABLED"] = True
+    db.init_app(app)
+    return app
+
+
+@traced
+def lookup():
+    with db.engine.connect() as connection:
+        return connection.execute(text("SELECT 1")).scalar()
+
+
+def test_requests_record_a_tree_of_spans_down_to_sql():
+    app = make_app()
+    tracer = Tracer(app)
+
+    @app.route("/traced")
+    def traced_view():
+        with span("serialize", format="text"):
+            return str(lookup())
+
+    with app.app_context():
+        tracer.instrument_engine(db.engine)
+        assert app.test_client().get("/traced").data == b"1"
+        lookup()  # Outside a request: not traced.
+
+    (trace,) = tracer.recent()
+    assert trace["name"] == "GET traced_view"
+    assert trace["attributes"]["status"] == 200
+    (serialize,) = trace["children"]
+    assert serialize["attributes"] == {"format": "text"}
+    (call,) = serialize["children"]
+    assert call["name"] == "lookup"
+    (sql,) = call["children"]
+    assert sql["name"] == "sql"
+    assert sql["attributes"]["statement"] == "SELECT 1"
+    assert trace["duration_ms"] >= call["duration_ms"] >= sql["duration_ms"]
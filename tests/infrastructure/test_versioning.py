@@ -0,0 +1,82 @@
+import pytest
+from sqlalchemy import update
+
+from app.domain.vehicles.models import Vehicle
+from app.domain.vehicles.services.vehicle_service import (
+    VehicleNotFoundError,
+    VehiclePatchDTO,
+    VehicleUpdateDTO,
+    patch_vehicle,
+    update_vehicle,
+)
+from app.infrastructure.soft_delete import bulk_delete
+from app.infrastructure.versioning import VersionConflictError, patch_row
+from tests.conftest import count_queries
+
+
+@pytest.fixture
+def vehicle_id(db):
+    vehicle = Vehicle(license_plate="PAT001", make="Fiat", model="Uno", color="Red")
+    db.session.add(vehicle)
+    db.session.commit()
+    return vehicle.id
+
+
+def test_patch_updates_only_supplied_fields_without_loading_the_row(db, vehicle_id):
+    with count_queries(db) as statements:
+        patched = patch_vehicle(vehicle_id, VehiclePatchDTO(color="Blue", version=1))
+
+    assert patched["color"] == "Blue"
+    assert patched["make"] == "Fiat"
+    assert patched["version"] == 2
+    assert statements[0].startswith("UPDATE vehicles SET")
+    assert "vehicles.version = ?" in statements[0]
+    # SQLite has no RETURNING here, so the row is read back once.
+    assert len(statements) == 2
+
+
+def test_patch_with_a_stale_version_conflicts(db, vehicle_id):
+    patch_vehicle(vehicle_id, VehiclePatchDTO(color="Blue"))
+
+    with pytest.raises(VersionConflictError) as conflict:
+        patch_vehicle(vehicle_id, VehiclePatchDTO(color="Green", version=1))
+
+    assert conflict.value.current_version == 2
+    assert "not 1" in conflict.value.message
+
+
+def test_patch_skips_missing_and_soft_deleted_rows(db, vehicle_id):
+    bulk_delete(Vehicle, Vehicle.id == vehicle_id, soft=True)
+
+    assert patch_row(Vehicle, vehicle_id, {"color": "Blue"}) is None
+    with pytest.raises(VehicleNotFoundError):
+        patch_vehicle(9999, VehiclePatchDTO(color="Blue"))
+
+
+def test_orm_updates_bump_the_version(db, vehicle_id):
+    vehicle = db.session.get(Vehicle, vehicle_id)
+    vehicle.color = "Black"
+    db.session.commit()
+
+    assert vehicle.version == 2
+
+
+def test_orm_updates_of_a_stale_row_conflict(file_db):
+    vehicle = Vehicle(license_plate="PAT002", make="Fiat", model="Uno", color="Red")
+    file_db.session.add(vehicle)
+    file_db.session.commit()
+    assert vehicle.version == 1
+    # Someone else updates the row after this session loaded it.
+    with file_db.engine.begin() as other:
+        other.execute(
+            update(Vehicle.__table__)
+            .where(Vehicle.id == vehicle.id)
+            .values(version=Vehicle.version + 1)
+        )
+
+    with pytest.raises(VersionConflictError) as conflict:
+        update_vehicle(vehicle.id, VehicleUpdateDTO(color="Blue"))
+
+    assert conflict.value.current_version == 2
+    assert "not 1" in conflict.value.message
+    assert file_db.session.get(Vehicle, vehicle.id).color == "Red"
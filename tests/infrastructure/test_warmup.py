@@ -0,0 +1,49 @@
+from flask import Flask
+
+from app.entrypoint.health_handler import health_blueprint
+from app.extensions import db, warmup
+from app.infrastructure.warmup import Warmup
+
+
+def make_app():
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    db.init_app(app)
+    return app
+
+
+def test_run_calls_every_task_and_survives_failures():
+    calls = []
+    runner = Warmup(make_app())
+
+    @runner.task
+    def broken():
+        raise RuntimeError("cold cache")
+
+    @runner.task
+    def compile_queries():
+        calls.append("compiled")
+
+    assert not runner.ready
+    timings = runner.run()
+    assert runner.ready
+    assert calls == ["compiled"]
+    assert set(timings) >= {"imports", "connections", "broken"}
+
+
+def test_readiness_waits_for_warmup_but_liveness_does_not(db):
+    app = make_app()
+    app.register_blueprint(health_blueprint)
+    client = app.test_client()
+
+    ready = warmup.ready
+    try:
+        warmup.ready = False
+        assert client.get("/health/live").status_code == 200
+        assert client.get("/health/ready").status_code == 503
+
+        warmup.ready = True
+        assert client.get("/health/ready").get_json() == {"status": "ready"}
+    finally:
+        warmup.ready = ready